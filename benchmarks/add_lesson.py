@@ -0,0 +1,61 @@
+"""
+Measures how fast lessons can be added to a single busy room.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.add_lesson
+```
+"""
+
+from datetime import time
+from time import perf_counter
+
+from lib.schedule import Day, Lesson, RoomSchedule
+
+SIZES = [1_000, 10_000, 20_000]
+DAYS = list(Day)
+
+
+def make_lessons(count: int) -> list[Lesson]:
+    # one second long lessons with a one second gap, spread over the week so none overlap
+    lessons = []
+    for index in range(count):
+        day = DAYS[index % len(DAYS)]
+        offset = (index // len(DAYS)) * 2
+        start = time(offset // 3600, offset // 60 % 60, offset % 60)
+        end = time(offset // 3600, offset // 60 % 60, offset % 60 + 1)
+        lessons.append(Lesson(days=[day], start=start, end=end, name=f"Lesson {index}"))
+    return lessons
+
+
+def linear_add(room: RoomSchedule, lesson: Lesson):
+    # the original add_lesson, which compares against every lesson in the room
+    for existing_lesson in room.lessons:
+        if lesson.overlaps(existing_lesson):
+            raise ValueError("Lesson overlaps with existing lesson")
+    room.lessons.append(lesson)
+
+
+def bench(count: int, add) -> float:
+    room = RoomSchedule(name="Benchmark Room")
+    lessons = make_lessons(count)
+    started = perf_counter()
+    for lesson in lessons:
+        add(room, lesson)
+    return perf_counter() - started
+
+
+def main():
+    for count in SIZES:
+        indexed = bench(count, RoomSchedule.add_lesson)
+        linear = bench(count, linear_add)
+        print(
+            f"{count:>7} lessons | indexed {count / indexed:>12,.0f} adds/s"
+            f" | linear {count / linear:>12,.0f} adds/s"
+            f" | speedup {linear / indexed:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
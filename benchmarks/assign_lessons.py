@@ -0,0 +1,87 @@
+"""
+Times assigning tens of thousands of lessons to the rooms of a schedule,
+against trying every room in turn for each lesson.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.assign_lessons
+```
+"""
+
+import random
+from datetime import time
+
+from lib.assignment import assign_lessons
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+
+from .yaml_storage import timed
+
+SIZES = [1_000, 10_000, 50_000]
+LESSONS_PER_ROOM = 15
+DAYS = list(Day)[:5]
+
+
+def make_lessons(count: int) -> list[Lesson]:
+    # seeded so runs compare, with lessons of 30 to 120 minutes across the week
+    generator = random.Random(count)
+    lessons = []
+    for index in range(count):
+        start = generator.randrange(8 * 60, 18 * 60, 15)
+        end = start + generator.choice([30, 45, 60, 90, 120])
+        lessons.append(
+            Lesson(
+                days=generator.sample(DAYS, generator.choice([1, 2, 3])),
+                start=time(start // 60, start % 60),
+                end=time(end // 60, end % 60),
+                name=f"Lesson {index}",
+            )
+        )
+    return lessons
+
+
+def make_schedule(count: int) -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(name=f"Room {index}")
+            for index in range(count // LESSONS_PER_ROOM)
+        ]
+    )
+
+
+def first_fit(schedule: Schedule, lessons: list[Lesson]) -> list[Lesson]:
+    unplaced = []
+    for lesson in lessons:
+        for room in schedule.rooms:
+            if not room.overlapping_lessons(lesson):
+                room.add_lesson(lesson)
+                break
+        else:
+            unplaced.append(lesson)
+    return unplaced
+
+
+def main():
+    for count in SIZES:
+        lessons = make_lessons(count)
+        schedule = make_schedule(count)
+        results = {}
+        assigned = timed(
+            lambda: results.update(unplaced=assign_lessons(schedule, lessons)[1])
+        )
+        line = (
+            f"{count:>6} lessons in {len(schedule.rooms)} rooms"
+            f" | assign {assigned:6.2f}s ({len(results['unplaced'])} unplaced)"
+        )
+        if count <= 10_000:
+            schedule = make_schedule(count)
+            naive = timed(lambda: results.update(unplaced=first_fit(schedule, lessons)))
+            line += (
+                f" | every room in turn {naive:6.2f}s"
+                f" ({len(results['unplaced'])} unplaced)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Times adding lessons to a large schedule file with one `schedule edit` call per
+lesson against a single `schedule edit ... batch` call adding all of them.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.batch_edit
+```
+"""
+
+import json
+import tempfile
+from time import perf_counter
+
+from click.testing import CliRunner
+
+from cli.app import main as cli
+from lib import storage
+from lib.schedule import Schedule
+
+from .yaml_storage import make_schedule_dict
+
+LESSON_COUNT = 10_000
+OPERATION_COUNT = 20
+
+
+def operations(room_name: str) -> list[dict]:
+    # every generated lesson ends by 19:45, so evening lessons never overlap
+    return [
+        {
+            "op": "add-lesson",
+            "room": room_name,
+            "days": ["saturday"],
+            "start": f"20:{index * 2:02}",
+            "end": f"20:{index * 2 + 1:02}",
+            "name": f"Evening {index}",
+        }
+        for index in range(OPERATION_COUNT)
+    ]
+
+
+def main():
+    runner = CliRunner()
+    for label in ["separate edits", "one batch"]:
+        with tempfile.TemporaryDirectory() as directory:
+            schedule = Schedule.model_validate(make_schedule_dict(LESSON_COUNT))
+            storage.YamlStore(directory).create("Big", schedule)
+            edit = ["schedule", "edit", "-d", directory, "--no-cache", "Big"]
+            batch = operations(schedule.rooms[0].name)
+
+            started = perf_counter()
+            if label == "one batch":
+                lines = "\n".join(json.dumps(operation) for operation in batch)
+                result = runner.invoke(cli, [*edit, "batch"], input=lines)
+                assert result.exit_code == 0, result.output
+            else:
+                for operation in batch:
+                    result = runner.invoke(
+                        cli, [*edit, "batch"], input=json.dumps(operation)
+                    )
+                    assert result.exit_code == 0, result.output
+            elapsed = perf_counter() - started
+            print(
+                f"{label:>14}: {OPERATION_COUNT} lessons on {LESSON_COUNT} in"
+                f" {elapsed:6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
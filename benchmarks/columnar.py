@@ -0,0 +1,109 @@
+"""
+Measures how much memory a 100k lesson schedule takes as pydantic models
+and as a `ColumnarSchedule`, and times converting between them and a few
+queries on each, checking both forms give the same answers.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.columnar
+```
+"""
+
+import gc
+import tracemalloc
+from datetime import time
+
+from lib.columnar import ColumnarSchedule
+from lib.schedule import Day, Schedule
+from lib.stats import schedule_stats
+
+from .synthetic import SyntheticParams, make_synthetic_schedule_dict
+from .yaml_storage import timed
+
+SIZES = [10_000, 100_000]
+
+
+def retained(build) -> tuple[object, int]:
+    """
+    Builds an object and returns it with the bytes still allocated for it
+    once building is done.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return built, size
+
+
+def main():
+    for count in SIZES:
+        schedule_dict = make_synthetic_schedule_dict(
+            SyntheticParams(
+                rooms=count // 1_000, lessons_per_room=1_000, overlap_density=0.01
+            )
+        )
+        schedule, schedule_size = retained(
+            lambda: Schedule.model_validate(schedule_dict)
+        )
+        del schedule_dict
+        # built from the copy that's kept, so none of its strings are shared
+        columns, columns_size = retained(
+            lambda: ColumnarSchedule.from_schedule(
+                Schedule.model_validate(schedule.model_dump())
+            )
+        )
+        print(
+            f"{count:>7} lessons | models {schedule_size / 2**20:7.1f}MiB"
+            f" ({schedule_size / count:6.0f}B a lesson)"
+            f" | columnar {columns_size / 2**20:6.1f}MiB"
+            f" ({columns_size / count:4.0f}B a lesson, arrays {columns.nbytes / count:.0f}B)"
+            f" | {schedule_size / columns_size:4.1f}x smaller"
+        )
+
+        results = {}
+        to_columns = timed(lambda: ColumnarSchedule.from_schedule(schedule))
+        to_models = timed(lambda: results.update(schedule=columns.to_schedule()))
+        assert results["schedule"] == schedule
+        print(
+            f"{'':>7} convert | to columnar {to_columns * 1000:7.1f}ms"
+            f" | back to models {to_models * 1000:7.1f}ms"
+        )
+
+        queries = {
+            "find conflicts": (
+                lambda: schedule.find_conflicts(),
+                lambda: columns.find_conflicts(),
+            ),
+            "free rooms": (
+                lambda: schedule.find_free_rooms([Day.MONDAY], time(9), time(10)),
+                lambda: [
+                    schedule.rooms[index]
+                    for index in columns.find_free_rooms(
+                        [Day.MONDAY], time(9), time(10)
+                    )
+                ],
+            ),
+            "stats": (
+                lambda: schedule_stats(schedule).to_dict(),
+                lambda: schedule_stats(columns).to_dict(),
+            ),
+        }
+        for name, (on_models, on_columns) in queries.items():
+            # the models build their indexes on the first query, leave that out
+            on_models()
+            models = timed(lambda: results.update(models=on_models()))
+            columnar = timed(lambda: results.update(columnar=on_columns()))
+            assert results["models"] == results["columnar"], name
+            print(
+                f"{'':>7} {name:>14} | models {models * 1000:8.1f}ms"
+                f" | columnar {columnar * 1000:7.1f}ms ({models / columnar:5.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
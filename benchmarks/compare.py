@@ -0,0 +1,59 @@
+"""
+Compares two JSON results of benchmarks.suite scenario by scenario, exiting
+with 1 if any scenario got slower than the threshold allows.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.compare before.json after.json --threshold 1.2
+```
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Slowdown of the median, as a ratio, that counts as a regression.",
+    )
+    args = parser.parse_args(argv)
+    before, after = load(args.before), load(args.after)
+
+    if before["params"] != after["params"]:
+        print("warning: the runs used different synthetic schedules", file=sys.stderr)
+    print(
+        f"before {before['commit'] or 'unknown'}, after {after['commit'] or 'unknown'}"
+    )
+
+    regressions = []
+    for name, result in after["scenarios"].items():
+        if name not in before["scenarios"]:
+            print(f"{name:>15}: {result['median'] * 1000:9.2f}ms (new)")
+            continue
+        ratio = result["median"] / before["scenarios"][name]["median"]
+        flag = ""
+        if ratio > args.threshold:
+            regressions.append(name)
+            flag = "  <- slower"
+        print(
+            f"{name:>15}: {before['scenarios'][name]['median'] * 1000:9.2f}ms"
+            f" -> {result['median'] * 1000:9.2f}ms ({ratio:5.2f}x){flag}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Times `schedule edit` calls on a large schedule file that change nothing,
+that fail, and that change one lesson. Only the last should pay for
+writing the file.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.edit_saves
+```
+"""
+
+import tempfile
+from time import perf_counter
+
+from click.testing import CliRunner
+
+from cli.app import main as cli
+from lib import storage
+from lib.schedule import Schedule
+
+from .yaml_storage import make_schedule_dict
+
+LESSON_COUNT = 20_000
+RUNS = 5
+
+
+def timed_edit(directory: str, *args: str) -> tuple[float, int]:
+    runner = CliRunner()
+    started = perf_counter()
+    for _ in range(RUNS):
+        result = runner.invoke(cli, ["schedule", "edit", "-d", directory, "Big", *args])
+    elapsed = (perf_counter() - started) / RUNS
+    return elapsed, result.exit_code
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        schedule = Schedule.model_validate(make_schedule_dict(LESSON_COUNT))
+        storage.YamlStore(directory).create("Big", schedule)
+        room = schedule.rooms[0]
+        lesson = room.lessons[0]
+        days = [flag for day in lesson.days for flag in ("-d", day.value)]
+
+        scenarios = {
+            "no-op edit": ["room", room.name, "remove-lesson", "Not A Lesson"],
+            "failed edit": [
+                "room",
+                room.name,
+                "add-lesson",
+                *days,
+                "-s",
+                lesson.start.strftime("%H:%M"),
+                "-e",
+                lesson.end.strftime("%H:%M"),
+                "-n",
+                "Overlapping Lesson",
+            ],
+            "saving edit": ["room", room.name, "lesson", lesson.id, "-n", "Renamed"],
+        }
+        print(f"{LESSON_COUNT} lessons, average of {RUNS} runs")
+        for label, args in scenarios.items():
+            elapsed, exit_code = timed_edit(directory, *args)
+            print(f"{label:>12}: {elapsed:6.3f}s (exit code {exit_code})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Times finding free rooms and free time on schedules with hundreds of rooms,
+against checking every lesson of every room.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.free_rooms
+```
+"""
+
+from datetime import time, timedelta
+
+from lib.schedule import Day, Schedule
+
+from .yaml_storage import make_schedule_dict, timed
+
+SIZES = [10_000, 100_000]
+QUERIES = 100
+DAYS = [Day.MONDAY, Day.WEDNESDAY]
+
+
+def query_times(index: int) -> tuple[time, time]:
+    return time(index % 12 + 8, 50), time(index % 12 + 9, 10)
+
+
+def linear_free_rooms(schedule: Schedule, days, start: time, end: time):
+    return [
+        room
+        for room in schedule.rooms
+        if not any(
+            lesson.start <= end
+            and lesson.end >= start
+            and any(day in lesson.days for day in days)
+            for lesson in room.lessons
+        )
+    ]
+
+
+def main():
+    for count in SIZES:
+        schedule = Schedule.model_validate(
+            make_schedule_dict(count, lessons_per_room=50)
+        )
+        # the first query of a day builds that day's busy intervals
+        schedule.find_free_rooms(DAYS, time(8), time(9))
+
+        indexed = timed(
+            lambda: [
+                schedule.find_free_rooms(DAYS, *query_times(index))
+                for index in range(QUERIES)
+            ]
+        )
+        linear = timed(
+            lambda: [
+                linear_free_rooms(schedule, DAYS, *query_times(index))
+                for index in range(QUERIES)
+            ]
+        )
+        slots = timed(
+            lambda: [
+                schedule.find_free_slots(room.id, timedelta(minutes=30))
+                for room in schedule.rooms
+            ]
+        )
+        print(
+            f"{count:>7} lessons in {len(schedule.rooms)} rooms"
+            f" | free rooms {indexed / QUERIES * 1000:6.2f}ms per query"
+            f" (linear {linear / QUERIES * 1000:7.2f}ms)"
+            f" | free slots of every room {slots * 1000:7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
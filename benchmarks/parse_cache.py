@@ -0,0 +1,42 @@
+"""
+Compares loading schedule files by parsing and validating them against loading
+them from lib.storage's parse cache.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.parse_cache
+```
+"""
+
+import os
+import tempfile
+
+from lib import storage
+from lib.schedule import Schedule
+from .yaml_storage import make_schedule_dict, timed
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = storage.ParseCache(os.path.join(directory, "cache"))
+        for count in SIZES:
+            path = os.path.join(directory, f"{count}.yaml")
+            storage.save_schedule(
+                Schedule.model_validate(make_schedule_dict(count)), path
+            )
+
+            parsed = timed(lambda: storage.load_schedule(path))
+            first = timed(lambda: storage.load_schedule(path, cache))
+            cached = timed(lambda: storage.load_schedule(path, cache))
+            print(
+                f"{count:>7} lessons | parse {parsed:6.2f}s"
+                f" | first cached load {first:6.2f}s"
+                f" | cached {cached:6.2f}s ({parsed / cached:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
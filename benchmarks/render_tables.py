@@ -0,0 +1,37 @@
+"""
+Times drawing the lesson tables of `schedule view` with tabulate and with the
+fast renderer, checking both draw the same tables.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.render_tables
+```
+"""
+
+from cli.view import fast_room_schedule, tabulate_room_schedule
+from lib.schedule import Schedule
+
+from .yaml_storage import make_schedule_dict, timed
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+def main():
+    for count in SIZES:
+        # one room holding every lesson, the case tabulate struggles with
+        room = Schedule.model_validate(
+            make_schedule_dict(count, lessons_per_room=count)
+        ).rooms[0]
+        tables = {}
+        slow = timed(lambda: tables.update(tabulate=tabulate_room_schedule(room)))
+        fast = timed(lambda: tables.update(fast=fast_room_schedule(room)))
+        assert tables["fast"] == tables["tabulate"]
+        print(
+            f"{count:>6} lessons | tabulate {slow * 1000:8.1f}ms"
+            f" | fast {fast * 1000:7.1f}ms ({slow / fast:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Times working out the busy minutes and hourly occupancy of every room with
+`schedule_stats` against the same numbers from a plain Python loop over the
+lessons, checking both agree.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.stats
+```
+"""
+
+from lib.schedule import Schedule
+from lib.stats import DAY_INDEX, DAYS, HOURS, lesson_arrays, schedule_stats
+
+from .synthetic import SyntheticParams, make_synthetic_schedule_dict
+from .yaml_storage import timed
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def python_stats(schedule: Schedule) -> tuple[list, list]:
+    """
+    Busy minutes per room and day and per room, day and hour, merging the
+    lessons of each day in a loop.
+    """
+    intervals = [[[] for _ in DAYS] for _ in schedule.rooms]
+    for room_index, room in enumerate(schedule.rooms):
+        for lesson in room.lessons:
+            start, end = lesson.start, lesson.end
+            end_minute = (
+                end.hour * 60 + end.minute + bool(end.second or end.microsecond)
+            )
+            for day in lesson.days:
+                intervals[room_index][DAY_INDEX[day]].append(
+                    (start.hour * 60 + start.minute, end_minute)
+                )
+
+    busy = [[0] * len(DAYS) for _ in schedule.rooms]
+    hourly = [[[0] * HOURS for _ in DAYS] for _ in schedule.rooms]
+    for room, days in enumerate(intervals):
+        for day, lessons in enumerate(days):
+            blocks = []
+            for start, end in sorted(lessons):
+                if blocks and start <= blocks[-1][1]:
+                    blocks[-1][1] = max(blocks[-1][1], end)
+                else:
+                    blocks.append([start, end])
+            for start, end in blocks:
+                busy[room][day] += end - start
+                for hour in range(start // 60, min(-(-end // 60), HOURS)):
+                    overlap = min(end, (hour + 1) * 60) - max(start, hour * 60)
+                    hourly[room][day][hour] += max(overlap, 0)
+    return busy, hourly
+
+
+def main():
+    for count in SIZES:
+        schedule = Schedule.model_validate(
+            make_synthetic_schedule_dict(
+                SyntheticParams(
+                    rooms=count // 1_000, lessons_per_room=1_000, overlap_density=0.2
+                )
+            )
+        )
+        results = {}
+        slow = timed(lambda: results.update(python=python_stats(schedule)))
+        fast = timed(lambda: results.update(numpy=schedule_stats(schedule)))
+        convert = timed(lambda: lesson_arrays(schedule))
+        busy, hourly = results["python"]
+        assert results["numpy"].busy_minutes.tolist() == busy
+        assert results["numpy"].hourly.tolist() == hourly
+        print(
+            f"{count:>7} lessons | python {slow * 1000:8.1f}ms"
+            f" | numpy {fast * 1000:7.1f}ms ({slow / fast:4.1f}x),"
+            f" {convert * 1000:7.1f}ms of it building the arrays"
+        )
+
+
+if __name__ == "__main__":
+    main()
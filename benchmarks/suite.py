@@ -0,0 +1,240 @@
+"""
+Times the schedule library and CLI on a synthetic schedule and writes the
+results as JSON, so runs from different commits can be compared with
+benchmarks.compare.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.suite -o before.json
+> PYTHONPATH=src python -m benchmarks.suite --rooms 50 --overlap-density 0.1 -s validate -s view-fast
+```
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable
+
+from click.testing import CliRunner
+
+from cli.app import main as cli
+from cli.view import RENDERERS, tabulate_schedule
+from lib import storage
+from lib.schedule import Lesson, RoomSchedule, Schedule
+
+from .synthetic import SyntheticParams, make_synthetic_schedule_dict
+
+SCHEDULE_NAME = "Synthetic"
+
+
+@dataclass
+class Workload:
+    params: SyntheticParams
+    schedule_dict: dict
+    # holds the schedule saved as SCHEDULE_NAME with the yaml backend
+    directory: str
+
+
+# each scenario sets up from the workload and returns the code to time
+SCENARIOS: dict[str, Callable[[Workload], Callable[[], object]]] = {}
+
+
+def scenario(name: str):
+    def register(setup: Callable[[Workload], Callable[[], object]]):
+        SCENARIOS[name] = setup
+        return setup
+
+    return register
+
+
+@scenario("validate")
+def validate(workload: Workload):
+    return lambda: Schedule.model_validate(workload.schedule_dict)
+
+
+@scenario("find-conflicts")
+def find_conflicts(workload: Workload):
+    schedule = Schedule.model_validate(workload.schedule_dict)
+    return schedule.find_conflicts
+
+
+@scenario("add-lesson")
+def add_lesson(workload: Workload):
+    # adds the lessons of the first room one by one to an empty room
+    lessons = [
+        Lesson.model_validate(lesson)
+        for lesson in workload.schedule_dict["rooms"][0]["lessons"]
+    ]
+
+    def run():
+        room = RoomSchedule(name="Empty")
+        for lesson in lessons:
+            try:
+                room.add_lesson(lesson)
+            except ValueError:
+                pass
+
+    return run
+
+
+@scenario("yaml-load")
+def yaml_load(workload: Workload):
+    store = storage.YamlStore(workload.directory)
+    return lambda: store.load(SCHEDULE_NAME)
+
+
+@scenario("yaml-save")
+def yaml_save(workload: Workload):
+    # renames a lesson before each save, unchanged schedules aren't written
+    store = storage.YamlStore(workload.directory)
+    schedule = store.load(SCHEDULE_NAME)
+    room = schedule.rooms[0]
+    lesson_id = room.lessons[0].id
+    runs = iter(range(sys.maxsize))
+
+    def run():
+        room.update_lesson(lesson_id, name=f"Renamed {next(runs)}")
+        store.save(SCHEDULE_NAME, schedule)
+
+    return run
+
+
+@scenario("cli-edit")
+def cli_edit(workload: Workload):
+    # renames a lesson, so every run loads, validates and saves the file
+    room = workload.schedule_dict["rooms"][0]
+    lesson_id = room["lessons"][0]["id"]
+    runner = CliRunner()
+    runs = iter(range(sys.maxsize))
+
+    def run():
+        result = runner.invoke(
+            cli,
+            ["schedule", "edit", "-d", workload.directory, "--no-cache"]
+            + [SCHEDULE_NAME, "room", room["id"], "lesson", lesson_id]
+            + ["-n", f"Renamed {next(runs)}"],
+        )
+        assert result.exit_code == 0, result.output
+
+    return run
+
+
+def view_scenario(renderer: str):
+    def setup(workload: Workload):
+        schedule = Schedule.model_validate(workload.schedule_dict)
+        render = RENDERERS[renderer]
+        return lambda: sum(
+            len(chunk) for chunk in tabulate_schedule(schedule.rooms, render)
+        )
+
+    return setup
+
+
+for renderer in RENDERERS:
+    scenario(f"view-{renderer}")(view_scenario(renderer))
+
+
+def current_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_runs(run: Callable[[], object], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        run()
+        timings.append(perf_counter() - started)
+    return timings
+
+
+def run_suite(params: SyntheticParams, names: list[str], repeat: int) -> dict:
+    schedule_dict = make_synthetic_schedule_dict(params)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        schedule = Schedule.model_validate(schedule_dict)
+        storage.YamlStore(directory).create(SCHEDULE_NAME, schedule)
+        workload = Workload(params, schedule_dict, directory)
+        for name in names:
+            timings = time_runs(SCENARIOS[name](workload), repeat)
+            results[name] = {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.fmean(timings),
+                "runs": timings,
+            }
+            print(
+                f"{name:>15}: {results[name]['median'] * 1000:9.2f}ms median"
+                f" of {repeat}",
+                file=sys.stderr,
+            )
+    return {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "params": params.to_dict(),
+        "repeat": repeat,
+        "scenarios": results,
+    }
+
+
+def main(argv: list[str] | None = None):
+    defaults = SyntheticParams()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=defaults.rooms)
+    parser.add_argument(
+        "--lessons-per-room", type=int, default=defaults.lessons_per_room
+    )
+    parser.add_argument("--day-spread", type=int, default=defaults.day_spread)
+    parser.add_argument(
+        "--overlap-density", type=float, default=defaults.overlap_density
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Scenario to run, all of them by default.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="File to write the JSON results to, stdout by default."
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        params = SyntheticParams(
+            rooms=args.rooms,
+            lessons_per_room=args.lessons_per_room,
+            day_spread=args.day_spread,
+            overlap_density=args.overlap_density,
+            seed=args.seed,
+        )
+    except ValueError as err:
+        parser.error(str(err))
+    results = run_suite(params, args.scenario or list(SCENARIOS), args.repeat)
+
+    text = json.dumps(results, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w") as fp:
+            fp.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Deterministic synthetic schedules for the benchmark suite. The same
+parameters and seed always give the same schedule, ids included, so timings
+from different commits measure the same work.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from uuid import UUID
+
+from lib.schedule import Day
+
+DAYS = [day.value for day in Day]
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class SyntheticParams:
+    rooms: int = 20
+    lessons_per_room: int = 500
+    # how many days of the week, from Monday, the lessons of a room spread over
+    day_spread: int = 5
+    # share of lessons that overlap the lesson before them on their day
+    overlap_density: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self):
+        if not 1 <= self.day_spread <= len(DAYS):
+            raise ValueError(f"day_spread must be from 1 to {len(DAYS)}")
+        if not 0 <= self.overlap_density <= 1:
+            raise ValueError("overlap_density must be from 0 to 1")
+        # every lesson needs a second to itself and a second before the next
+        if self.lessons_per_room > self.day_spread * SECONDS_PER_DAY // 2:
+            raise ValueError("Too many lessons per room to fit in the days")
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _time(seconds: int) -> str:
+    return f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+
+
+def make_synthetic_schedule_dict(params: SyntheticParams) -> dict:
+    """
+    Builds a schedule in the form it is stored in, ready for
+    Schedule.model_validate or writing to a file.
+
+    Lessons of a room take turns between the days of the spread and split
+    each day into equal slots. An overlapping lesson starts early, on the
+    last second of the lesson before it.
+    """
+    generator = random.Random(params.seed)
+
+    def make_id() -> str:
+        return str(UUID(int=generator.getrandbits(128), version=4))
+
+    slots_per_day = -(-params.lessons_per_room // params.day_spread)
+    slot = SECONDS_PER_DAY // slots_per_day
+    rooms = []
+    for room_index in range(params.rooms):
+        lessons = []
+        for index in range(params.lessons_per_room):
+            day, position = index % params.day_spread, index // params.day_spread
+            start = position * slot
+            # one second before the next slot is left free
+            end = start + slot - 2
+            if position and generator.random() < params.overlap_density:
+                start -= 2
+            lessons.append(
+                {
+                    "days": [DAYS[day]],
+                    "start": _time(start),
+                    "end": _time(end),
+                    "name": f"Lesson {room_index}.{index}",
+                    "id": make_id(),
+                }
+            )
+        rooms.append(
+            {"id": make_id(), "name": f"Room {room_index}", "lessons": lessons}
+        )
+    return {"rooms": rooms}
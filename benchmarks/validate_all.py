@@ -0,0 +1,54 @@
+"""
+Times `schedule validate-all` on a directory of synthetic schedules, one
+process against one per CPU.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.validate_all
+```
+"""
+
+import os
+import tempfile
+from time import perf_counter
+
+from click.testing import CliRunner
+
+from cli.app import main as cli
+from lib import storage
+
+from .synthetic import SyntheticParams, make_synthetic_schedule_dict
+
+SCHEDULE_COUNT = 48
+PARAMS = SyntheticParams(rooms=10, lessons_per_room=200, overlap_density=0.01)
+
+
+def main():
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(SCHEDULE_COUNT):
+            schedule_dict = make_synthetic_schedule_dict(
+                SyntheticParams(**{**PARAMS.to_dict(), "seed": index})
+            )
+            with open(storage.schedule_path(directory, f"Schedule {index}"), "w") as f:
+                storage.write_schedule_dict(schedule_dict, f)
+
+        print(
+            f"{SCHEDULE_COUNT} schedules of"
+            f" {PARAMS.rooms * PARAMS.lessons_per_room} lessons"
+        )
+        for jobs in sorted({1, os.cpu_count() or 1}):
+            started = perf_counter()
+            result = runner.invoke(
+                cli, ["schedule", "validate-all", "-d", directory, "--jobs", str(jobs)]
+            )
+            elapsed = perf_counter() - started
+            print(
+                f"{jobs:>3} job(s): {elapsed:6.2f}s"
+                f" ({result.output.splitlines()[-1]})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares loading and dumping schedule files with PyYAML's pure Python
+SafeLoader/SafeDumper against the libyaml based ones used by lib.storage.
+
+Usage:
+
+```bash
+> PYTHONPATH=src python -m benchmarks.yaml_storage
+```
+"""
+
+import io
+from time import perf_counter
+from uuid import uuid4
+
+import yaml
+
+from lib import storage
+from lib.schedule import Day
+
+SIZES = [1_000, 10_000, 100_000]
+LESSONS_PER_ROOM = 500
+DAYS = [day.value for day in Day]
+
+
+def make_schedule_dict(
+    lesson_count: int, lessons_per_room: int = LESSONS_PER_ROOM
+) -> dict:
+    rooms = []
+    for index in range(lesson_count):
+        if index % lessons_per_room == 0:
+            rooms.append(
+                {"id": str(uuid4()), "name": f"Room {len(rooms)}", "lessons": []}
+            )
+        hour = index % 12 + 8
+        rooms[-1]["lessons"].append(
+            {
+                "days": [DAYS[index % 5], DAYS[(index + 2) % 5]],
+                "start": f"{hour:02}:00:00",
+                "end": f"{hour:02}:45:00",
+                "name": f"Lesson {index}",
+                "id": str(uuid4()),
+            }
+        )
+    return {"rooms": rooms}
+
+
+def timed(function) -> float:
+    started = perf_counter()
+    function()
+    return perf_counter() - started
+
+
+def main():
+    print(f"libyaml available: {yaml.__with_libyaml__}")
+    for count in SIZES:
+        schedule_dict = make_schedule_dict(count)
+        text = yaml.dump(schedule_dict, Dumper=storage.SafeDumper)
+
+        pure_dump = timed(lambda: yaml.dump(schedule_dict, Dumper=yaml.SafeDumper))
+        fast_dump = timed(
+            lambda: storage.write_schedule_dict(schedule_dict, io.StringIO())
+        )
+        pure_load = timed(lambda: yaml.load(text, Loader=yaml.SafeLoader))
+        fast_load = timed(lambda: storage.read_schedule_dict(io.StringIO(text)))
+        print(
+            f"{count:>7} lessons ({len(text) / 1_000_000:.1f} MB)"
+            f" | load {pure_load:7.2f}s -> {fast_load:6.2f}s ({pure_load / fast_load:4.1f}x)"
+            f" | dump {pure_dump:7.2f}s -> {fast_dump:6.2f}s ({pure_dump / fast_dump:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from weakref import WeakValueDictionary
+
+
+class ReadWriteLock:
+    """
+    asyncio lock that lets any number of readers in at once, or one writer.
+    Waiting writers go first, so a steady stream of reads can't starve them.
+    """
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: not self._writing and not self._waiting_writers
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        async with self._condition:
+            self._waiting_writers += 1
+            try:
+                await self._condition.wait_for(
+                    lambda: not self._writing and not self._readers
+                )
+            finally:
+                self._waiting_writers -= 1
+                # readers held back by a writer that gave up can go ahead
+                self._condition.notify_all()
+            self._writing = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class ScheduleLocks:
+    """
+    One `ReadWriteLock` per schedule name, dropped once nobody holds it.
+    """
+
+    def __init__(self):
+        self._locks: WeakValueDictionary[str, ReadWriteLock] = WeakValueDictionary()
+
+    def _lock(self, name: str) -> ReadWriteLock:
+        lock = self._locks.get(name)
+        if lock is None:
+            lock = self._locks[name] = ReadWriteLock()
+        return lock
+
+    def read(self, name: str):
+        return self._lock(name).read()
+
+    def write(self, name: str):
+        return self._lock(name).write()
@@ -1,24 +1,346 @@
-from fastapi import FastAPI
+"""
+REST API for the schedules kept in the directory named by `EDA_APP_DIRECTORY`
+(the working directory by default), stored as `EDA_APP_STORAGE` says just like
+the CLI. Rooms and lessons are addressed by id since names can repeat.
 
-# from schedule import Schedule, RoomSchedule, Lesson
+Requests on the same schedule take its readers-writer lock, so reads run side
+by side while edits run one at a time. Edits happen on the event loop and file
+reads and writes in the thread pool, so the loop never waits on the disk.
+"""
+
+import os
+from datetime import time, timedelta
+from functools import lru_cache
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, TypeAdapter
+
+from lib import storage
+from lib.schedule import Day, FreeSlot, Lesson, RoomSchedule, Schedule
+from .locks import ScheduleLocks
+from .schedules import ScheduleCache
 
 app = FastAPI()
 
 
+class ScheduleCreate(BaseModel):
+    name: str
+
+
+class RoomCreate(BaseModel):
+    name: str
+
+
+class FreeRoom(BaseModel):
+    id: str
+    name: str
+
+
+class LessonUpdate(BaseModel):
+    days: list[Day] | None = None
+    start: time | None = None
+    end: time | None = None
+    name: str | None = None
+
+
+@lru_cache
+def get_schedules() -> ScheduleCache:
+    directory = os.environ.get("EDA_APP_DIRECTORY") or os.getcwd()
+    backend = os.environ.get("EDA_APP_STORAGE", "yaml")
+    return ScheduleCache(storage.get_store(backend, directory))
+
+
+@lru_cache
+def get_locks() -> ScheduleLocks:
+    return ScheduleLocks()
+
+
+async def load_schedule(name: str, schedules: ScheduleCache) -> Schedule:
+    try:
+        return await run_in_threadpool(schedules.get, name)
+    except KeyError:
+        raise HTTPException(404, f"Schedule with name {name!r} does not exist.")
+
+
+@lru_cache
+def _adapter(type_) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def json_response(value, type_, status_code: int = 200) -> Response:
+    """
+    The value as a JSON response. Cached schedules change as soon as their
+    lock is released, so their models are serialized while it is still held.
+    """
+    return Response(
+        _adapter(type_).dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def load_room(schedule: Schedule, room_id: str) -> RoomSchedule:
+    room = schedule.get_room(room_id)
+    if room is None:
+        raise HTTPException(404, f"Room with id {room_id!r} does not exist.")
+    return room
+
+
+def load_lesson(room: RoomSchedule, lesson_id: str) -> Lesson:
+    lesson = room.get_lesson(lesson_id)
+    if lesson is None:
+        raise HTTPException(404, f"Lesson with id {lesson_id!r} does not exist.")
+    return lesson
+
+
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
 
 
-# @app.get("/schedule")
-# def get_schedule():
-#     schedule = Schedule()
-#     return schedule
+# ********** SCHEDULES **********
+@app.get("/schedules")
+async def list_schedules(
+    schedules: ScheduleCache = Depends(get_schedules),
+) -> list[str]:
+    return await run_in_threadpool(schedules.store.names)
+
+
+@app.post("/schedules", status_code=201)
+async def create_schedule(
+    body: ScheduleCreate,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Schedule:
+    name = body.name
+    # names become file names, so they can't point outside the directory
+    if name.strip() == "" or name in (".", "..") or "/" in name or "\\" in name:
+        raise HTTPException(400, f"Invalid schedule name {name!r}.")
+
+    async with locks.write(name):
+        if await run_in_threadpool(schedules.store.exists, name):
+            raise HTTPException(409, f"Schedule with name {name!r} already exists.")
+        schedule = Schedule(rooms=[])
+        await run_in_threadpool(schedules.create, name, schedule)
+    return schedule
+
+
+@app.get("/schedules/{name}", response_model=Schedule)
+async def get_schedule(
+    name: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.read(name):
+        return json_response(await load_schedule(name, schedules), Schedule)
+
+
+@app.delete("/schedules/{name}", status_code=204)
+async def delete_schedule(
+    name: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+):
+    async with locks.write(name):
+        await load_schedule(name, schedules)
+        await run_in_threadpool(schedules.delete, name)
+    return Response(status_code=204)
+
+
+# ********** ROOMS **********
+@app.get("/schedules/{name}/rooms", response_model=list[RoomSchedule])
+async def list_rooms(
+    name: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.read(name):
+        rooms = (await load_schedule(name, schedules)).rooms
+        return json_response(rooms, list[RoomSchedule])
+
+
+@app.post("/schedules/{name}/rooms", status_code=201, response_model=RoomSchedule)
+async def create_room(
+    name: str,
+    body: RoomCreate,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    if body.name.strip() == "":
+        raise HTTPException(400, "Room name cannot be empty or only contain spaces.")
+    async with locks.write(name):
+        schedule = await load_schedule(name, schedules)
+        room = RoomSchedule(name=body.name)
+        schedule.add_room(room)
+        await run_in_threadpool(schedules.save, name, schedule)
+        return json_response(room, RoomSchedule, status_code=201)
+
+
+@app.get("/schedules/{name}/rooms/{room_id}", response_model=RoomSchedule)
+async def get_room(
+    name: str,
+    room_id: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.read(name):
+        room = load_room(await load_schedule(name, schedules), room_id)
+        return json_response(room, RoomSchedule)
+
+
+@app.delete("/schedules/{name}/rooms/{room_id}", status_code=204)
+async def delete_room(
+    name: str,
+    room_id: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+):
+    async with locks.write(name):
+        schedule = await load_schedule(name, schedules)
+        load_room(schedule, room_id)
+        schedule.remove_room(room_id)
+        await run_in_threadpool(schedules.save, name, schedule)
+    return Response(status_code=204)
+
+
+@app.get("/schedules/{name}/free-rooms")
+async def find_free_rooms(
+    name: str,
+    start: time,
+    end: time,
+    days: list[Day] = Query(),
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> list[FreeRoom]:
+    async with locks.read(name):
+        schedule = await load_schedule(name, schedules)
+        try:
+            rooms = schedule.find_free_rooms(days, start, end)
+        except ValueError as err:
+            raise HTTPException(422, str(err))
+    return [FreeRoom(id=room.id, name=room.name) for room in rooms]
+
+
+@app.get("/schedules/{name}/rooms/{room_id}/free-slots")
+async def find_free_slots(
+    name: str,
+    room_id: str,
+    minutes: int = Query(gt=0),
+    days: list[Day] | None = Query(None),
+    start: time = time.min,
+    end: time = time.max,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> list[FreeSlot]:
+    async with locks.read(name):
+        room = load_room(await load_schedule(name, schedules), room_id)
+        return room.free_slots(timedelta(minutes=minutes), days, start, end)
+
+
+# ********** LESSONS **********
+@app.get("/schedules/{name}/rooms/{room_id}/lessons", response_model=list[Lesson])
+async def list_lessons(
+    name: str,
+    room_id: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.read(name):
+        room = load_room(await load_schedule(name, schedules), room_id)
+        return json_response(room.lessons, list[Lesson])
+
+
+@app.post(
+    "/schedules/{name}/rooms/{room_id}/lessons", status_code=201, response_model=Lesson
+)
+async def create_lesson(
+    name: str,
+    room_id: str,
+    lesson: Lesson,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.write(name):
+        schedule = await load_schedule(name, schedules)
+        room = load_room(schedule, room_id)
+        try:
+            room.add_lesson(lesson)
+        except ValueError as err:
+            raise HTTPException(409, str(err))
+        await run_in_threadpool(schedules.save, name, schedule)
+        return json_response(lesson, Lesson, status_code=201)
+
+
+@app.get("/schedules/{name}/rooms/{room_id}/lessons/{lesson_id}", response_model=Lesson)
+async def get_lesson(
+    name: str,
+    room_id: str,
+    lesson_id: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.read(name):
+        room = load_room(await load_schedule(name, schedules), room_id)
+        return json_response(load_lesson(room, lesson_id), Lesson)
+
+
+@app.patch(
+    "/schedules/{name}/rooms/{room_id}/lessons/{lesson_id}", response_model=Lesson
+)
+async def update_lesson(
+    name: str,
+    room_id: str,
+    lesson_id: str,
+    body: LessonUpdate,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+) -> Response:
+    async with locks.write(name):
+        schedule = await load_schedule(name, schedules)
+        room = load_room(schedule, room_id)
+        lesson = load_lesson(room, lesson_id)
+        # update_lesson doesn't check for overlaps, so check the edited
+        # lesson against the others before changing anything, as POST does
+        try:
+            edited = Lesson.model_validate(
+                {**lesson.model_dump(), **body.model_dump(exclude_none=True)}
+            )
+        except ValueError as err:
+            raise HTTPException(422, str(err))
+        if edited.days and any(
+            other.id != lesson_id for other in room.overlapping_lessons(edited)
+        ):
+            raise HTTPException(409, "Lesson overlaps with existing lesson")
+        try:
+            lesson = room.update_lesson(
+                lesson_id,
+                days=body.days,
+                start=body.start,
+                end=body.end,
+                name=body.name,
+            )
+        except ValueError as err:
+            raise HTTPException(422, str(err))
+        await run_in_threadpool(schedules.save, name, schedule)
+        return json_response(lesson, Lesson)
 
 
-# @app.post("/schedule")
-# def create_room(room: RoomSchedule):
-#     return room
+@app.delete("/schedules/{name}/rooms/{room_id}/lessons/{lesson_id}", status_code=204)
+async def delete_lesson(
+    name: str,
+    room_id: str,
+    lesson_id: str,
+    schedules: ScheduleCache = Depends(get_schedules),
+    locks: ScheduleLocks = Depends(get_locks),
+):
+    async with locks.write(name):
+        schedule = await load_schedule(name, schedules)
+        room = load_room(schedule, room_id)
+        load_lesson(room, lesson_id)
+        room.remove_lesson(lesson_id)
+        await run_in_threadpool(schedules.save, name, schedule)
+    return Response(status_code=204)
 
 
 if __name__ == "__main__":  # pragma: no cover
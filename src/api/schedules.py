@@ -0,0 +1,102 @@
+"""
+Schedules loaded by the API, kept in memory so hot schedules are served
+without reading and validating their files on every request.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from lib.schedule import Schedule
+from lib.storage import ScheduleStore
+
+MAX_SCHEDULES = 32
+MAX_BYTES = 256 * 1024 * 1024
+# rough sizes of the validated models including their indexes, measured with
+# tracemalloc on generated schedules
+ROOM_BYTES = 1_000
+LESSON_BYTES = 1_500
+
+
+def approximate_size(schedule: Schedule) -> int:
+    return sum(ROOM_BYTES + LESSON_BYTES * len(room.lessons) for room in schedule.rooms)
+
+
+class ScheduleCache:
+    """
+    Least recently used schedules of a store, bounded by count and by their
+    approximate size in memory. A cached schedule is dropped as soon as the
+    store's version of it changes, e.g. because the CLI edited the file.
+    """
+
+    def __init__(
+        self,
+        store: ScheduleStore,
+        max_schedules: int = MAX_SCHEDULES,
+        max_bytes: int = MAX_BYTES,
+    ):
+        self.store = store
+        self.max_schedules = max_schedules
+        self.max_bytes = max_bytes
+        # name -> (store version, approximate size, schedule)
+        self._entries: OrderedDict[str, tuple[Hashable, int, Schedule]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    @property
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries.values())
+
+    def get(self, name: str) -> Schedule:
+        """
+        The schedule with the name, loading it if it isn't cached or changed
+        since. Raises KeyError if there is no such schedule.
+        """
+        if not self.store.exists(name):
+            self.discard(name)
+            raise KeyError(name)
+        version = self.store.version(name)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(name)
+                return entry[2]
+
+        schedule = self.store.load(name)
+        self._put(name, version, schedule)
+        return schedule
+
+    def create(self, name: str, schedule: Schedule):
+        self.store.create(name, schedule)
+        self._put(name, self.store.version(name), schedule)
+
+    def save(self, name: str, schedule: Schedule):
+        try:
+            self.store.save(name, schedule)
+        except BaseException:
+            # the cached copy now holds changes that never made it to disk
+            self.discard(name)
+            raise
+        self._put(name, self.store.version(name), schedule)
+
+    def delete(self, name: str):
+        self.store.delete(name)
+        self.discard(name)
+
+    def discard(self, name: str):
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def _put(self, name: str, version: Hashable, schedule: Schedule):
+        with self._lock:
+            self._entries[name] = (version, approximate_size(schedule), schedule)
+            self._entries.move_to_end(name)
+            total = self.size
+            # always keep the schedule just used, even if it is too big alone
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_schedules or total > self.max_bytes
+            ):
+                _, (_, size, _) = self._entries.popitem(last=False)
+                total -= size
@@ -7,6 +7,9 @@
     > eda-app schedule create "My Schedule" -d /path/to/save-files/
     # Creates schedule and saves it to yaml file
 
+    > eda-app schedule list -d /path/to/save-files/
+    # Lists the schedules with their room and lesson counts from an index kept in .eda-catalog.json, only re-reading files changed since
+
     > eda-app schedule edit "My Schedule" create-room "My First Room"
     # Adds a room called My First Room
 
@@ -16,28 +19,73 @@
     > eda-app schedule edit "My Schedule" room "My First Room" add-lesson -d monday -d tuesday -d thrusday -s 10:00 -e 11:00 -n "My First Lesson"
     # Adds a lesson to the My First Room called My First Lesson
 
+    > eda-app schedule edit "My Schedule" room "My First Room" import-lessons lessons.csv
+    # Adds every lesson in lessons.csv (or a .jsonl file) to the room, reporting all overlaps
+
     > eda-app schedule edit "My Schedule" room "My First Room" remove-lesson "My First Lesson"
-    # Removes a lesson called My First Lesson
+    # Removes a lesson called My First Lesson, pass the lesson id instead if several lessons share the name
 
     > eda-app schedule edit "My Schedule" room "My First Room" lesson "First Lesson" [Options]
     # Edits a specific lesson of a room based on the options passed in
+
+    > eda-app schedule edit "My Schedule" batch -f ops.jsonl
+    # Runs every edit in ops.jsonl (or stdin) one per line, e.g. {"op": "add-lesson", "room": "My First Room", "days": ["monday"], "start": "10:00", "end": "11:00", "name": "My First Lesson"}, saving once and only if all succeed
     
     > eda-app schedule view "My Schedule"
     # Prints out the schedule to the screen in a human readable format
+
+    > eda-app schedule view --no-cache "My Schedule"
+    # Parses the yaml file again instead of reusing the cached copy kept in ~/.cache/eda-app (or EDA_APP_CACHE_DIR)
+
+    > eda-app schedule view --limit 20 --page 2 "My Schedule"
+    # Prints out rooms 21 to 40, one room at a time, add --pager to scroll through them in a pager like less
+
+    > eda-app schedule view --renderer fast "My Schedule"
+    # Draws the same tables as the default tabulate renderer, much quicker for rooms with thousands of lessons
     
     > eda-app schedule view "My Schedule" room "My First Room"
     # Prints out the schedule for a room in a human readable format
+
+    > eda-app schedule view "My Schedule" free rooms -d monday -d wednesday -s 10:00 -e 11:30
+    # Lists the rooms with no lessons overlapping 10:00-11:30 on Monday and Wednesday
+
+    > eda-app schedule view "My Schedule" free slots "My First Room" -m 60 --from 08:00 --to 18:00
+    # Lists the gaps of at least an hour between lessons in My First Room
+
+    > eda-app schedule shell "My Schedule"
+    # Loads the schedule once and runs edit and view commands typed at the prompt, e.g. create-room "My First Room" or view, saving on save or exit
+
+    > eda-app schedule assign "My Schedule" -f lessons.csv
+    # Places every lesson in lessons.csv in a room where it overlaps nothing, listing the lessons no room could take
+
+    > eda-app schedule check "My Schedule"
+    # Prints a JSON report of every overlapping lesson, exiting with 1 if there are any
+
+    > eda-app schedule stats "My Schedule" --from 08:00 --to 18:00
+    # Prints the busy minutes of every room per day, how many rooms are in use each hour, the peak hours and the idle time between lessons, add --json for the numbers as JSON
+
+    > eda-app schedule validate-all -d /path/to/save-files/ --jobs 8
+    # Validates and checks every schedule in the directory in 8 processes, printing each result as it finishes and exiting with 1 if any failed
+
+    > eda-app schedule edit --storage sqlite "My Schedule" create-room "My First Room"
+    # Every command can keep schedules in a SQLite database instead of yaml files, also set with EDA_APP_STORAGE=sqlite
+
+    > eda-app schedule edit --storage journal "My Schedule" create-room "My First Room"
+    # Appends the edit to "My Schedule.journal" instead of rewriting the whole yaml file
+
+    > eda-app schedule compact "My Schedule"
+    # Folds the journal back into the yaml file, which also happens on its own every 1000 records
+
+    > eda-app --profile schedule edit "My Schedule" create-room "My First Room"
+    # Runs the command as usual and prints how long loading, validating, the command itself, rendering and saving took, add --profile-output edit.prof to also keep cProfile stats
     ```
 """
 
 from .app import main
-import cli.create  # noqa  registers the commands to create schedules
-import cli.edit  # noqa  registers the commands to edit schedules
-import cli.view  # noqa  registers the commands to view schedules
 
+# the commands live in cli.create, cli.edit, cli.view, cli.check, cli.compact,
+# cli.shell, cli.assign, cli.catalog, cli.validate and cli.stats, which are only imported
+# once they are run, see cli.app.LazyGroup
 __all__ = [
     "main",
-    "create",
-    "edit",
-    "view",
 ]
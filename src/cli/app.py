@@ -1,15 +1,88 @@
+import importlib
+
 import click
 
+from lib import profiling
+
+
+class LazyGroup(click.Group):
+    """
+    Group whose subcommands are imported from their modules only once they are
+    looked up, so a command doesn't pay for importing every other command.
+
+    `lazy_subcommands` maps command names to `"module:attribute"` paths.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 @click.group()
-def main():
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print how long loading, validating, the command, rendering and saving took.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Also write cProfile stats of the command to this file, see python -m pstats.",
+)
+@click.pass_context
+def main(ctx: click.Context, profile: bool, profile_output: str | None):
     """
     CLI that allows you to edit a global schedule files and view them.
     """
-    pass
+    if not (profile or profile_output):
+        return
+
+    profiler = None
+    if profile_output:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    profiling.start()
+    if profiler is not None:
+        profiler.enable()
+
+    def report():
+        # runs once the command is done, even if it failed
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_output)
+        click.echo(profiling.format_timings(profiling.stop()), err=True)
+        if profile_output:
+            click.echo(f"Wrote cProfile stats to {profile_output}.", err=True)
+
+    ctx.call_on_close(report)
 
 
-@main.group()
+@main.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "cli.create:create_schedule",
+        "edit": "cli.edit:edit_schedule",
+        "view": "cli.view:view_schedule",
+        "check": "cli.check:check_schedule",
+        "compact": "cli.compact:compact_schedule",
+        "shell": "cli.shell:shell_schedule",
+        "assign": "cli.assign:assign_schedule",
+        "list": "cli.catalog:list_schedules",
+        "validate-all": "cli.validate:validate_all",
+        "stats": "cli.stats:stats_schedule",
+    },
+)
 def schedule():
     """
     Commands related to schedule management
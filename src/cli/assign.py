@@ -0,0 +1,86 @@
+import os
+import click
+
+from lib.assignment import assign_lessons
+from lib.lesson_files import (
+    LESSON_FILE_FORMATS,
+    guess_lesson_file_format,
+    read_lessons,
+)
+from .stores import no_cache_option, open_schedule_store, storage_option
+
+
+@click.command("assign")  # python -m cli schedule assign "Name" -f lessons.csv
+@click.argument("name", type=click.STRING)
+@click.option(
+    "-f",
+    "--file",
+    "lessons_file",
+    type=click.File("r"),
+    required=True,
+    help="CSV or JSONL file of the lessons to place.",
+)
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(LESSON_FILE_FORMATS),
+    help="Format of the lessons file, guessed from its extension by default.",
+)
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+        writable=True,
+    ),
+    help="Directory schedule was saved to.",
+    default=os.getcwd(),
+)
+@storage_option()
+@no_cache_option()
+@click.pass_context
+def assign_schedule(
+    ctx: click.Context,
+    name: str,
+    lessons_file,
+    file_format: str | None,
+    directory: str,
+    backend: str,
+    no_cache: bool,
+):
+    """
+    Places lessons in whichever rooms of the schedule they fit, listing any that fit nowhere
+    """
+    store = open_schedule_store(name, backend, directory, no_cache)
+
+    file_format = file_format or guess_lesson_file_format(lessons_file.name)
+    if file_format is None:
+        raise click.ClickException(
+            f"Could not tell the format of {lessons_file.name!r}, pass it with --format."
+        )
+    try:
+        lessons = read_lessons(lessons_file, file_format)
+    except ValueError as err:
+        raise click.ClickException(f"Invalid lessons file:\n{err}")
+
+    schedule = store.load(name)
+    try:
+        assigned, unplaced = assign_lessons(schedule, lessons)
+    except ValueError as err:
+        raise click.ClickException(err)
+
+    if schedule.is_dirty:
+        click.echo("Saving schedule...")
+        store.save(name, schedule)
+    placed_count = sum(len(room_lessons) for room_lessons in assigned.values())
+    click.echo(f"Assigned {placed_count} lesson(s) to {len(assigned)} room(s).")
+    for lesson in unplaced:
+        days = ", ".join(day.value for day in lesson.days)
+        click.echo(
+            f"No room is free for {lesson.name!r}"
+            f" ({days} {lesson.start:%H:%M}-{lesson.end:%H:%M})."
+        )
+    if unplaced:
+        ctx.exit(1)
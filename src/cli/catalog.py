@@ -0,0 +1,82 @@
+from datetime import datetime
+import json
+import os
+import click
+import tabulate
+
+from lib import storage
+from .stores import no_cache_option, open_store, storage_option
+
+
+@click.command("list")  # python -m cli schedule list -d "path/to/dir"
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    help="Directory schedules were saved to.",
+    default=os.getcwd(),
+)
+@storage_option()
+@no_cache_option(
+    help="Parse and validate changed schedule files even if they are cached.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the catalog entries as JSON instead of a table.",
+)
+def list_schedules(directory: str, backend: str, no_cache: bool, as_json: bool):
+    """
+    Lists the schedules in the directory with how many rooms and lessons they have
+    """
+    directory = directory or os.getcwd()
+    store = open_store(backend, directory, no_cache)
+    if not isinstance(store, storage.YamlStore):
+        raise click.ClickException(
+            f"Listing only works for schedule files, not {backend} storage."
+        )
+
+    try:
+        entries, _ = storage.Catalog(directory).refresh(store)
+    except OSError as err:
+        raise click.ClickException(f"Could not update the schedule catalog: {err}")
+
+    if as_json:
+        click.echo(
+            json.dumps([entry.model_dump(mode="json") for entry in entries], indent=2)
+        )
+        return
+    if not entries:
+        click.echo("No schedules found.")
+        return
+
+    loaded = [entry for entry in entries if entry.error is None]
+    if loaded:
+        click.echo(
+            tabulate.tabulate(
+                [
+                    [
+                        entry.name,
+                        entry.rooms,
+                        entry.lessons,
+                        entry.size,
+                        datetime.fromtimestamp(entry.mtime_ns / 1e9).strftime(
+                            "%Y-%m-%d %H:%M"
+                        ),
+                    ]
+                    for entry in loaded
+                ],
+                headers=["name", "rooms", "lessons", "bytes", "modified"],
+                tablefmt="rounded_grid",
+            )
+        )
+    for entry in entries:
+        if entry.error is not None:
+            # validation errors run over several lines, the first says enough
+            error = entry.error.splitlines()[0]
+            click.echo(f"Could not load {entry.name!r}: {error}", err=True)
@@ -0,0 +1,44 @@
+import json
+import os
+import click
+
+from lib import profiling
+from .stores import no_cache_option, open_schedule_store, storage_option
+
+
+@click.command("check")  # python -m cli schedule check "Name" -d "path/to/dir"
+@click.argument("name", type=click.STRING)
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    help="Directory schedule was saved to.",
+    default=os.getcwd(),
+)
+@storage_option()
+@no_cache_option()
+@click.pass_context
+def check_schedule(
+    ctx: click.Context, name: str, directory: str, backend: str, no_cache: bool
+):
+    """
+    Checks every room of the schedule for overlapping lessons and prints a JSON report
+    """
+    store = open_schedule_store(name, backend, directory, no_cache)
+
+    conflicts = store.load(name).find_conflicts()
+
+    with profiling.phase("render"):
+        report = {
+            "schedule": name,
+            "conflict_count": len(conflicts),
+            "conflicts": [conflict.model_dump(mode="json") for conflict in conflicts],
+        }
+        text = json.dumps(report, indent=2)
+    click.echo(text)
+    if conflicts:
+        ctx.exit(1)
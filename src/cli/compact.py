@@ -0,0 +1,28 @@
+import os
+import click
+
+from .stores import open_schedule_store, storage_option
+
+
+@click.command("compact")  # python -m cli schedule compact "Name" -d "path/to/dir"
+@click.argument("name", type=click.STRING)
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    help="Directory schedule was saved to.",
+    default=os.getcwd(),
+)
+@storage_option()
+def compact_schedule(name: str, directory: str, backend: str):
+    """
+    Folds the schedule's journal of saved edits back into the schedule file
+    """
+    store = open_schedule_store(name, backend, directory, no_cache=True)
+
+    count = store.compact(name)
+    click.echo(f"Compacted {count} journal record(s).")
@@ -1,12 +1,10 @@
-import os
 import click
-import yaml
 
 from lib.schedule import Schedule
-from .app import schedule
+from .stores import open_store, storage_option
 
 
-@schedule.command("create")  # python -m cli schedule view "Name" -d "path/to/dir"
+@click.command("create")  # python -m cli schedule view "Name" -d "path/to/dir"
 @click.argument(
     "name",
     type=click.STRING,
@@ -22,23 +20,21 @@ from .app import schedule
     ),
     help="Directory to save schedule to.",
 )
+@storage_option()
 def create_schedule(
     name: str,
     directory: str | None,
+    backend: str,
 ):
     """
     Create a new schedule and saves it to the file.
     """
-    directory = directory or os.getcwd()
-    path = os.path.join(directory, f"{name}.yaml")
-    if os.path.exists(path):
+    store = open_store(backend, directory, no_cache=True)
+    if store.exists(name):
         raise click.ClickException(f"Schedule with name {name!r} already exists.")
     if name.strip() == "":
         raise click.ClickException(
             "Schedule name cannot be empty or only contain spaces."
         )
 
-    with open(path, "w") as f:
-        schedule_instance = Schedule(rooms=[])
-        schedule_dict = schedule_instance.model_dump(mode="json")
-        yaml.safe_dump(schedule_dict, f)
+    store.create(name, Schedule(rooms=[]))
@@ -1,13 +1,19 @@
 from datetime import datetime
+import json
 import os
 import click
-import yaml
 
-from lib.schedule import Day, Lesson, RoomSchedule, Schedule
-from .app import schedule
+from lib.lesson_files import (
+    LESSON_FILE_FORMATS,
+    guess_lesson_file_format,
+    read_lessons,
+)
+from lib.schedule import Day, Lesson, LessonConflictError, RoomSchedule, Schedule
+from .lookup import find_lesson, find_room
+from .stores import no_cache_option, open_schedule_store, storage_option
 
 
-@schedule.group("edit")
+@click.group("edit")
 @click.argument("name", type=click.STRING)
 @click.option(
     "-d",
@@ -21,28 +27,36 @@ from .app import schedule
     help="Directory schedule was saved to.",
     default=os.getcwd(),
 )
+@storage_option()
+@no_cache_option()
 @click.pass_context
-def edit_schedule(ctx: click.Context, name: str, directory: str | None):
+def edit_schedule(
+    ctx: click.Context,
+    name: str,
+    directory: str | None,
+    backend: str,
+    no_cache: bool,
+):
     """
     Commands related to editing a schedule
     """
-    directory = directory or os.getcwd()
-    path = os.path.join(directory, f"{name}.yaml")
-    if not os.path.exists(path):
-        raise click.ClickException(f"Schedule with name {name!r} does not exist.")
+    store = open_schedule_store(name, backend, directory, no_cache)
 
-    with open(path, "r") as f:
-        schedule_dict = yaml.safe_load(f)
     ctx.obj = {
-        "schedule": Schedule.model_validate(schedule_dict),
+        "schedule": store.load(name),
+        "store": store,
+        "name": name,
     }
 
-    @ctx.call_on_close
-    def save_schedule():
-        with open(path, "w") as f:
-            schedule_dict = ctx.obj["schedule"].model_dump(mode="json")
-            print("Saving schedule...")
-            yaml.safe_dump(schedule_dict, f)
+
+@edit_schedule.result_callback()
+@click.pass_context
+def save_schedule(ctx: click.Context, *args, **kwargs):
+    # only runs once the subcommand succeeded, and skips schedules it didn't change
+    _schedule: Schedule = ctx.obj["schedule"]
+    if _schedule.is_dirty:
+        print("Saving schedule...")
+        ctx.obj["store"].save(ctx.obj["name"], _schedule)
 
 
 @edit_schedule.command(
@@ -78,18 +92,13 @@ def remove_room(ctx: click.Context, room_name: str):
     Removes a room from the schedule
     """
     _schedule: Schedule = ctx.obj.get("schedule")
-    room_id = None
-    for room in _schedule.rooms:
-        if room.name == room_name:
-            room_id = room.id
-            break
-
-    if room_id is None:
+    room = find_room(_schedule, room_name)
+    if room is None:
         click.echo(f"Room with name {room_name!r} does not exist.")
         return
 
     try:
-        _schedule.remove_room(room_id)
+        _schedule.remove_room(room.id)
         click.echo("Room removed successfully.")
     except ValueError as err:
         raise click.ClickException(err)
@@ -104,12 +113,8 @@ def room_group(ctx: click.Context, room_name: str):
     """
     Commands related to editing a room
     """
-    existing_room = None
     _schedule = ctx.obj.get("schedule")
-    for room in _schedule.rooms:
-        if room.name == room_name:
-            existing_room = room
-            break
+    existing_room = find_room(_schedule, room_name)
     if existing_room is None:
         raise click.ClickException(f"Room with name {room_name!r} does not exist.")
 
@@ -130,7 +135,6 @@ def add_lesson(
     """
     Adds a lesson to the room
     """
-    # TODO(Kathy): Add checking for if there is multiple lessons of the same name, that we remove the correct lesson
     room = ctx.obj.get("room")
     try:
         room.add_lesson(
@@ -141,6 +145,46 @@ def add_lesson(
         raise click.ClickException(err)
 
 
+@room_group.command(
+    "import-lessons"
+)  # python -m cli schedule edit "Schedule Name" room "Room Name" import-lessons lessons.csv
+@click.argument("lessons_file", type=click.File("r"))
+@click.option(
+    "-f",
+    "--format",
+    "file_format",
+    type=click.Choice(LESSON_FILE_FORMATS),
+    help="Format of the lessons file, guessed from its extension by default.",
+)
+@click.pass_context
+def import_lessons(ctx: click.Context, lessons_file, file_format: str | None):
+    """
+    Adds all lessons from a CSV or JSONL file to the room in one go
+    """
+    room: RoomSchedule = ctx.obj.get("room")
+    file_format = file_format or guess_lesson_file_format(lessons_file.name)
+    if file_format is None:
+        raise click.ClickException(
+            f"Could not tell the format of {lessons_file.name!r}, pass it with --format."
+        )
+
+    try:
+        lessons = read_lessons(lessons_file, file_format)
+    except ValueError as err:
+        raise click.ClickException(f"Invalid lessons file:\n{err}")
+
+    try:
+        room.add_lessons(lessons)
+    except LessonConflictError as err:
+        for day, first, second in err.conflicts:
+            click.echo(
+                f"{day.value}: {first.name!r} ({first.start:%H:%M}-{first.end:%H:%M})"
+                f" overlaps {second.name!r} ({second.start:%H:%M}-{second.end:%H:%M})"
+            )
+        raise click.ClickException(f"{err}, no lessons were imported.")
+    click.echo(f"Imported {len(lessons)} lesson(s) successfully.")
+
+
 @room_group.command(
     "remove-lesson"
 )  # python -m cli schedule edit "Schedule Name" room "Room Name" remove-lesson "Lesson Name"
@@ -151,18 +195,13 @@ def remove_lesson(ctx: click.Context, lesson_name: str):
     Removes a lesson from the room
     """
     room: RoomSchedule = ctx.obj.get("room")
-    lesson_id = None
-    for lesson in room.lessons:
-        if lesson.name == lesson_name:
-            lesson_id = lesson.id
-            break
-
-    if lesson_id is None:
+    lesson = find_lesson(room, lesson_name)
+    if lesson is None:
         click.echo(f"Lesson with name {lesson_name!r} does not exist.")
         return
 
     try:
-        room.remove_lesson(lesson_id)
+        room.remove_lesson(lesson.id)
         click.echo("Lesson removed successfully.")
     except ValueError as err:
         raise click.ClickException(err)
@@ -188,18 +227,10 @@ def edit_lesson(
     """
     Commands related to editing a lesson
     """
-    existing_lesson = None
     room: RoomSchedule = ctx.obj.get("room")
-    for lesson in room.lessons:
-        if lesson.name == lesson_name:
-            existing_lesson = lesson
-            break
+    existing_lesson = find_lesson(room, lesson_name)
     if existing_lesson is None:
         raise click.ClickException(f"Lesson with name {lesson_name!r} does not exist.")
-    if days:
-        existing_lesson.days = [day for day in days]
-    if name:
-        existing_lesson.name = name
     start = None if start is None else start.time()
     end = None if end is None else end.time()
     if start and end:
@@ -207,13 +238,108 @@ def edit_lesson(
             raise click.ClickException(f"Start time must be before end time.")
         elif start == end:
             raise click.ClickException("Start and end times must be different.")
-        existing_lesson.start = start
-        existing_lesson.end = end
     elif start:
         if start > existing_lesson.end:
             raise click.ClickException(f"Start time must be before end time.")
-        existing_lesson.start = start
     elif end:
         if end < existing_lesson.start:
             raise click.ClickException("End time must be after start time.")
-        existing_lesson.end = end
+
+    try:
+        room.update_lesson(
+            existing_lesson.id, days=days, start=start, end=end, name=name or None
+        )
+    except ValueError as err:
+        raise click.ClickException(err)
+
+
+# lesson fields passed on to the options of add-lesson and lesson
+LESSON_OPTIONS = ["days", "start", "end", "name"]
+
+
+def batch_operation_args(operation: dict | list) -> list[str]:
+    """
+    Turns one batch operation into the arguments of the edit subcommand it
+    runs. Operations are either those arguments as a list, or an object with
+    an "op" (create-room, remove-room, add-lesson, remove-lesson or lesson),
+    the "room" and "lesson" it targets and the lesson fields to set.
+    """
+    if isinstance(operation, list):
+        args = [str(arg) for arg in operation]
+        if not args:
+            raise ValueError("Operation must not be an empty list.")
+        if args[0] == "batch":
+            raise ValueError("Batches cannot be nested.")
+        # a batch run from the schedule shell could otherwise save or exit
+        if args[0] not in edit_schedule.commands:
+            raise ValueError(
+                f"Only edit operations can run in a batch, not {args[0]!r}."
+            )
+        return args
+    if not isinstance(operation, dict):
+        raise ValueError("Operation must be an object or a list of arguments.")
+
+    op = operation.get("op")
+    if op == "create-room":
+        return ["create-room", operation["name"]]
+    if op == "remove-room":
+        return ["remove-room", operation["room"]]
+    if op not in ("add-lesson", "remove-lesson", "lesson"):
+        raise ValueError(f"Unknown operation {op!r}.")
+
+    args = ["room", operation["room"], op]
+    if op != "add-lesson":
+        args.append(operation["lesson"])
+    if op != "remove-lesson":
+        for key in LESSON_OPTIONS:
+            values = operation.get(key)
+            if values is None:
+                continue
+            for value in values if key == "days" else [values]:
+                args.extend([f"--{key}", str(value)])
+    return args
+
+
+@edit_schedule.command(
+    "batch"
+)  # python -m cli schedule edit "Schedule Name" batch -f ops.jsonl
+@click.option(
+    "-f",
+    "--file",
+    "operations_file",
+    type=click.File("r"),
+    default="-",
+    help="JSONL file with one operation per line, read from stdin by default.",
+)
+@click.pass_context
+def batch(ctx: click.Context, operations_file):
+    """
+    Applies every operation in a JSONL file, saving only if all of them succeed
+    """
+    count = 0
+    for line_number, line in enumerate(operations_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            args = batch_operation_args(json.loads(line))
+        except (ValueError, KeyError) as err:
+            raise click.ClickException(
+                f"Invalid operation on line {line_number}: {err}"
+            )
+
+        try:
+            # the edit commands, even when the parent is the shell's group
+            command_name, command, command_args = edit_schedule.resolve_command(
+                ctx.parent, args
+            )
+            with command.make_context(
+                command_name, command_args, parent=ctx.parent
+            ) as command_ctx:
+                command.invoke(command_ctx)
+        except click.ClickException as err:
+            raise click.ClickException(
+                f"Operation on line {line_number} failed, nothing was saved: "
+                f"{err.format_message()}"
+            )
+        count += 1
+    click.echo(f"Applied {count} operation(s).")
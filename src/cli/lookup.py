@@ -0,0 +1,25 @@
+import click
+
+from lib.schedule import Lesson, RoomSchedule, Schedule
+
+
+def find_room(schedule: Schedule, room_name: str) -> RoomSchedule | None:
+    """
+    Finds the first room with the name, or the room with that id
+    """
+    rooms = schedule.rooms_named(room_name)
+    return rooms[0] if rooms else schedule.get_room(room_name)
+
+
+def find_lesson(room: RoomSchedule, lesson_name: str) -> Lesson | None:
+    """
+    Finds a lesson by name, or by id so lessons sharing a name can still be picked
+    """
+    lessons = room.lessons_named(lesson_name)
+    if len(lessons) > 1:
+        ids = ", ".join(lesson.id for lesson in lessons)
+        raise click.ClickException(
+            f"There are {len(lessons)} lessons named {lesson_name!r}, "
+            f"use one of their ids instead: {ids}"
+        )
+    return lessons[0] if lessons else room.get_lesson(lesson_name)
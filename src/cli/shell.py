@@ -0,0 +1,134 @@
+from contextlib import suppress
+import os
+import shlex
+import click
+
+from lib.schedule import Schedule
+from .edit import edit_schedule
+from .stores import no_cache_option, open_schedule_store, storage_option
+from .view import echo_schedule, free_group, view_room
+
+with suppress(ImportError):
+    import readline  # noqa  gives input() line editing and history
+
+
+@click.group("shell", invoke_without_command=True)
+@click.pass_context
+def shell_commands(ctx: click.Context):
+    """
+    Edits and views the loaded schedule. Type exit to save and leave, or
+    exit --discard to leave without saving.
+    """
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+for command_name, command in edit_schedule.commands.items():
+    shell_commands.add_command(command, command_name)
+
+
+@shell_commands.group("view", invoke_without_command=True)
+@click.pass_context
+def shell_view(ctx: click.Context):
+    """
+    Prints out the schedule, or one of its rooms
+    """
+    if ctx.invoked_subcommand is None:
+        echo_schedule(ctx.obj["schedule"])
+
+
+shell_view.add_command(view_room)
+shell_view.add_command(free_group)
+
+
+@shell_commands.command("save")
+@click.pass_context
+def save(ctx: click.Context):
+    """
+    Saves the changes made so far
+    """
+    save_changes(ctx.obj)
+
+
+def save_changes(obj: dict):
+    _schedule: Schedule = obj["schedule"]
+    if not _schedule.is_dirty:
+        click.echo("Nothing to save.")
+        return
+    click.echo("Saving schedule...")
+    obj["store"].save(obj["name"], _schedule)
+
+
+def restore_schedule(data: dict, changes: list[tuple[str, str, str | None]]):
+    schedule = Schedule.model_validate(data)
+    # the edits made before the batch are still unsaved
+    schedule._changes.extend(changes)
+    return schedule
+
+
+def run_command(obj: dict, args: list[str]):
+    backup = None
+    if args[0] == "batch":
+        # a failed batch must not leave half of its edits behind. The backup is
+        # a dump validated again on restore, a copy of the models would keep
+        # neither the indexes nor the rooms' links to their schedule intact
+        backup = obj["schedule"].model_dump(), obj["schedule"].changes
+    try:
+        shell_commands.main(args, prog_name="", standalone_mode=False, obj=obj)
+    except click.ClickException as err:
+        if backup is not None:
+            obj["schedule"] = restore_schedule(*backup)
+        err.show()
+    except click.Abort:
+        click.echo("Aborted.")
+
+
+@click.command("shell")  # python -m cli schedule shell "Name" -d "path/to/dir"
+@click.argument("name", type=click.STRING)
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+        writable=True,
+    ),
+    help="Directory schedule was saved to.",
+    default=os.getcwd(),
+)
+@storage_option()
+@no_cache_option()
+def shell_schedule(name: str, directory: str, backend: str, no_cache: bool):
+    """
+    Loads the schedule once and runs edit and view commands on it until exit
+    """
+    store = open_schedule_store(name, backend, directory, no_cache)
+
+    obj = {
+        "schedule": store.load(name),
+        "store": store,
+        "name": name,
+    }
+    click.echo(f"Editing {name!r}, type help for the commands.")
+    while True:
+        try:
+            line = input(f"{name}> ")
+        except EOFError:
+            click.echo()
+            break
+        try:
+            args = shlex.split(line)
+        except ValueError as err:
+            click.echo(f"Error: {err}")
+            continue
+
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            if "--discard" in args[1:]:
+                return
+            break
+        run_command(obj, ["--help"] if args == ["help"] else args)
+
+    save_changes(obj)
@@ -0,0 +1,145 @@
+from datetime import datetime, time
+import json
+import os
+import click
+import tabulate
+
+from lib import profiling
+from lib.stats import DAYS, HOURS, ScheduleStats, schedule_stats
+from .stores import no_cache_option, open_schedule_store, storage_option
+
+
+@click.command("stats")  # python -m cli schedule stats "Name" -d "path/to/dir"
+@click.argument("name", type=click.STRING)
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    help="Directory schedule was saved to.",
+    default=os.getcwd(),
+)
+@storage_option()
+@no_cache_option()
+@click.option(
+    "--from",
+    "from_time",
+    type=click.DateTime(["%H:%M"]),
+    default="00:00",
+    help="Start of the part of each day that counts.",
+)
+@click.option(
+    "--to",
+    "to_time",
+    type=click.DateTime(["%H:%M"]),
+    help="End of the part of each day that counts, midnight at its end by default.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the numbers as JSON instead of tables.",
+)
+def stats_schedule(
+    name: str,
+    directory: str,
+    backend: str,
+    no_cache: bool,
+    from_time: datetime,
+    to_time: datetime | None,
+    as_json: bool,
+):
+    """
+    Prints how busy every room is on each day and hour, and the idle time between lessons
+    """
+    # without --to the last minute of the day counts too, 23:59 would leave it out
+    end = time.max if to_time is None else to_time.time()
+    if from_time.time() > end:
+        raise click.BadParameter("must not be before --from.", param_hint="'--to'")
+    store = open_schedule_store(name, backend, directory, no_cache)
+
+    stats = schedule_stats(store.load(name), from_time.time(), end)
+
+    with profiling.phase("render"):
+        if as_json:
+            text = json.dumps({"schedule": name, **stats.to_dict()}, indent=2)
+        else:
+            text = tabulate_stats(stats)
+    click.echo(text)
+
+
+def _percent(share: float) -> str:
+    return f"{share * 100:.0f}%"
+
+
+def tabulate_stats(stats: ScheduleStats) -> str:
+    if not stats.room_ids:
+        return "The schedule has no rooms."
+
+    utilization = stats.utilization
+    busy = tabulate.tabulate(
+        [
+            [
+                room_name,
+                *stats.busy_minutes[index],
+                stats.busy_minutes[index].sum(),
+                _percent(utilization[index]),
+            ]
+            for index, room_name in enumerate(stats.room_names)
+        ],
+        headers=[
+            "Room",
+            *(day.value.capitalize() for day in DAYS),
+            "Total",
+            "Used",
+        ],
+        tablefmt="rounded_grid",
+    )
+
+    # only the hours of the window, a whole day of empty rows says nothing
+    first_hour = stats.window[0] // 60
+    last_hour = min(max(stats.window[1] - 1, stats.window[0]) // 60, HOURS - 1)
+    heatmap = stats.heatmap
+    hourly = tabulate.tabulate(
+        [
+            [
+                f"{hour:02}:00",
+                *(_percent(heatmap[day_index, hour]) for day_index in range(len(DAYS))),
+            ]
+            for hour in range(first_hour, last_hour + 1)
+        ],
+        headers=["Hour", *(day.value.capitalize() for day in DAYS)],
+        tablefmt="rounded_grid",
+    )
+
+    peaks = ", ".join(
+        f"{day.value.capitalize()} {hour:02}:00"
+        for day, hour in stats.peak_hours().items()
+        if hour is not None
+    )
+
+    idle = tabulate.tabulate(
+        [
+            [
+                room_name,
+                stats.idle_gaps[index].sum(),
+                stats.idle_minutes[index].sum(),
+                stats.longest_idle[index].max(),
+            ]
+            for index, room_name in enumerate(stats.room_names)
+        ],
+        headers=["Room", "Gaps", "Idle minutes", "Longest gap"],
+        tablefmt="rounded_grid",
+    )
+
+    return "\n\n".join(
+        [
+            f"Busy minutes per day:\n{busy}",
+            f"Rooms in use by hour:\n{hourly}",
+            f"Peak hours: {peaks or 'none, the schedule has no lessons'}",
+            f"Idle time between lessons:\n{idle}",
+        ]
+    )
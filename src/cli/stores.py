@@ -0,0 +1,44 @@
+import os
+import click
+
+from lib import storage
+
+
+def storage_option():
+    return click.option(
+        "--storage",
+        "backend",
+        type=click.Choice(list(storage.STORAGE_BACKENDS)),
+        default="yaml",
+        envvar="EDA_APP_STORAGE",
+        show_default=True,
+        help="How schedules are stored in the directory.",
+    )
+
+
+def no_cache_option(
+    help: str = "Parse and validate the schedule file even if it has not changed.",
+):
+    return click.option("--no-cache", is_flag=True, help=help)
+
+
+def open_store(
+    backend: str, directory: str | None, no_cache: bool = False
+) -> storage.ScheduleStore:
+    """
+    The store of the backend for the directory, the working directory if None
+    """
+    cache = None if no_cache else storage.ParseCache()
+    return storage.get_store(backend, directory or os.getcwd(), cache=cache)
+
+
+def open_schedule_store(
+    name: str, backend: str, directory: str | None, no_cache: bool = False
+) -> storage.ScheduleStore:
+    """
+    Like `open_store`, but fails the command if the schedule isn't in the store
+    """
+    store = open_store(backend, directory, no_cache)
+    if not store.exists(name):
+        raise click.ClickException(f"Schedule with name {name!r} does not exist.")
+    return store
@@ -0,0 +1,65 @@
+from typing import Iterator
+
+# lesson tables always have these columns, see view.tabulate_room_schedule
+LESSON_HEADERS = ["id", "name", "days", "start", "end"]
+
+
+def _is_plain(cell: str) -> bool:
+    # one terminal column per character and nothing tabulate would strip
+    return cell.isascii() and cell.isprintable() and cell == cell.strip()
+
+
+def _is_number(cell: str) -> bool:
+    # tabulate reads these as booleans, which pick a column type along with
+    # the numbers around them
+    if cell in ("True", "False"):
+        return True
+    try:
+        float(cell)
+    except ValueError:
+        return False
+    return True
+
+
+def _rule(widths: list[int], left: str, middle: str, right: str) -> str:
+    return left + middle.join("─" * (width + 2) for width in widths) + right
+
+
+def iter_lesson_table(rows: list[list[str]]) -> Iterator[str] | None:
+    """
+    Yields the lines of the rows as a rounded_grid table, exactly as
+    tabulate.tabulate would lay them out under LESSON_HEADERS.
+
+    Column widths are measured in one pass and every row is then filled into
+    the same format string. Returns None for rows tabulate treats specially,
+    such as non-ASCII or padded text and columns it reads as numbers, so the
+    caller can hand those to tabulate instead.
+    """
+    # tabulate pads every header with at least two spaces
+    widths = [len(header) + 2 for header in LESSON_HEADERS]
+    # columns are numbers to tabulate if all of their non-empty cells are
+    maybe_numbers = [True] * len(LESSON_HEADERS)
+    for row in rows:
+        for column, cell in enumerate(row):
+            if not _is_plain(cell):
+                return None
+            if len(cell) > widths[column]:
+                widths[column] = len(cell)
+            if maybe_numbers[column] and cell and not _is_number(cell):
+                maybe_numbers[column] = False
+    if rows and any(maybe_numbers):
+        return None
+    return _lesson_table_lines(rows, widths)
+
+
+def _lesson_table_lines(rows: list[list[str]], widths: list[int]) -> Iterator[str]:
+    row_format = "│ " + " │ ".join(f"{{:<{width}}}" for width in widths) + " │"
+    separator = _rule(widths, "├", "┼", "┤")
+    yield _rule(widths, "╭", "┬", "╮")
+    yield row_format.format(*LESSON_HEADERS)
+    yield separator
+    for index, row in enumerate(rows):
+        if index:
+            yield separator
+        yield row_format.format(*row)
+    yield _rule(widths, "╰", "┴", "╯")
@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import click
+
+from lib import storage
+from lib.validation import ValidationResult, validate_schedule_file
+
+
+@click.command(
+    "validate-all"
+)  # python -m cli schedule validate-all -d "path/to/dir" --jobs 8
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    help="Directory schedules were saved to.",
+    default=os.getcwd(),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="How many schedules to validate at once, one per CPU by default.",
+)
+@click.pass_context
+def validate_all(ctx: click.Context, directory: str, jobs: int | None):
+    """
+    Validates every schedule file in the directory and checks it for overlapping lessons
+    """
+    directory = directory or os.getcwd()
+    names = storage.YamlStore(directory).names()
+    jobs = min(jobs or os.cpu_count() or 1, max(len(names), 1))
+
+    results: list[ValidationResult] = []
+    if jobs == 1:
+        for name in names:
+            results.append(validate_schedule_file(directory, name))
+            echo_result(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(validate_schedule_file, directory, name)
+                for name in names
+            ]
+            # reported in the order they finish, big files don't hold up the rest
+            for future in as_completed(futures):
+                results.append(future.result())
+                echo_result(results[-1])
+
+    invalid = sum(result.error is not None for result in results)
+    conflicting = sum(bool(result.conflicts) for result in results)
+    click.echo(
+        f"Checked {len(results)} schedule(s): {len(results) - invalid - conflicting}"
+        f" valid, {invalid} invalid, {conflicting} with overlapping lessons."
+    )
+    if invalid or conflicting:
+        ctx.exit(1)
+
+
+def echo_result(result: ValidationResult):
+    if result.error is not None:
+        click.echo(f"invalid   {result.name}")
+        for line in result.error.splitlines():
+            click.echo(f"    {line}")
+    elif result.conflicts:
+        click.echo(
+            f"conflicts {result.name}: {len(result.conflicts)} overlapping lesson(s)"
+        )
+        for conflict in result.conflicts:
+            first, second = conflict.first, conflict.second
+            click.echo(
+                f"    {conflict.room_name} {conflict.day.value}:"
+                f" {first.name!r} ({first.start:%H:%M}-{first.end:%H:%M})"
+                f" overlaps {second.name!r} ({second.start:%H:%M}-{second.end:%H:%M})"
+            )
+    else:
+        click.echo(f"ok        {result.name}")
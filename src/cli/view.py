@@ -1,13 +1,18 @@
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 import os
 import click
 import tabulate
-import yaml
 
-from lib.schedule import Schedule, RoomSchedule
-from .app import schedule
+from lib import profiling, storage
+from lib.schedule import Day, FreeSlot, Schedule, RoomSchedule
+from .lookup import find_room
+from .stores import no_cache_option, open_schedule_store, storage_option
+from .table import LESSON_HEADERS, iter_lesson_table
 
 
-@schedule.group("view", invoke_without_command=True)
+@click.group("view", invoke_without_command=True)
 @click.argument("name", type=click.STRING)
 @click.option(
     "-d",
@@ -21,75 +26,296 @@ from .app import schedule
     help="Directory schedule was saved to.",
     default=os.getcwd(),
 )
+@storage_option()
+@no_cache_option()
+@click.option(
+    "--page",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Which page of rooms to show, with --limit rooms per page.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    help="How many rooms to show per page, all of them by default.",
+)
+@click.option(
+    "--pager",
+    is_flag=True,
+    help="Show the schedule through a pager like less.",
+)
+@click.option(
+    "--renderer",
+    type=click.Choice(["tabulate", "fast"]),
+    default="tabulate",
+    show_default=True,
+    help="How to draw lesson tables, fast gives the same tables quicker.",
+)
 @click.pass_context
 def view_schedule(
     ctx: click.Context,
     name: str,
     directory: str,
+    backend: str,
+    no_cache: bool,
+    page: int,
+    limit: int | None,
+    pager: bool,
+    renderer: str,
 ):
     """
     Command relating to viewing the schedule
     """
-    directory = directory or os.getcwd()
-    path = os.path.join(directory, f"{name}.yaml")
-    if not os.path.exists(path):
-        raise click.ClickException(f"Schedule with name {name!r} does not exist.")
+    store = open_schedule_store(name, backend, directory, no_cache)
 
-    with open(path, "r") as f:
-        schedule_dict = yaml.safe_load(f)
+    # subcommands load just the part of the schedule they show, unless it is
+    # already loaded like in the schedule shell
     ctx.obj = {
-        "schedule": Schedule.model_validate(schedule_dict),
+        "store": store,
+        "name": name,
+        "renderer": renderer,
     }
     if ctx.invoked_subcommand is None:
-        click.echo(tabulate_schedule(ctx.obj["schedule"]))
+        if page > 1 and limit is None:
+            raise click.ClickException("--page needs --limit to know the page size.")
+        echo_schedule(
+            store.load(name), page=page, limit=limit, pager=pager, renderer=renderer
+        )
 
 
-def tabulate_schedule(schedule: Schedule):
-    table_schedules = [
-        f"{' ' * 25}{room.name}({room.id})\n{tabulate_room_schedule(room)}"
-        for room in schedule.rooms
+def lesson_rows(room: RoomSchedule) -> list[list[str]]:
+    return [
+        [
+            lesson.id,
+            lesson.name,
+            ", ".join(lesson.days),
+            lesson.start.strftime("%H:%M"),
+            lesson.end.strftime("%H:%M"),
+        ]
+        for lesson in room.lessons
     ]
-    return "\n********************************\n".join(table_schedules)
+
+
+def tabulate_room_schedule(room: RoomSchedule):
+
+    return tabulate.tabulate(
+        lesson_rows(room),
+        headers=LESSON_HEADERS,
+        tablefmt="rounded_grid",
+        # maxcolwidths=[20, 10, 20, 8, 8],
+    )
+
+
+def tabulate_room_lines(room: RoomSchedule) -> list[str]:
+    return [tabulate_room_schedule(room)]
+
+
+def fast_room_lines(room: RoomSchedule) -> Iterable[str]:
+    """
+    The lines of the room's table, drawn one by one as they are written out
+    """
+    lines = iter_lesson_table(lesson_rows(room))
+    if lines is None:
+        # text the fast renderer can't lay out exactly like tabulate
+        return tabulate_room_lines(room)
+    return lines
+
+
+def fast_room_schedule(room: RoomSchedule):
+    return "\n".join(fast_room_lines(room))
+
+
+# renderers give the lines of a room's table
+RENDERERS: dict[str, Callable[[RoomSchedule], Iterable[str]]] = {
+    "tabulate": tabulate_room_lines,
+    "fast": fast_room_lines,
+}
+
+ROOM_SEPARATOR = "\n********************************\n"
+# lines written at once, one write per line is slow on big rooms
+CHUNK_LINES = 1000
+
+
+def echo_schedule(
+    schedule: Schedule,
+    page: int = 1,
+    limit: int | None = None,
+    pager: bool = False,
+    renderer: str = "tabulate",
+):
+    rooms: Iterable[RoomSchedule] = schedule.rooms
+    if limit is not None:
+        first = (page - 1) * limit
+        if page > 1 and first >= len(schedule.rooms):
+            raise click.ClickException(
+                f"Page {page} is empty, the schedule has {len(schedule.rooms)} room(s)."
+            )
+        rooms = islice(schedule.rooms, first, first + limit)
+
+    chunks = tabulate_schedule(rooms, RENDERERS[renderer])
+    if pager:
+        # the pager ends the text with a newline itself
+        click.echo_via_pager(chunks)
+        return
+    for chunk in chunks:
+        click.echo(chunk, nl=False)
+    click.echo()
+
+
+def tabulate_schedule(
+    rooms: Iterable[RoomSchedule],
+    render: Callable[[RoomSchedule], Iterable[str]] = tabulate_room_lines,
+) -> Iterator[str]:
+    """
+    Yields the table of each room in turn, a few lines at a time if the
+    renderer draws them one by one, so no room's whole table has to be held in
+    memory.
+    """
+    for index, room in enumerate(rooms):
+        title = f"{' ' * 25}{room.name}({room.id})"
+        separator = ROOM_SEPARATOR if index else ""
+        with profiling.phase("render"):
+            lines = render(room)
+        yield from chunk_lines(lines, prefix=f"{separator}{title}\n")
+
+
+def chunk_lines(lines: Iterable[str], prefix: str = "") -> Iterator[str]:
+    lines = iter(lines)
+    while True:
+        with profiling.phase("render"):
+            chunk = list(islice(lines, CHUNK_LINES))
+        if not chunk:
+            return
+        yield prefix + "\n".join(chunk)
+        prefix = "\n"
 
 
 @view_schedule.command("room")
 @click.argument("room_name", type=click.STRING)
 @click.pass_context
 def view_room(ctx: click.Context, room_name: str):
-    _schedule: Schedule = ctx.obj.get("schedule")
-    room = None
-    for _room in _schedule.rooms:
-        if _room.name == room_name:
-            room = _room
-            break
-
+    _schedule: Schedule | None = ctx.obj.get("schedule")
+    if _schedule is not None:
+        room = find_room(_schedule, room_name)
+    else:
+        store: storage.ScheduleStore = ctx.obj.get("store")
+        room = store.load_room(ctx.obj.get("name"), room_name)
     if room is None:
         click.echo(f"Room with name {room_name!r} does not exist.")
         return
 
-    click.echo(tabulate_room_schedule(room))
+    render = RENDERERS[ctx.obj.get("renderer", "tabulate")]
+    with profiling.phase("render"):
+        lines = render(room)
+    for chunk in chunk_lines(lines):
+        click.echo(chunk, nl=False)
+    click.echo()
 
 
-def tabulate_room_schedule(room: RoomSchedule):
+def loaded_schedule(ctx: click.Context) -> Schedule:
+    _schedule: Schedule | None = ctx.obj.get("schedule")
+    if _schedule is None:
+        _schedule = ctx.obj["schedule"] = ctx.obj["store"].load(ctx.obj["name"])
+    return _schedule
+
+
+@view_schedule.group("free")
+def free_group():
+    """
+    Commands to find free rooms and free time in a room
+    """
+    pass
+
+
+@free_group.command(
+    "rooms"
+)  # python -m cli schedule view "Schedule Name" free rooms -d monday -s 10:00 -e 11:30
+@click.option("-d", "--days", multiple=True, type=click.Choice(Day), required=True)
+@click.option("-s", "--start", type=click.DateTime(["%H:%M"]), required=True)
+@click.option("-e", "--end", type=click.DateTime(["%H:%M"]), required=True)
+@click.pass_context
+def view_free_rooms(
+    ctx: click.Context, days: list[Day], start: datetime, end: datetime
+):
+    """
+    Lists the rooms where a lesson on the days from start to end would fit
+    """
+    try:
+        rooms = loaded_schedule(ctx).find_free_rooms(days, start.time(), end.time())
+    except ValueError as err:
+        raise click.ClickException(err)
+    if not rooms:
+        click.echo("No rooms are free then.")
+        return
+
+    click.echo(
+        tabulate.tabulate(
+            [[room.id, room.name] for room in rooms],
+            headers=["id", "name"],
+            tablefmt="rounded_grid",
+        )
+    )
+
+
+@free_group.command(
+    "slots"
+)  # python -m cli schedule view "Schedule Name" free slots "Room Name" -m 60
+@click.argument("room_name", type=click.STRING)
+@click.option(
+    "-m",
+    "--minutes",
+    type=click.IntRange(min=1),
+    required=True,
+    help="How long the free time has to be.",
+)
+@click.option("-d", "--days", multiple=True, type=click.Choice(Day))
+@click.option(
+    "--from",
+    "from_time",
+    type=click.DateTime(["%H:%M"]),
+    default="00:00",
+    help="Earliest time to look at each day.",
+)
+@click.option(
+    "--to",
+    "to_time",
+    type=click.DateTime(["%H:%M"]),
+    default="23:59",
+    help="Latest time to look at each day.",
+)
+@click.pass_context
+def view_free_slots(
+    ctx: click.Context,
+    room_name: str,
+    minutes: int,
+    days: list[Day],
+    from_time: datetime,
+    to_time: datetime,
+):
+    """
+    Lists the free time of at least the given length in a room
+    """
+    room = find_room(loaded_schedule(ctx), room_name)
+    if room is None:
+        raise click.ClickException(f"Room with name {room_name!r} does not exist.")
+
+    slots = room.free_slots(
+        timedelta(minutes=minutes), days or None, from_time.time(), to_time.time()
+    )
+    if not slots:
+        click.echo("The room has no free time that long.")
+        return
 
+    click.echo(tabulate_free_slots(slots))
+
+
+def tabulate_free_slots(slots: list[FreeSlot]):
     return tabulate.tabulate(
         [
-            [
-                lesson.id,
-                lesson.name,
-                ", ".join(lesson.days),
-                lesson.start.strftime("%H:%M"),
-                lesson.end.strftime("%H:%M"),
-            ]
-            for lesson in room.lessons
-        ],
-        headers=[
-            "id",
-            "name",
-            "days",
-            "start",
-            "end",
+            [slot.day.value, slot.start.strftime("%H:%M"), slot.end.strftime("%H:%M")]
+            for slot in slots
         ],
+        headers=["day", "start", "end"],
         tablefmt="rounded_grid",
-        # maxcolwidths=[20, 10, 20, 8, 8],
     )
@@ -0,0 +1,92 @@
+from heapq import heappop, heappush
+from typing import Callable
+
+from .intervals import to_seconds
+from .schedule import Day, Lesson, Schedule
+
+
+def _first_free_room(
+    free: dict[Day, set[int]],
+    free_heaps: dict[Day, list[int]],
+    days: set[Day],
+    fits: Callable[[int], bool],
+) -> int | None:
+    # walks the free rooms of the day with the fewest in position order, the
+    # heaps may hold rooms that were taken since, or the same room twice
+    day = min(days, key=lambda day: len(free[day]))
+    heap = free_heaps[day]
+    popped: list[int] = []
+    found = None
+    while heap:
+        position = heappop(heap)
+        if position not in free[day] or popped[-1:] == [position]:
+            continue
+        popped.append(position)
+        if all(position in free[other] for other in days) and fits(position):
+            found = position
+            break
+    for position in popped:
+        heappush(heap, position)
+    return found
+
+
+def assign_lessons(
+    schedule: Schedule, lessons: list[Lesson]
+) -> tuple[dict[str, list[Lesson]], list[Lesson]]:
+    """
+    Adds each lesson to a room of the schedule where it overlaps nothing,
+    returning the lessons added per room id and the lessons no room could take.
+
+    Lessons are placed in start time order, interval partitioning style: each
+    day keeps a min-heap of rooms by the end of the last lesson placed there,
+    and rooms whose last lesson ended before the next one starts are free for
+    it unless one of the room's existing lessons is in the way. A lesson goes
+    to the first room in schedule order that is free on all of its days.
+    """
+    lesson_ids = {lesson.id for lesson in lessons}
+    existing_ids = {lesson.id for room in schedule.rooms for lesson in room.lessons}
+    if len(lesson_ids) < len(lessons) or not lesson_ids.isdisjoint(existing_ids):
+        raise ValueError("Lesson already exists")
+
+    rooms = list(schedule.rooms)
+    # rooms free of newly placed lessons per day, and (end, room) of the rest
+    free: dict[Day, set[int]] = {day: set(range(len(rooms))) for day in Day}
+    free_heaps: dict[Day, list[int]] = {day: list(range(len(rooms))) for day in Day}
+    placed: dict[Day, list[tuple[float, int]]] = {day: [] for day in Day}
+    assigned: dict[str, list[Lesson]] = {}
+    unplaced: list[Lesson] = []
+
+    ordered = sorted(
+        lessons, key=lambda lesson: (to_seconds(lesson.start), to_seconds(lesson.end))
+    )
+    for lesson in ordered:
+        start, end = to_seconds(lesson.start), to_seconds(lesson.end)
+        days = set(lesson.days)
+        for day in days:
+            while placed[day] and placed[day][0][0] < start:
+                position = heappop(placed[day])[1]
+                free[day].add(position)
+                heappush(free_heaps[day], position)
+
+        if not days:
+            # a lesson on no day overlaps nothing
+            position = 0 if rooms else None
+        else:
+            position = _first_free_room(
+                free,
+                free_heaps,
+                days,
+                lambda position: not rooms[position].overlapping_lessons(lesson),
+            )
+        if position is None:
+            unplaced.append(lesson)
+            continue
+
+        for day in days:
+            free[day].discard(position)
+            heappush(placed[day], (end, position))
+        assigned.setdefault(rooms[position].id, []).append(lesson)
+
+    for room_id, room_lessons in assigned.items():
+        schedule.get_room(room_id).add_lessons(room_lessons)
+    return assigned, unplaced
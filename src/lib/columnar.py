@@ -0,0 +1,291 @@
+"""
+Read-only columnar form of a schedule, for queries over every lesson at once.
+
+A `Schedule` keeps each lesson as a pydantic model with a list of `Day`
+members and time objects, which costs about a kilobyte a lesson and has to
+be walked object by object. `ColumnarSchedule` keeps the same lessons as
+parallel NumPy arrays instead, a few dozen bytes a lesson, and converts
+back to an equal `Schedule` without losing anything.
+"""
+
+from dataclasses import dataclass, field
+from datetime import time
+from uuid import UUID
+
+import numpy as np
+
+from .intervals import sweep_overlaps
+from .schedule import Day, Lesson, LessonConflict, RoomSchedule, Schedule
+
+DAYS = list(Day)
+DAY_BITS = {day: 1 << index for index, day in enumerate(DAYS)}
+MICROS_PER_MINUTE = 60_000_000
+MICROS_PER_DAY = 24 * 60 * MICROS_PER_MINUTE
+
+
+def day_mask(days: list[Day]) -> int:
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS[day]
+    return mask
+
+
+def mask_days(mask: int) -> list[Day]:
+    return [day for day, bit in DAY_BITS.items() if mask & bit]
+
+
+# the days of every possible mask, looked up when lessons are rebuilt
+MASK_DAYS = [mask_days(mask) for mask in range(1 << len(DAYS))]
+
+
+def _split_time(value: time) -> tuple[int, int]:
+    if value.tzinfo is not None:
+        raise ValueError(f"Lesson times with a time zone can't be stored: {value}")
+    return (
+        value.hour * 60 + value.minute,
+        value.second * 1_000_000 + value.microsecond,
+    )
+
+
+def _join_time(minute: int, micros: int) -> time:
+    seconds, microsecond = divmod(micros, 1_000_000)
+    return time(minute // 60, minute % 60, seconds, microsecond)
+
+
+def _pack_id(value: str) -> bytes | None:
+    # ids are uuid4 strings unless someone wrote their own, only the canonical
+    # form packs into 16 bytes and comes back as the same string
+    try:
+        packed = UUID(value)
+    except ValueError:
+        return None
+    return packed.bytes if str(packed) == value else None
+
+
+@dataclass
+class ColumnarSchedule:
+    """
+    The lessons of every room one after the other, in order, with one array
+    entry per lesson. Times are split into whole minutes, which is all most
+    queries need, and the microseconds past the minute, which are nearly
+    always 0 but kept so times convert back exactly.
+    """
+
+    room_ids: list[str]
+    room_names: list[str]
+    # position of the lesson's room in room_ids
+    room: np.ndarray
+    # bit i set for the i-th day of the week, see DAY_BITS
+    days: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    start_micros: np.ndarray
+    end_micros: np.ndarray
+    # position of the lesson's name in names, which holds every name once
+    name: np.ndarray
+    names: list[str]
+    # (lessons, 16) uuid bytes, zeroed for ids kept in other_ids instead
+    ids: np.ndarray
+    # lesson position to id for ids that aren't uuid strings
+    other_ids: dict[int, str] = field(default_factory=dict)
+    # lesson position to days for days lists a mask doesn't give back, those
+    # out of week order or naming a day twice
+    other_days: dict[int, list[Day]] = field(default_factory=dict)
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule) -> "ColumnarSchedule":
+        room_sizes, masks, name, ids = [], [], [], []
+        starts, ends, start_micros, end_micros = [], [], [], []
+        name_codes: dict[str, int] = {}
+        other_ids: dict[int, str] = {}
+        other_days: dict[int, list[Day]] = {}
+        position = 0
+        for room in schedule.rooms:
+            room_sizes.append(len(room.lessons))
+            for lesson in room.lessons:
+                mask = day_mask(lesson.days)
+                masks.append(mask)
+                if mask_days(mask) != lesson.days:
+                    other_days[position] = list(lesson.days)
+                start_minute, start_micro = _split_time(lesson.start)
+                end_minute, end_micro = _split_time(lesson.end)
+                starts.append(start_minute)
+                ends.append(end_minute)
+                start_micros.append(start_micro)
+                end_micros.append(end_micro)
+                name.append(name_codes.setdefault(lesson.name, len(name_codes)))
+                packed = _pack_id(lesson.id)
+                if packed is None:
+                    other_ids[position] = lesson.id
+                    packed = bytes(16)
+                ids.append(packed)
+                position += 1
+
+        return cls(
+            room_ids=[room.id for room in schedule.rooms],
+            room_names=[room.name for room in schedule.rooms],
+            room=np.repeat(np.arange(len(room_sizes), dtype=np.int32), room_sizes),
+            days=np.array(masks, dtype=np.uint8),
+            start=np.array(starts, dtype=np.int16),
+            end=np.array(ends, dtype=np.int16),
+            start_micros=np.array(start_micros, dtype=np.int32),
+            end_micros=np.array(end_micros, dtype=np.int32),
+            name=np.array(name, dtype=np.int32),
+            names=list(name_codes),
+            ids=np.frombuffer(b"".join(ids), dtype=np.uint8).reshape(-1, 16),
+            other_ids=other_ids,
+            other_days=other_days,
+        )
+
+    def __len__(self) -> int:
+        return len(self.room)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes taken by the arrays, leaving out the lists of names and ids.
+        """
+        return sum(
+            array.nbytes
+            for array in (
+                self.room,
+                self.days,
+                self.start,
+                self.end,
+                self.start_micros,
+                self.end_micros,
+                self.name,
+                self.ids,
+            )
+        )
+
+    def lessons(self, positions) -> list[Lesson]:
+        """
+        Lessons at the positions, gathered from every array at once rather
+        than one element at a time.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        return [
+            Lesson(
+                days=list(self.other_days.get(position, MASK_DAYS[mask])),
+                start=_join_time(start, start_micros),
+                end=_join_time(end, end_micros),
+                name=self.names[name],
+                id=(
+                    self.other_ids[position]
+                    if position in self.other_ids
+                    else str(UUID(bytes=packed_id))
+                ),
+            )
+            for position, mask, start, start_micros, end, end_micros, name, packed_id in zip(
+                positions.tolist(),
+                self.days[positions].tolist(),
+                self.start[positions].tolist(),
+                self.start_micros[positions].tolist(),
+                self.end[positions].tolist(),
+                self.end_micros[positions].tolist(),
+                self.name[positions].tolist(),
+                [row.tobytes() for row in self.ids[positions]],
+            )
+        ]
+
+    def lesson(self, position: int) -> Lesson:
+        return self.lessons([position])[0]
+
+    def to_schedule(self) -> Schedule:
+        bounds = np.searchsorted(self.room, np.arange(len(self.room_ids) + 1))
+        lessons = self.lessons(np.arange(len(self)))
+        return Schedule(
+            rooms=[
+                RoomSchedule(
+                    id=room_id,
+                    name=self.room_names[index],
+                    lessons=lessons[bounds[index] : bounds[index + 1]],
+                )
+                for index, room_id in enumerate(self.room_ids)
+            ]
+        )
+
+    def start_times(self) -> np.ndarray:
+        """
+        Microseconds from midnight each lesson starts at.
+        """
+        return self.start.astype(np.int64) * MICROS_PER_MINUTE + self.start_micros
+
+    def end_times(self) -> np.ndarray:
+        return self.end.astype(np.int64) * MICROS_PER_MINUTE + self.end_micros
+
+    def day_rows(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (lesson position, day index) for every day of every lesson, in lesson
+        order then week order.
+        """
+        bits = (self.days[:, None] >> np.arange(len(DAYS), dtype=np.uint8)) & 1
+        return np.nonzero(bits)
+
+    def find_free_rooms(self, days: list[Day], start: time, end: time) -> list[int]:
+        """
+        Positions in room_ids of the rooms where a lesson on the days from
+        start to end would fit, like `Schedule.find_free_rooms`.
+        """
+        if start > end:
+            raise ValueError("Start time must be before end time.")
+        start_minute, start_micro = _split_time(start)
+        end_minute, end_micro = _split_time(end)
+        busy = (
+            (self.days & day_mask(days)).astype(bool)
+            & (self.start_times() <= end_minute * MICROS_PER_MINUTE + end_micro)
+            & (self.end_times() >= start_minute * MICROS_PER_MINUTE + start_micro)
+        )
+        free = np.ones(len(self.room_ids), dtype=bool)
+        free[self.room[busy]] = False
+        return np.flatnonzero(free).tolist()
+
+    def find_conflicts(self) -> list[LessonConflict]:
+        """
+        The same conflicts as `Schedule.find_conflicts`, in the same order.
+
+        Whether a room has any overlap on a day is worked out for every room
+        and day at once. Only the few that do are swept for the pairs.
+        """
+        positions, day = self.day_rows()
+        row_group = self.room[positions].astype(np.int64) * len(DAYS) + day
+        start_times, end_times = self.start_times(), self.end_times()
+        starts, ends = start_times[positions], end_times[positions]
+        order = np.lexsort((ends, starts, row_group))
+        group, starts, ends = row_group[order], starts[order], ends[order]
+        # like in lib.stats, shifting each group past the one before it lets a
+        # running maximum give the latest end of the earlier lessons of a group
+        shift = group * (MICROS_PER_DAY + 1)
+        latest_end = np.maximum.accumulate(ends + shift) - shift
+        overlaps = np.zeros(len(group), dtype=bool)
+        overlaps[1:] = (group[1:] == group[:-1]) & (starts[1:] <= latest_end[:-1])
+        clashing = np.unique(group[overlaps])
+
+        by_group: dict[int, list[int]] = {}
+        keep = np.isin(row_group, clashing)
+        for key, position in zip(row_group[keep].tolist(), positions[keep].tolist()):
+            by_group.setdefault(key, []).append(position)
+        pairs = [
+            (key, first, second)
+            for key in sorted(by_group)
+            for first, second in sweep_overlaps(
+                zip(
+                    start_times[by_group[key]].tolist(),
+                    end_times[by_group[key]].tolist(),
+                    by_group[key],
+                )
+            )
+        ]
+        involved = sorted({position for _, *pair in pairs for position in pair})
+        lessons = dict(zip(involved, self.lessons(involved)))
+        return [
+            LessonConflict(
+                room_id=self.room_ids[key // len(DAYS)],
+                room_name=self.room_names[key // len(DAYS)],
+                day=DAYS[key % len(DAYS)],
+                first=lessons[first],
+                second=lessons[second],
+            )
+            for key, first, second in pairs
+        ]
@@ -0,0 +1,143 @@
+from bisect import bisect_left, bisect_right
+from datetime import time
+from heapq import heapify, heappop, heappush
+from typing import Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def to_seconds(value: time) -> float:
+    return (
+        value.hour * 3600
+        + value.minute * 60
+        + value.second
+        + value.microsecond / 1_000_000
+    )
+
+
+def from_seconds(seconds: float) -> time:
+    microseconds = round(seconds * 1_000_000)
+    minutes, microseconds = divmod(microseconds, 60_000_000)
+    hours, minutes = divmod(minutes, 60)
+    return time(hours, minutes, microseconds // 1_000_000, microseconds % 1_000_000)
+
+
+def merge_intervals(
+    intervals: Iterable[tuple[float, float]],
+) -> list[tuple[float, float]]:
+    """
+    Merges closed intervals sorted by start time into disjoint ones, joining
+    intervals that only touch as well since they overlap at that point.
+    """
+    merged: list[tuple[float, float]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Closed intervals kept sorted by start time.
+
+    Queries only look at entries whose start falls inside
+    ``[start - longest, end]``, where ``longest`` is the longest interval in
+    the index, so a lookup costs a bisect plus the entries near the query
+    window instead of a scan over the whole index.
+    """
+
+    def __init__(self):
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._items: list[T] = []
+        # how many intervals there are of each length, and a max-heap of the
+        # negated lengths whose counts dropped to 0 are only popped once they
+        # reach the top
+        self._lengths: dict[float, int] = {}
+        self._length_heap: list[float] = []
+
+    @classmethod
+    def from_intervals(
+        cls, intervals: Iterable[tuple[float, float, T]]
+    ) -> "IntervalIndex[T]":
+        index = cls()
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        index._starts = [start for start, _, _ in ordered]
+        index._ends = [end for _, end, _ in ordered]
+        index._items = [item for _, _, item in ordered]
+        for start, end, _ in ordered:
+            index._lengths[end - start] = index._lengths.get(end - start, 0) + 1
+        index._length_heap = [-length for length in index._lengths]
+        heapify(index._length_heap)
+        return index
+
+    @property
+    def _longest(self) -> float:
+        return -self._length_heap[0] if self._length_heap else 0.0
+
+    def _count_length(self, length: float, change: int):
+        count = self._lengths.get(length, 0) + change
+        if count:
+            self._lengths[length] = count
+            if count == 1 and change > 0:
+                heappush(self._length_heap, -length)
+            return
+        del self._lengths[length]
+        heap = self._length_heap
+        if len(heap) > 2 * len(self._lengths) + 16:
+            # too many stale lengths below the top, start over
+            heap[:] = [-length for length in self._lengths]
+            heapify(heap)
+        while heap and -heap[0] not in self._lengths:
+            heappop(heap)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def add(self, start: float, end: float, item: T):
+        position = bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._ends.insert(position, end)
+        self._items.insert(position, item)
+        self._count_length(end - start, 1)
+
+    def remove(self, start: float, item: T) -> bool:
+        position = bisect_left(self._starts, start)
+        while position < len(self._starts) and self._starts[position] == start:
+            if self._items[position] is item:
+                self._count_length(self._ends[position] - start, -1)
+                del self._starts[position]
+                del self._ends[position]
+                del self._items[position]
+                return True
+            position += 1
+        return False
+
+    def overlapping(self, start: float, end: float) -> Iterator[T]:
+        low = bisect_left(self._starts, start - self._longest)
+        high = bisect_right(self._starts, end)
+        for position in range(low, high):
+            if self._ends[position] >= start:
+                yield self._items[position]
+
+
+def sweep_overlaps(
+    intervals: Iterable[tuple[float, float, T]],
+) -> Iterator[tuple[T, T]]:
+    """
+    Yields every pair of overlapping closed intervals in one sorted pass,
+    keeping the intervals that are still open in a heap ordered by end time.
+    """
+    active: list[tuple[float, int, T]] = []
+    ordered = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+    for position, (start, end, item) in enumerate(ordered):
+        while active and active[0][0] < start:
+            heappop(active)
+        for _, _, other in active:
+            yield other, item
+        heappush(active, (end, position, item))
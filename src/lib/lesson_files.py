@@ -0,0 +1,43 @@
+import csv
+import json
+import os
+import re
+from typing import IO
+
+from .schedule import Lesson, lesson_list_adapter
+
+LESSON_FILE_FORMATS = ["csv", "jsonl"]
+
+
+def guess_lesson_file_format(filename: str) -> str | None:
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return None
+
+
+def read_lesson_records(file: IO[str], file_format: str) -> list[dict]:
+    """
+    Reads raw lesson records from a CSV file with a header row
+    (name, days, start, end and optionally id), where days are separated by
+    commas or semicolons, or from a JSONL file with one lesson object per line.
+    """
+    if file_format == "csv":
+        records = []
+        for row in csv.DictReader(file):
+            record = {key: value for key, value in row.items() if value != ""}
+            if "days" in record:
+                record["days"] = [
+                    day for day in re.split(r"[,;\s]+", record["days"]) if day
+                ]
+            records.append(record)
+        return records
+    if file_format == "jsonl":
+        return [json.loads(line) for line in file if line.strip()]
+    raise ValueError(f"Unknown lesson file format {file_format!r}")
+
+
+def read_lessons(file: IO[str], file_format: str) -> list[Lesson]:
+    return lesson_list_adapter.validate_python(read_lesson_records(file, file_format))
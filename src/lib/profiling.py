@@ -0,0 +1,88 @@
+"""
+Per-phase timings of a command, for `eda-app --profile`.
+
+Code marks its phases with `with profiling.phase("load"): ...`. Until
+`start` is called that hands back one shared do-nothing context manager, so
+the marks cost a global lookup when profiling is off.
+"""
+
+from time import perf_counter
+
+# phases in the order they are reported, command is whatever time the others
+# don't account for
+PHASES = ["load", "validate", "command", "render", "save"]
+
+_timings: dict[str, float] | None = None
+_started = 0.0
+# [phase, started, time spent in phases nested inside it] of the open phases
+_open: list[list] = []
+
+
+class _Phase:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        _open.append([self.name, perf_counter(), 0.0])
+
+    def __exit__(self, *exc_info):
+        name, started, nested = _open.pop()
+        elapsed = perf_counter() - started
+        if _timings is not None:
+            # nested phases count towards their own phase only
+            _timings[name] = _timings.get(name, 0.0) + elapsed - nested
+        if _open:
+            _open[-1][2] += elapsed
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name: str) -> _Phase | _NoPhase:
+    if _timings is None:
+        return _NO_PHASE
+    return _Phase(name)
+
+
+def is_enabled() -> bool:
+    return _timings is not None
+
+
+def start():
+    global _timings, _started
+    _timings = {}
+    _started = perf_counter()
+
+
+def stop() -> dict[str, float]:
+    """
+    Stops timing and returns the seconds spent in each phase, with command
+    holding the rest of the time since `start` and total all of it.
+    """
+    global _timings
+    if _timings is None:
+        raise RuntimeError("Profiling was not started")
+    total = perf_counter() - _started
+    timings, _timings = _timings, None
+    timings["command"] = max(total - sum(timings.values()), 0.0)
+    timings["total"] = total
+    return timings
+
+
+def format_timings(timings: dict[str, float]) -> str:
+    names = [*PHASES, *sorted(set(timings) - {*PHASES, "total"}), "total"]
+    return "\n".join(
+        f"{name:>10}: {timings.get(name, 0.0) * 1000:9.2f}ms" for name in names
+    )
@@ -1,8 +1,17 @@
-from datetime import time
-from pydantic import BaseModel, Field, model_validator, TypeAdapter
+from bisect import bisect_left, bisect_right
+from datetime import time, timedelta
+from pydantic import BaseModel, Field, PrivateAttr, model_validator, TypeAdapter
 from uuid import uuid4
 from enum import Enum
 
+from .intervals import (
+    IntervalIndex,
+    from_seconds,
+    merge_intervals,
+    sweep_overlaps,
+    to_seconds,
+)
+
 
 class Day(str, Enum):
     MONDAY = "monday"
@@ -33,32 +42,307 @@ class Lesson(BaseModel):
         return (
             self.start <= other.end
             and self.end >= other.start
-            and set(self.days) & set(other.days)
+            and any(day in other.days for day in self.days)
         )
 
 
-class RoomSchedule(BaseModel):
+lesson_list_adapter = TypeAdapter(list[Lesson])
+
+INFINITY = float("inf")
+
+
+def _remove_identical(items: list, item):
+    # list.remove compares with ==, which runs pydantic's field by field __eq__
+    for position, existing in enumerate(items):
+        if existing is item:
+            del items[position]
+            return
+
+
+def find_overlapping_lessons(
+    lessons: list[Lesson],
+) -> list[tuple[Day, Lesson, Lesson]]:
+    lessons_by_day: dict[Day, list[tuple[float, float, Lesson]]] = {
+        day: [] for day in Day
+    }
+    for lesson in lessons:
+        interval = (to_seconds(lesson.start), to_seconds(lesson.end), lesson)
+        for day in set(lesson.days):
+            lessons_by_day[day].append(interval)
+
+    return [
+        (day, first, second)
+        for day, intervals in lessons_by_day.items()
+        for first, second in sweep_overlaps(intervals)
+    ]
+
+
+class LessonConflictError(ValueError):
+    def __init__(self, conflicts: list[tuple[Day, Lesson, Lesson]]):
+        self.conflicts = conflicts
+        super().__init__(f"Found {len(conflicts)} overlapping lesson(s)")
+
+
+class FreeSlot(BaseModel):
+    """
+    Time between lessons, where lessons ending at `start` or beginning at `end`
+    still overlap with anything touching those times.
+    """
+
+    day: Day
+    start: time
+    end: time
+
+
+class _IndexedModel(BaseModel):
+    def __eq__(self, other):
+        # pydantic also compares private attributes, but the indexes kept there
+        # are derived from the fields and differ in identity between instances
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+
+class RoomSchedule(_IndexedModel):
     id: str = Field(default_factory=lambda: str(uuid4()))
     name: str
     lessons: list[Lesson] = []
 
+    # per-day index of lessons sorted by start time, used for overlap checks
+    _day_index: dict[Day, IntervalIndex[Lesson]] = PrivateAttr(default_factory=dict)
+    _lessons_by_id: dict[str, Lesson] = PrivateAttr(default_factory=dict)
+    # several lessons in a room can share a name, so names map to every match
+    _lessons_by_name: dict[str, list[Lesson]] = PrivateAttr(default_factory=dict)
+    # time sorted lessons per day, dropped for a day whenever its index changes
+    _lessons_by_day: dict[Day, list[Lesson]] = PrivateAttr(default_factory=dict)
+    # merged (start, end) seconds the room is busy per day, dropped with the above
+    _busy_by_day: dict[Day, list[tuple[float, float]]] = PrivateAttr(
+        default_factory=dict
+    )
+    # the schedule this room belongs to, told about every change to the room
+    _schedule: "Schedule | None" = PrivateAttr(default=None)
+    # lessons get increasing sequence numbers as they are added, so `lessons`
+    # stays sorted by them and a lesson's position is a bisect of _sequence
+    _sequence: list[int] = PrivateAttr(default_factory=list)
+    _sequence_of: dict[str, int] = PrivateAttr(default_factory=dict)
+    _next_sequence: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context):
+        self._day_index = {day: IntervalIndex() for day in Day}
+        self._lessons_by_id = {}
+        self._lessons_by_name = {}
+        self._lessons_by_day = {}
+        self._busy_by_day = {}
+        self._sequence = list(range(len(self.lessons)))
+        # a repeated id maps to the last lesson with it, as in _lessons_by_id
+        self._sequence_of = {
+            lesson.id: position for position, lesson in enumerate(self.lessons)
+        }
+        self._next_sequence = len(self.lessons)
+        for lesson in self.lessons:
+            self._index_lesson(lesson)
+
+    def _index_lesson(self, lesson: Lesson):
+        start, end = to_seconds(lesson.start), to_seconds(lesson.end)
+        for day in set(lesson.days):
+            self._day_index[day].add(start, end, lesson)
+            self._lessons_by_day.pop(day, None)
+            self._busy_by_day.pop(day, None)
+        self._lessons_by_id[lesson.id] = lesson
+        self._lessons_by_name.setdefault(lesson.name, []).append(lesson)
+
+    def _unindex_lesson(self, lesson: Lesson):
+        start = to_seconds(lesson.start)
+        for day in set(lesson.days):
+            self._day_index[day].remove(start, lesson)
+            self._lessons_by_day.pop(day, None)
+            self._busy_by_day.pop(day, None)
+        self._lessons_by_id.pop(lesson.id, None)
+        named = self._lessons_by_name.get(lesson.name, [])
+        _remove_identical(named, lesson)
+        if not named:
+            self._lessons_by_name.pop(lesson.name, None)
+
+    def _record_change(self, change: str, lesson_id: str):
+        if self._schedule is not None:
+            self._schedule._record_change(change, self.id, lesson_id)
+
+    def get_lesson(self, lesson_id: str) -> Lesson | None:
+        return self._lessons_by_id.get(lesson_id)
+
+    def lessons_named(self, name: str) -> list[Lesson]:
+        return list(self._lessons_by_name.get(name, []))
+
+    def lessons_on(self, day: Day) -> list[Lesson]:
+        """
+        Lessons on the day sorted by start time. The list is cached until the
+        room's lessons change, so treat it as read-only.
+        """
+        lessons = self._lessons_by_day.get(day)
+        if lessons is None:
+            lessons = self._lessons_by_day[day] = list(self._day_index[day])
+        return lessons
+
     @property
     def lessons_by_day(self) -> dict[Day, list[Lesson]]:
-        return {
-            day: [lesson for lesson in self.lessons if day in lesson.days]
-            for day in Day
-        }
+        return {day: self.lessons_on(day) for day in Day}
+
+    def busy_intervals(self, day: Day) -> list[tuple[float, float]]:
+        """
+        Disjoint (start, end) seconds the room is busy on the day, in order.
+        Cached like `lessons_on`.
+        """
+        busy = self._busy_by_day.get(day)
+        if busy is None:
+            busy = self._busy_by_day[day] = merge_intervals(
+                (to_seconds(lesson.start), to_seconds(lesson.end))
+                for lesson in self.lessons_on(day)
+            )
+        return busy
+
+    def is_free(self, days: list[Day], start: time, end: time) -> bool:
+        """
+        Whether a lesson on the days from start to end would overlap nothing.
+        """
+        start_seconds, end_seconds = to_seconds(start), to_seconds(end)
+        for day in set(days):
+            busy = self.busy_intervals(day)
+            # only the last busy interval starting by `end` can reach `start`
+            position = bisect_right(busy, (end_seconds, INFINITY))
+            if position and busy[position - 1][1] >= start_seconds:
+                return False
+        return True
+
+    def free_slots(
+        self,
+        duration: timedelta,
+        days: list[Day] | None = None,
+        start: time = time.min,
+        end: time = time.max,
+    ) -> list[FreeSlot]:
+        """
+        Gaps of at least `duration` between start and end on each of the days,
+        every day by default.
+        """
+        window_start, window_end = to_seconds(start), to_seconds(end)
+        length = duration.total_seconds()
+        slots = []
+        for day in Day if days is None else sorted(set(days), key=list(Day).index):
+            cursor = window_start
+            for busy_start, busy_end in self.busy_intervals(day):
+                if busy_end < window_start:
+                    continue
+                if busy_start > window_end:
+                    break
+                if busy_start - cursor >= length:
+                    slots.append((day, cursor, busy_start))
+                cursor = max(cursor, busy_end)
+            if window_end - cursor >= length:
+                slots.append((day, cursor, window_end))
+        return [
+            FreeSlot(
+                day=day, start=from_seconds(slot_start), end=from_seconds(slot_end)
+            )
+            for day, slot_start, slot_end in slots
+        ]
 
-    def add_lesson(self, lesson: Lesson):
-        # TODO: Check if the lesson is overlapping
-        for existing_lesson in self.lessons:
-            if lesson.overlaps(existing_lesson):
-                raise ValueError("Lesson overlaps with existing lesson")
+    def overlapping_lessons(self, lesson: Lesson) -> list[Lesson]:
+        start, end = to_seconds(lesson.start), to_seconds(lesson.end)
+        overlapping = {}
+        for day in set(lesson.days):
+            for existing_lesson in self._day_index[day].overlapping(start, end):
+                if existing_lesson is not lesson:
+                    overlapping[id(existing_lesson)] = existing_lesson
+        return list(overlapping.values())
 
+    def add_lesson(self, lesson: Lesson, check_overlaps: bool = True):
+        """
+        Adds the lesson to the end of the room. Lessons that were saved with
+        their overlaps, like those replayed from a journal, are added without
+        the check.
+        """
+        if lesson.id in self._lessons_by_id:
+            raise ValueError("Lesson already exists")
+        if check_overlaps and self.overlapping_lessons(lesson):
+            raise ValueError("Lesson overlaps with existing lesson")
+
+        self._append_lesson(lesson)
+
+    def _append_lesson(self, lesson: Lesson):
+        # adds a lesson that has already been checked for overlaps
         self.lessons.append(lesson)
+        self._sequence.append(self._next_sequence)
+        self._sequence_of[lesson.id] = self._next_sequence
+        self._next_sequence += 1
+        self._index_lesson(lesson)
+        self._record_change("add_lesson", lesson.id)
+
+    def add_lessons(self, lessons: list[Lesson]):
+        new_ids = {lesson.id for lesson in lessons}
+        if len(new_ids) < len(lessons) or not new_ids.isdisjoint(self._lessons_by_id):
+            raise ValueError("Lesson already exists")
+        new_lessons = {id(lesson) for lesson in lessons}
+        conflicts = [
+            (day, first, second)
+            for day, first, second in find_overlapping_lessons(
+                [*self.lessons, *lessons]
+            )
+            if id(first) in new_lessons or id(second) in new_lessons
+        ]
+        if conflicts:
+            raise LessonConflictError(conflicts)
+
+        for lesson in lessons:
+            self._append_lesson(lesson)
+
+    def find_conflicts(self) -> list[tuple[Day, Lesson, Lesson]]:
+        return find_overlapping_lessons(self.lessons)
 
     def remove_lesson(self, lesson_id: str):
-        self.lessons = [lesson for lesson in self.lessons if lesson.id != lesson_id]
+        lesson = self._lessons_by_id.get(lesson_id)
+        if lesson is None:
+            return
+        self._unindex_lesson(lesson)
+        position = bisect_left(self._sequence, self._sequence_of.pop(lesson_id))
+        del self._sequence[position]
+        del self.lessons[position]
+        self._record_change("remove_lesson", lesson_id)
+
+    def update_lesson(
+        self,
+        lesson_id: str,
+        days: list[Day] | None = None,
+        start: time | None = None,
+        end: time | None = None,
+        name: str | None = None,
+    ) -> Lesson:
+        lesson = self._lessons_by_id.get(lesson_id)
+        if lesson is None:
+            raise ValueError("Lesson does not exist")
+
+        changes = {
+            "days": list(days) if days else None,
+            "start": start,
+            "end": end,
+            "name": name,
+        }
+        # fields set to what they already are change nothing and aren't saved
+        changes = {
+            key: value
+            for key, value in changes.items()
+            if value is not None and value != getattr(lesson, key)
+        }
+        if not changes:
+            return lesson
+        # validate the edited lesson as a whole before touching the index
+        Lesson.model_validate({**lesson.model_dump(), **changes})
+
+        self._unindex_lesson(lesson)
+        for key, value in changes.items():
+            setattr(lesson, key, value)
+        self._index_lesson(lesson)
+        self._record_change("update_lesson", lesson_id)
+        return lesson
 
 
 """
@@ -73,14 +357,138 @@ class RoomSchedule(BaseModel):
 """
 
 
-class Schedule(BaseModel):
+class LessonConflict(BaseModel):
+    room_id: str
+    room_name: str
+    day: Day
+    first: Lesson
+    second: Lesson
+
+
+class Schedule(_IndexedModel):
     rooms: list[RoomSchedule]
 
+    _rooms_by_id: dict[str, RoomSchedule] = PrivateAttr(default_factory=dict)
+    # room names are not unique either, see RoomSchedule._lessons_by_name
+    _rooms_by_name: dict[str, list[RoomSchedule]] = PrivateAttr(default_factory=dict)
+    # (change, room id, lesson id) for every change since the schedule was last
+    # saved, so storage backends can write just what changed
+    _changes: list[tuple[str, str, str | None]] = PrivateAttr(default_factory=list)
+    # every lesson of every room per day, pointing at its room, built for the
+    # first free room query and dropped on any change
+    _room_index: dict[Day, IntervalIndex[RoomSchedule]] | None = PrivateAttr(
+        default=None
+    )
+
+    def model_post_init(self, __context):
+        self._rooms_by_id = {}
+        self._rooms_by_name = {}
+        self._changes = []
+        self._room_index = None
+        for room in self.rooms:
+            self._index_room(room)
+
+    def _index_room(self, room: RoomSchedule):
+        self._rooms_by_id[room.id] = room
+        self._rooms_by_name.setdefault(room.name, []).append(room)
+        room._schedule = self
+
+    def _unindex_room(self, room: RoomSchedule):
+        room._schedule = None
+        self._rooms_by_id.pop(room.id, None)
+        named = self._rooms_by_name.get(room.name, [])
+        _remove_identical(named, room)
+        if not named:
+            self._rooms_by_name.pop(room.name, None)
+
+    def get_room(self, room_id: str) -> RoomSchedule | None:
+        return self._rooms_by_id.get(room_id)
+
+    def rooms_named(self, name: str) -> list[RoomSchedule]:
+        return list(self._rooms_by_name.get(name, []))
+
     def add_room(self, room: RoomSchedule):
-        for existing_room in self.rooms:
-            if existing_room.id == room.id:
-                raise ValueError("Room already exists")
+        if room.id in self._rooms_by_id:
+            raise ValueError("Room already exists")
         self.rooms.append(room)
+        self._index_room(room)
+        self._record_change("add_room", room.id, None)
 
     def remove_room(self, room_id: str):
-        self.rooms = [room for room in self.rooms if room.id != room_id]
+        room = self._rooms_by_id.get(room_id)
+        if room is None:
+            return
+        self._unindex_room(room)
+        _remove_identical(self.rooms, room)
+        self._record_change("remove_room", room_id, None)
+
+    def _record_change(self, change: str, room_id: str, lesson_id: str | None):
+        self._changes.append((change, room_id, lesson_id))
+        self._room_index = None
+
+    def _rooms_by_time(self) -> dict[Day, IntervalIndex[RoomSchedule]]:
+        index = self._room_index
+        if index is None:
+            index = self._room_index = {
+                day: IntervalIndex.from_intervals(
+                    (to_seconds(lesson.start), to_seconds(lesson.end), room)
+                    for room in self.rooms
+                    for lesson in room.lessons_on(day)
+                )
+                for day in Day
+            }
+        return index
+
+    @property
+    def changes(self) -> list[tuple[str, str, str | None]]:
+        return list(self._changes)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._changes)
+
+    def mark_saved(self):
+        self._changes.clear()
+
+    def find_free_rooms(
+        self, days: list[Day], start: time, end: time
+    ) -> list[RoomSchedule]:
+        """
+        Rooms where a lesson on the days from start to end would fit.
+        """
+        if start > end:
+            raise ValueError("Start time must be before end time.")
+        start_seconds, end_seconds = to_seconds(start), to_seconds(end)
+        index = self._rooms_by_time()
+        busy = {
+            id(room)
+            for day in set(days)
+            for room in index[day].overlapping(start_seconds, end_seconds)
+        }
+        return [room for room in self.rooms if id(room) not in busy]
+
+    def find_free_slots(
+        self,
+        room_id: str,
+        duration: timedelta,
+        days: list[Day] | None = None,
+        start: time = time.min,
+        end: time = time.max,
+    ) -> list[FreeSlot]:
+        room = self.get_room(room_id)
+        if room is None:
+            raise ValueError("Room does not exist")
+        return room.free_slots(duration, days, start, end)
+
+    def find_conflicts(self) -> list[LessonConflict]:
+        return [
+            LessonConflict(
+                room_id=room.id,
+                room_name=room.name,
+                day=day,
+                first=first,
+                second=second,
+            )
+            for room in self.rooms
+            for day, first, second in room.find_conflicts()
+        ]
@@ -0,0 +1,230 @@
+"""
+Room utilization of a schedule: busy minutes per room and day, how busy each
+hour of the week is, and the idle time between lessons.
+
+The schedule is turned into NumPy arrays of (room, day, start minute, end
+minute) once, one row per day of each lesson, and everything else is worked
+out on whole arrays. Overlapping lessons in a room count once. A
+`ColumnarSchedule` already is such arrays and skips the conversion.
+"""
+
+from dataclasses import dataclass
+from datetime import time
+
+import numpy as np
+
+from .columnar import ColumnarSchedule
+from .intervals import to_seconds
+from .schedule import Day, Schedule
+
+DAYS = list(Day)
+DAY_INDEX = {day: index for index, day in enumerate(DAYS)}
+MINUTES_PER_DAY = 24 * 60
+HOURS = 24
+
+
+@dataclass
+class LessonArrays:
+    """
+    One row per day of every lesson, with times in whole minutes rounded
+    outwards so partly used minutes count as busy.
+    """
+
+    room: np.ndarray
+    day: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+
+
+def lesson_arrays(schedule: Schedule | ColumnarSchedule) -> LessonArrays:
+    if isinstance(schedule, ColumnarSchedule):
+        positions, days = schedule.day_rows()
+        return LessonArrays(
+            room=schedule.room[positions].astype(np.int64),
+            day=days.astype(np.int64),
+            start=schedule.start[positions].astype(np.int64),
+            # a partly used last minute counts, as for lessons below
+            end=schedule.end[positions].astype(np.int64)
+            + (schedule.end_micros[positions] > 0),
+        )
+
+    starts, ends, days, day_counts, room_sizes = [], [], [], [], []
+    for room in schedule.rooms:
+        room_sizes.append(len(room.lessons))
+        for lesson in room.lessons:
+            start, end = lesson.start, lesson.end
+            starts.append(start.hour * 60 + start.minute)
+            ends.append(
+                end.hour * 60 + end.minute + bool(end.second or end.microsecond)
+            )
+            days.extend(DAY_INDEX[day] for day in lesson.days)
+            day_counts.append(len(lesson.days))
+    # everything but the day has one entry per lesson, repeated for its days
+    day_counts = np.array(day_counts, dtype=np.int64)
+    rooms = np.repeat(np.arange(len(room_sizes), dtype=np.int64), room_sizes)
+    return LessonArrays(
+        room=np.repeat(rooms, day_counts),
+        day=np.array(days, dtype=np.int64),
+        start=np.repeat(np.array(starts, dtype=np.int64), day_counts),
+        end=np.repeat(np.array(ends, dtype=np.int64), day_counts),
+    )
+
+
+@dataclass
+class ScheduleStats:
+    room_ids: list[str]
+    room_names: list[str]
+    # first and last minute of each day that counts
+    window: tuple[int, int]
+    # rooms x days, minutes with at least one lesson
+    busy_minutes: np.ndarray
+    # rooms x days x hours, busy minutes within each hour
+    hourly: np.ndarray
+    # rooms x days, free stretches between the first and last lesson
+    idle_gaps: np.ndarray
+    idle_minutes: np.ndarray
+    longest_idle: np.ndarray
+
+    @property
+    def window_minutes(self) -> int:
+        return self.window[1] - self.window[0]
+
+    @property
+    def utilization(self) -> np.ndarray:
+        """
+        Share of each room's time in the window over the whole week that is busy.
+        """
+        total = self.window_minutes * len(DAYS)
+        if total == 0:
+            return np.zeros(len(self.room_ids))
+        return self.busy_minutes.sum(axis=1) / total
+
+    @property
+    def heatmap(self) -> np.ndarray:
+        """
+        Days x hours, share of all rooms' time in each hour that is busy.
+        """
+        if not self.room_ids:
+            return np.zeros((len(DAYS), HOURS))
+        return self.hourly.sum(axis=0) / (60 * len(self.room_ids))
+
+    def peak_hours(self) -> dict[Day, int | None]:
+        """
+        The busiest hour of each day, None for days without lessons.
+        """
+        heatmap = self.heatmap
+        return {
+            day: int(heatmap[index].argmax()) if heatmap[index].any() else None
+            for index, day in enumerate(DAYS)
+        }
+
+    def to_dict(self) -> dict:
+        utilization = self.utilization
+        heatmap = self.heatmap
+        return {
+            "window": {"start": self.window[0], "end": self.window[1]},
+            "rooms": [
+                {
+                    "id": room_id,
+                    "name": self.room_names[index],
+                    "busy_minutes": {
+                        day.value: int(self.busy_minutes[index, day_index])
+                        for day_index, day in enumerate(DAYS)
+                    },
+                    "utilization": float(utilization[index]),
+                    "idle_gaps": int(self.idle_gaps[index].sum()),
+                    "idle_minutes": int(self.idle_minutes[index].sum()),
+                    "longest_idle": int(self.longest_idle[index].max(initial=0)),
+                }
+                for index, room_id in enumerate(self.room_ids)
+            ],
+            "heatmap": {
+                day.value: [round(float(value), 4) for value in heatmap[day_index]]
+                for day_index, day in enumerate(DAYS)
+            },
+            "peak_hours": {day.value: hour for day, hour in self.peak_hours().items()},
+        }
+
+
+def _minute(value: time, rounding) -> int:
+    return int(rounding(to_seconds(value) / 60))
+
+
+def schedule_stats(
+    schedule: Schedule | ColumnarSchedule, start: time = time.min, end: time = time.max
+) -> ScheduleStats:
+    """
+    Works out the utilization of every room, counting only the time from
+    start to end of each day.
+    """
+    if start > end:
+        raise ValueError("Start time must be before end time.")
+    window = (_minute(start, np.floor), _minute(end, np.ceil))
+    arrays = lesson_arrays(schedule)
+    if isinstance(schedule, ColumnarSchedule):
+        room_ids, room_names = schedule.room_ids, schedule.room_names
+    else:
+        room_ids = [room.id for room in schedule.rooms]
+        room_names = [room.name for room in schedule.rooms]
+    room_count = len(room_ids)
+    groups = room_count * len(DAYS)
+
+    lesson_start = np.clip(arrays.start, *window)
+    lesson_end = np.clip(arrays.end, *window)
+    keep = lesson_end > lesson_start
+    group = (arrays.room * len(DAYS) + arrays.day)[keep]
+    lesson_start, lesson_end = lesson_start[keep], lesson_end[keep]
+
+    # merge each room's lessons on a day into busy blocks: in (group, start)
+    # order a lesson starts a block unless an earlier lesson of its group is
+    # still going, which a running maximum of the ends shows once every group
+    # is shifted past the ends of the groups before it
+    order = np.lexsort((lesson_start, group))
+    group, lesson_start, lesson_end = (
+        group[order],
+        lesson_start[order],
+        lesson_end[order],
+    )
+    shift = group * (MINUTES_PER_DAY + 1)
+    running_end = np.maximum.accumulate(lesson_end + shift) - shift
+    new_group = np.ones(len(group), dtype=bool)
+    new_group[1:] = group[1:] != group[:-1]
+    block_start = new_group.copy()
+    block_start[1:] |= lesson_start[1:] > running_end[:-1]
+    starts_at = np.flatnonzero(block_start)
+    ends_at = np.append(starts_at[1:], len(group))[: len(starts_at)] - 1
+    block_group = group[starts_at]
+    block_begin = lesson_start[starts_at]
+    block_end = running_end[ends_at]
+
+    busy = np.bincount(block_group, weights=block_end - block_begin, minlength=groups)
+    hourly = np.zeros((groups, HOURS))
+    for hour in range(HOURS):
+        overlap = np.minimum(block_end, (hour + 1) * 60) - np.maximum(
+            block_begin, hour * 60
+        )
+        hourly[:, hour] = np.bincount(
+            block_group, weights=np.clip(overlap, 0, None), minlength=groups
+        )
+
+    # a gap is the time between a block and the next one of the same group
+    follows = np.zeros(len(block_group), dtype=bool)
+    follows[1:] = block_group[1:] == block_group[:-1]
+    gap_group = block_group[follows]
+    gap = block_begin[follows] - block_end[np.flatnonzero(follows) - 1]
+    longest = np.zeros(groups, dtype=np.int64)
+    np.maximum.at(longest, gap_group, gap)
+
+    shape = (room_count, len(DAYS))
+    return ScheduleStats(
+        room_ids=room_ids,
+        room_names=room_names,
+        window=window,
+        busy_minutes=busy.astype(np.int64).reshape(shape),
+        hourly=hourly.reshape((*shape, HOURS)),
+        idle_gaps=np.bincount(gap_group, minlength=groups).reshape(shape),
+        idle_minutes=np.bincount(gap_group, weights=gap, minlength=groups)
+        .astype(np.int64)
+        .reshape(shape),
+        longest_idle=longest.reshape(shape),
+    )
@@ -0,0 +1,49 @@
+from .base import ScheduleStore
+from .cache import ParseCache
+from .catalog import Catalog, CatalogEntry
+from .sqlite_store import SqliteStore
+from .yaml_store import (
+    COMPACT_THRESHOLD,
+    JournalStore,
+    SafeDumper,
+    SafeLoader,
+    YamlStore,
+    load_schedule,
+    read_schedule_dict,
+    save_schedule,
+    schedule_path,
+    write_schedule_dict,
+)
+
+STORAGE_BACKENDS: dict[str, type[ScheduleStore]] = {
+    "yaml": YamlStore,
+    "sqlite": SqliteStore,
+    "journal": JournalStore,
+}
+
+
+def get_store(
+    backend: str, directory: str, cache: ParseCache | None = None
+) -> ScheduleStore:
+    return STORAGE_BACKENDS[backend](directory, cache=cache)
+
+
+__all__ = [
+    "COMPACT_THRESHOLD",
+    "Catalog",
+    "CatalogEntry",
+    "JournalStore",
+    "ParseCache",
+    "STORAGE_BACKENDS",
+    "SafeDumper",
+    "SafeLoader",
+    "ScheduleStore",
+    "SqliteStore",
+    "YamlStore",
+    "get_store",
+    "load_schedule",
+    "read_schedule_dict",
+    "save_schedule",
+    "schedule_path",
+    "write_schedule_dict",
+]
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Hashable
+
+from ..schedule import RoomSchedule, Schedule
+from .cache import ParseCache
+
+
+class ScheduleStore(ABC):
+    """
+    Saves and loads the schedules kept in one directory.
+    """
+
+    def __init__(self, directory: str, cache: ParseCache | None = None):
+        self.directory = directory
+        # stores that parse whole files can skip that for unchanged ones
+        self.cache = cache
+
+    @abstractmethod
+    def exists(self, name: str) -> bool: ...
+
+    @abstractmethod
+    def names(self) -> list[str]: ...
+
+    @abstractmethod
+    def create(self, name: str, schedule: Schedule):
+        """
+        Stores a new schedule in full.
+        """
+
+    @abstractmethod
+    def load(self, name: str) -> Schedule: ...
+
+    @abstractmethod
+    def save(self, name: str, schedule: Schedule):
+        """
+        Stores the changes made to a loaded schedule and marks it as saved,
+        doing nothing when the schedule has no unsaved changes.
+        """
+
+    @abstractmethod
+    def delete(self, name: str): ...
+
+    @abstractmethod
+    def version(self, name: str) -> Hashable:
+        """
+        A value that changes whenever the stored schedule does, so copies
+        loaded earlier can be told apart from stale ones.
+        """
+
+    def compact(self, name: str) -> int:
+        """
+        Folds changes kept apart from the schedule back into it, returning how
+        many were folded. Stores that always save in place have none.
+        """
+        return 0
+
+    def load_room(self, name: str, room_name: str) -> RoomSchedule | None:
+        """
+        Loads the first room with the name, or the room with that id.
+        """
+        schedule = self.load(name)
+        rooms = schedule.rooms_named(room_name)
+        return rooms[0] if rooms else schedule.get_room(room_name)
@@ -0,0 +1,123 @@
+"""
+Cache of validated schedules, so loading an unchanged schedule file skips
+parsing and validating it.
+
+Entries are pickles of the validated `Schedule` kept in a private cache
+directory, one per schedule file, and are only used while the file's mtime,
+size and content hash all still match. Unpickling restores the models and
+their indexes as they were without validating them again, which measured
+faster than rebuilding them with `model_construct`.
+
+The least recently used entries are dropped once the cache grows past its size
+limit.
+"""
+
+import hashlib
+import os
+import pickle
+from contextlib import suppress
+from uuid import uuid4
+
+from ..schedule import Lesson, RoomSchedule, Schedule
+
+CACHE_DIR_ENV = "EDA_APP_CACHE_DIR"
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+SUFFIX = ".pickle"
+# entries pickled before a model gained or lost a private attribute would come
+# back without it, so the attributes are part of every key
+MODEL_FINGERPRINT = tuple(
+    (model.__name__, tuple(model.model_fields), tuple(model.__private_attributes__))
+    for model in (Lesson, RoomSchedule, Schedule)
+)
+
+
+def default_cache_directory() -> str:
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "eda-app")
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ParseCache:
+    def __init__(
+        self, directory: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.directory = directory or default_cache_directory()
+        self.max_bytes = max_bytes
+
+    def entry_path(self, path: str) -> str:
+        key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}{SUFFIX}")
+
+    def get(self, path: str, content: bytes) -> Schedule | None:
+        """
+        The cached schedule for the file at `path`, whose current content is
+        `content`, or None if there is no entry for that exact file.
+        """
+        entry_path = self.entry_path(path)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+            stat = os.stat(path)
+        except Exception:  # missing, or written by another version
+            return None
+        if entry.get("key") != _file_key(path, stat, content):
+            return None
+        # bump the entry's mtime, eviction drops the least recently used first
+        with suppress(OSError):
+            os.utime(entry_path)
+        return entry["schedule"]
+
+    def put(self, path: str, content: bytes, schedule: Schedule):
+        """
+        Caches a freshly validated or saved schedule with no unsaved changes.
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        entry = {
+            "key": _file_key(path, os.stat(path), content),
+            "schedule": schedule,
+        }
+        entry_path = self.entry_path(path)
+        temp_path = f"{entry_path}.{uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # a cache that can't be written is just a slower load next time
+            with suppress(OSError):
+                os.remove(temp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        entries = []
+        with suppress(FileNotFoundError):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(SUFFIX):
+                    with suppress(FileNotFoundError):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with suppress(FileNotFoundError):
+                os.remove(entry_path)
+            total -= size
+
+
+def _file_key(path: str, stat: os.stat_result, content: bytes) -> tuple:
+    return (
+        MODEL_FINGERPRINT,
+        os.path.abspath(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        content_hash(content),
+    )
@@ -0,0 +1,184 @@
+"""
+Index of the schedule files in a directory, so listing them with their room
+and lesson counts doesn't mean parsing every file.
+
+The index is a JSON file in the directory itself. Listing re-reads only the
+files whose mtime or size no longer match their entry, and once the index
+exists the yaml stores keep the entries of the schedules they write up to
+date as they go.
+"""
+
+import json
+import os
+from contextlib import suppress
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import yaml
+from pydantic import BaseModel, ValidationError
+
+from ..schedule import Schedule
+from .cache import content_hash
+
+if TYPE_CHECKING:
+    from .yaml_store import YamlStore
+
+CATALOG_NAME = ".eda-catalog.json"
+# bumped whenever the entries change shape, older indexes are rebuilt
+CATALOG_VERSION = 2
+
+
+class CatalogEntry(BaseModel):
+    name: str
+    path: str
+    mtime_ns: int
+    size: int
+    # (mtime_ns, size) of the schedule's journal, whose changes the counts include
+    journal: tuple[int, int] | None = None
+    # None when the schedule couldn't be loaded, see error
+    rooms: int | None
+    lessons: int | None
+    hash: str
+    error: str | None = None
+
+
+def _stat(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Catalog:
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path = os.path.join(directory, CATALOG_NAME)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def read(self) -> dict[str, CatalogEntry]:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") != CATALOG_VERSION:
+                return {}
+            entries = [CatalogEntry.model_validate(entry) for entry in data["entries"]]
+        except (OSError, ValueError, KeyError, AttributeError, ValidationError):
+            # missing or damaged indexes are rebuilt from the files
+            return {}
+        return {entry.name: entry for entry in entries}
+
+    def write(self, entries: dict[str, CatalogEntry]):
+        data = {
+            "version": CATALOG_VERSION,
+            "entries": [
+                entries[name].model_dump(mode="json") for name in sorted(entries)
+            ],
+        }
+        temp_path = f"{self.path}.{uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, self.path)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def refresh(self, store: "YamlStore") -> tuple[list[CatalogEntry], int]:
+        """
+        Brings the index in line with the schedule files, writing it if
+        anything changed. Returns the entries in name order and how many
+        schedules had to be loaded again. Schedules that fail to load get an
+        entry with the error, which is kept until their files change.
+        """
+        entries = self.read()
+        fresh: dict[str, CatalogEntry] = {}
+        reloaded = 0
+        for name in store.names():
+            path = store.path(name)
+            journal = _stat(store.journal_path(name))
+            entry = entries.get(name)
+            stat = _stat(path)
+            if stat is None:  # removed since it was listed
+                continue
+            if entry is not None and (entry.mtime_ns, entry.size) == stat:
+                if entry.journal == journal:
+                    fresh[name] = entry
+                    continue
+            with open(path, "rb") as f:
+                file_hash = content_hash(f.read())
+            if entry is not None and entry.hash == file_hash:
+                if entry.journal == journal:
+                    # touched but not changed
+                    fresh[name] = entry.model_copy(
+                        update={"mtime_ns": stat[0], "size": stat[1]}
+                    )
+                    continue
+            try:
+                schedule = store.load(name)
+            except (yaml.YAMLError, ValueError, KeyError, TypeError) as err:
+                fresh[name] = self._entry(
+                    store, name, None, file_hash, error=f"{type(err).__name__}: {err}"
+                )
+            else:
+                fresh[name] = self._entry(store, name, schedule, file_hash)
+            reloaded += 1
+
+        if fresh != entries or not self.exists():
+            self.write(fresh)
+        return [fresh[name] for name in sorted(fresh)], reloaded
+
+    def record(self, store: "YamlStore", name: str, schedule: Schedule):
+        """
+        Updates the entry of a schedule the store just wrote, if the directory
+        has an index.
+        """
+        if not self.exists():
+            return
+        entries = self.read()
+        entry = entries.get(name)
+        path = store.path(name)
+        if entry is not None and (entry.mtime_ns, entry.size) == _stat(path):
+            # only the journal changed, the file needn't be hashed again
+            file_hash = entry.hash
+        else:
+            with open(path, "rb") as f:
+                file_hash = content_hash(f.read())
+        entries[name] = self._entry(store, name, schedule, file_hash)
+        self.write(entries)
+
+    def forget(self, name: str):
+        if not self.exists():
+            return
+        entries = self.read()
+        if entries.pop(name, None) is not None:
+            self.write(entries)
+
+    def _entry(
+        self,
+        store: "YamlStore",
+        name: str,
+        schedule: Schedule | None,
+        file_hash: str,
+        error: str | None = None,
+    ) -> CatalogEntry:
+        path = store.path(name)
+        mtime_ns, size = _stat(path)
+        return CatalogEntry(
+            name=name,
+            path=os.path.basename(path),
+            mtime_ns=mtime_ns,
+            size=size,
+            journal=_stat(store.journal_path(name)),
+            rooms=None if schedule is None else len(schedule.rooms),
+            lessons=(
+                None
+                if schedule is None
+                else sum(len(room.lessons) for room in schedule.rooms)
+            ),
+            hash=file_hash,
+            error=error,
+        )
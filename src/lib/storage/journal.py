@@ -0,0 +1,107 @@
+"""
+Append-only journal of the changes made to a schedule since its last snapshot.
+
+Each line is a JSON record holding the full new state of whatever changed, so
+replaying a record twice gives the same schedule as replaying it once. That
+keeps a crash between writing a snapshot and deleting its journal harmless.
+"""
+
+import json
+import os
+
+from ..schedule import Lesson, RoomSchedule, Schedule
+
+SUFFIX = ".journal"
+
+
+def journal_path(directory: str, name: str) -> str:
+    return os.path.join(directory, f"{name}{SUFFIX}")
+
+
+def change_records(schedule: Schedule) -> list[dict]:
+    records = []
+    for change, room_id, lesson_id in schedule.changes:
+        room = schedule.get_room(room_id)
+        if change == "remove_room":
+            records.append({"op": change, "room": room_id})
+        elif change == "remove_lesson":
+            records.append({"op": change, "room": room_id, "lesson": lesson_id})
+        elif room is None:
+            # the room was removed again later on, so was the lesson
+            continue
+        elif change == "add_room":
+            records.append({"op": change, "room": room.model_dump(mode="json")})
+        else:
+            lesson = room.get_lesson(lesson_id)
+            if lesson is not None:
+                records.append(
+                    {
+                        "op": change,
+                        "room": room_id,
+                        "lesson": lesson.model_dump(mode="json"),
+                    }
+                )
+    return records
+
+
+def append_records(path: str, records: list[dict]):
+    text = "".join(
+        f"{json.dumps(record, separators=(',', ':'))}\n" for record in records
+    )
+    with open(path, "a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                # an append was cut short, end its line so the first record
+                # doesn't land on it
+                text = f"\n{text}"
+        f.write(text.encode())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_records(path: str) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        lines = f.readlines()
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            # an append that was cut short, none of its changes were saved
+            continue
+    return records
+
+
+def apply_record(schedule: Schedule, record: dict):
+    op = record["op"]
+    if op == "add_room":
+        room = RoomSchedule.model_validate(record["room"])
+        if schedule.get_room(room.id) is None:
+            schedule.add_room(room)
+    elif op == "remove_room":
+        schedule.remove_room(record["room"])
+    else:
+        room = schedule.get_room(record["room"])
+        if room is None:
+            raise ValueError(f"Journal refers to a missing room {record['room']!r}")
+        if op == "remove_lesson":
+            room.remove_lesson(record["lesson"])
+            return
+        lesson = Lesson.model_validate(record["lesson"])
+        if room.get_lesson(lesson.id) is None:
+            # the lesson was saved even if it overlaps, so it is replayed as is
+            room.add_lesson(lesson, check_overlaps=False)
+        else:
+            room.update_lesson(
+                lesson.id,
+                days=lesson.days,
+                start=lesson.start,
+                end=lesson.end,
+                name=lesson.name,
+            )
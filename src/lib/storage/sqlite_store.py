@@ -0,0 +1,253 @@
+"""
+Schedules stored in one `schedules.sqlite3` database per directory.
+
+Every room and lesson is its own row, so saving an edited schedule only
+touches the rows named in its recorded changes, and loading a single room only
+reads that room's lessons. Days are also kept in `lesson_days`, indexed by
+room and day.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+
+from .. import profiling
+from ..schedule import Lesson, RoomSchedule, Schedule
+from .base import ScheduleStore
+
+DATABASE_NAME = "schedules.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedules (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS rooms (
+    schedule TEXT NOT NULL REFERENCES schedules (name) ON DELETE CASCADE,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (schedule, id)
+);
+CREATE INDEX IF NOT EXISTS rooms_by_name ON rooms (schedule, name, position);
+CREATE TABLE IF NOT EXISTS lessons (
+    schedule TEXT NOT NULL,
+    room_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    days TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (schedule, room_id, id),
+    FOREIGN KEY (schedule, room_id)
+        REFERENCES rooms (schedule, id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS lessons_by_room ON lessons (schedule, room_id, position);
+CREATE TABLE IF NOT EXISTS lesson_days (
+    schedule TEXT NOT NULL,
+    room_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    lesson_id TEXT NOT NULL,
+    PRIMARY KEY (schedule, room_id, day, lesson_id),
+    FOREIGN KEY (schedule, room_id, lesson_id)
+        REFERENCES lessons (schedule, room_id, id) ON DELETE CASCADE
+);
+"""
+
+UPSERT_ROOM = """
+INSERT INTO rooms (schedule, id, name, position)
+VALUES (
+    ?1, ?2, ?3,
+    (SELECT COALESCE(MAX(position) + 1, 0) FROM rooms WHERE schedule = ?1)
+)
+ON CONFLICT (schedule, id) DO UPDATE SET name = excluded.name
+"""
+
+UPSERT_LESSON = """
+INSERT INTO lessons (schedule, room_id, id, name, days, start_time, end_time, position)
+VALUES (
+    ?1, ?2, ?3, ?4, ?5, ?6, ?7,
+    (
+        SELECT COALESCE(MAX(position) + 1, 0) FROM lessons
+        WHERE schedule = ?1 AND room_id = ?2
+    )
+)
+ON CONFLICT (schedule, room_id, id) DO UPDATE SET
+    name = excluded.name,
+    days = excluded.days,
+    start_time = excluded.start_time,
+    end_time = excluded.end_time
+"""
+
+
+class SqliteStore(ScheduleStore):
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, DATABASE_NAME)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def exists(self, name: str) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT 1 FROM schedules WHERE name = ?", (name,)
+            ).fetchone()
+        return row is not None
+
+    def names(self) -> list[str]:
+        if not os.path.exists(self.path):
+            return []
+        with closing(self._connect()) as connection:
+            rows = connection.execute("SELECT name FROM schedules ORDER BY name")
+            return [name for (name,) in rows]
+
+    def create(self, name: str, schedule: Schedule):
+        with closing(self._connect()) as connection, connection:
+            try:
+                connection.execute("INSERT INTO schedules (name) VALUES (?)", (name,))
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Schedule with name {name!r} already exists.")
+            for room in schedule.rooms:
+                self._write_room(connection, name, room)
+        schedule.mark_saved()
+
+    def delete(self, name: str):
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM schedules WHERE name = ?", (name,))
+
+    def version(self, name: str) -> tuple | None:
+        # every schedule shares the database file, so a change to any of them
+        # counts as a change to all
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self, name: str) -> Schedule:
+        with profiling.phase("load"), closing(self._connect()) as connection:
+            if not connection.execute(
+                "SELECT 1 FROM schedules WHERE name = ?", (name,)
+            ).fetchone():
+                raise ValueError(f"Schedule with name {name!r} does not exist.")
+            rooms = {
+                room_id: {"id": room_id, "name": room_name, "lessons": []}
+                for room_id, room_name in connection.execute(
+                    "SELECT id, name FROM rooms WHERE schedule = ? ORDER BY position",
+                    (name,),
+                )
+            }
+            for row in connection.execute(
+                "SELECT room_id, id, name, days, start_time, end_time FROM lessons"
+                " WHERE schedule = ? ORDER BY position",
+                (name,),
+            ):
+                rooms[row[0]]["lessons"].append(_lesson_dict(row))
+        with profiling.phase("validate"):
+            return Schedule.model_validate({"rooms": list(rooms.values())})
+
+    def load_room(self, name: str, room_name: str) -> RoomSchedule | None:
+        with profiling.phase("load"), closing(self._connect()) as connection:
+            room = connection.execute(
+                "SELECT id, name FROM rooms"
+                " WHERE schedule = ?1 AND (name = ?2 OR id = ?2)"
+                " ORDER BY name = ?2 DESC, position LIMIT 1",
+                (name, room_name),
+            ).fetchone()
+            if room is None:
+                return None
+            lessons = connection.execute(
+                "SELECT room_id, id, name, days, start_time, end_time FROM lessons"
+                " WHERE schedule = ? AND room_id = ? ORDER BY position",
+                (name, room[0]),
+            )
+            room_dict = {
+                "id": room[0],
+                "name": room[1],
+                "lessons": [_lesson_dict(row) for row in lessons],
+            }
+        with profiling.phase("validate"):
+            return RoomSchedule.model_validate(room_dict)
+
+    def save(self, name: str, schedule: Schedule):
+        if not schedule.is_dirty:
+            return
+        with profiling.phase("save"):
+            self._write_changes(name, schedule)
+        schedule.mark_saved()
+
+    def _write_changes(self, name: str, schedule: Schedule):
+        with closing(self._connect()) as connection, connection:
+            for change, room_id, lesson_id in schedule.changes:
+                room = schedule.get_room(room_id)
+                if change == "remove_room":
+                    connection.execute(
+                        "DELETE FROM rooms WHERE schedule = ? AND id = ?",
+                        (name, room_id),
+                    )
+                elif change == "remove_lesson":
+                    connection.execute(
+                        "DELETE FROM lessons"
+                        " WHERE schedule = ? AND room_id = ? AND id = ?",
+                        (name, room_id, lesson_id),
+                    )
+                elif room is None:
+                    # the room was removed again later on, so was the lesson
+                    continue
+                elif change == "add_room":
+                    self._write_room(connection, name, room)
+                else:
+                    lesson = room.get_lesson(lesson_id)
+                    if lesson is not None:
+                        self._write_lesson(connection, name, room.id, lesson)
+
+    def _write_room(
+        self, connection: sqlite3.Connection, name: str, room: RoomSchedule
+    ):
+        connection.execute(UPSERT_ROOM, (name, room.id, room.name))
+        for lesson in room.lessons:
+            self._write_lesson(connection, name, room.id, lesson)
+
+    def _write_lesson(
+        self, connection: sqlite3.Connection, name: str, room_id: str, lesson: Lesson
+    ):
+        days = [day.value for day in lesson.days]
+        connection.execute(
+            UPSERT_LESSON,
+            (
+                name,
+                room_id,
+                lesson.id,
+                lesson.name,
+                ",".join(days),
+                lesson.start.isoformat(),
+                lesson.end.isoformat(),
+            ),
+        )
+        connection.execute(
+            "DELETE FROM lesson_days"
+            " WHERE schedule = ? AND room_id = ? AND lesson_id = ?",
+            (name, room_id, lesson.id),
+        )
+        connection.executemany(
+            "INSERT INTO lesson_days (schedule, room_id, day, lesson_id)"
+            " VALUES (?, ?, ?, ?)",
+            [(name, room_id, day, lesson.id) for day in dict.fromkeys(days)],
+        )
+
+
+def _lesson_dict(row: tuple) -> dict:
+    _, lesson_id, name, days, start, end = row
+    return {
+        "id": lesson_id,
+        "name": name,
+        "days": days.split(",") if days else [],
+        "start": start,
+        "end": end,
+    }
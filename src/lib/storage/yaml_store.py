@@ -0,0 +1,216 @@
+"""
+Schedules stored as `{name}.yaml` files.
+
+PyYAML's pure Python loader and dumper dominate load/save time on big
+schedules, so the libyaml based ones are used whenever PyYAML was built with
+libyaml.
+
+`JournalStore` appends each save's changes to a `{name}.journal` file next to
+the snapshot instead of rewriting it, folding the journal back into the
+snapshot once it grows past `COMPACT_THRESHOLD` records.
+"""
+
+import os
+import shutil
+from contextlib import suppress
+from typing import IO
+from uuid import uuid4
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML was built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+from .. import profiling
+from ..schedule import Schedule
+from . import journal
+from .cache import ParseCache
+from .catalog import Catalog
+from .base import ScheduleStore
+
+SUFFIX = ".yaml"
+COMPACT_THRESHOLD = 1000
+
+
+def schedule_path(directory: str, name: str) -> str:
+    return os.path.join(directory, f"{name}{SUFFIX}")
+
+
+def read_schedule_dict(stream: IO[str]) -> dict:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def write_schedule_dict(schedule_dict: dict, stream: IO[str]):
+    yaml.dump(schedule_dict, stream, Dumper=SafeDumper)
+
+
+def load_schedule(path: str, cache: ParseCache | None = None) -> Schedule:
+    with profiling.phase("load"):
+        with open(path, "rb") as f:
+            content = f.read()
+        if cache is not None:
+            schedule = cache.get(path, content)
+            if schedule is not None:
+                return schedule
+        schedule_dict = yaml.load(content, Loader=SafeLoader)
+
+    with profiling.phase("validate"):
+        schedule = Schedule.model_validate(schedule_dict)
+    if cache is not None:
+        with profiling.phase("load"):
+            cache.put(path, content, schedule)
+    return schedule
+
+
+def save_schedule(schedule: Schedule, path: str):
+    """
+    Writes the schedule to a temporary file next to `path` and swaps it into
+    place, so a crash part way through leaves the old file instead of a
+    truncated one.
+    """
+    with profiling.phase("save"):
+        _save_schedule(schedule, path)
+
+
+def _save_schedule(schedule: Schedule, path: str):
+    temp_path = f"{path}.{uuid4().hex}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w") as f:
+            write_schedule_dict(schedule.model_dump(mode="json"), f)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(os.path.dirname(path))
+
+
+def _fsync_directory(directory: str):
+    # makes the rename itself durable, directories can't be opened on Windows
+    if os.name != "posix":
+        return
+    fd = os.open(directory or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _file_version(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class YamlStore(ScheduleStore):
+    def path(self, name: str) -> str:
+        return schedule_path(self.directory, name)
+
+    def journal_path(self, name: str) -> str:
+        return journal.journal_path(self.directory, name)
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self.path(name))
+
+    def names(self) -> list[str]:
+        return sorted(
+            filename[: -len(SUFFIX)]
+            for filename in os.listdir(self.directory)
+            if filename.endswith(SUFFIX)
+        )
+
+    def create(self, name: str, schedule: Schedule):
+        self._write_snapshot(name, schedule)
+
+    def load(self, name: str) -> Schedule:
+        schedule = load_schedule(self.path(name), self.cache)
+        with profiling.phase("load"):
+            records = self._read_journal(name)
+            for record in records:
+                journal.apply_record(schedule, record)
+        schedule.mark_saved()
+        return schedule
+
+    def save(self, name: str, schedule: Schedule):
+        if not schedule.is_dirty:
+            return
+        self._write_snapshot(name, schedule)
+
+    def delete(self, name: str):
+        os.remove(self.path(name))
+        with suppress(FileNotFoundError):
+            os.remove(self.journal_path(name))
+        Catalog(self.directory).forget(name)
+
+    def version(self, name: str) -> tuple:
+        return (_file_version(self.path(name)), _file_version(self.journal_path(name)))
+
+    def compact(self, name: str) -> int:
+        records = self._read_journal(name)
+        if records:
+            self._write_snapshot(name, self.load(name))
+        return len(records)
+
+    def _read_journal(self, name: str) -> list[dict]:
+        return journal.read_records(self.journal_path(name))
+
+    def _write_snapshot(self, name: str, schedule: Schedule):
+        # the journal only holds changes newer than the snapshot, so it goes
+        # once the snapshot is written; replaying it again would be harmless
+        path = self.path(name)
+        save_schedule(schedule, path)
+        with suppress(FileNotFoundError):
+            os.remove(self.journal_path(name))
+        schedule.mark_saved()
+        if self.cache is not None:
+            with profiling.phase("save"), open(path, "rb") as f:
+                self.cache.put(path, f.read(), schedule)
+        with profiling.phase("save"):
+            Catalog(self.directory).record(self, name, schedule)
+
+
+class JournalStore(YamlStore):
+    def __init__(self, directory: str, cache: ParseCache | None = None):
+        super().__init__(directory, cache=cache)
+        # records in each journal as of its last seen version, so saves can
+        # tell when to compact without reading the journal back
+        self._record_counts: dict[str, tuple[tuple[int, int] | None, int]] = {}
+
+    def save(self, name: str, schedule: Schedule):
+        if not schedule.is_dirty:
+            return
+        path = self.journal_path(name)
+        records = journal.change_records(schedule)
+        count = self._record_count(name)
+        with profiling.phase("save"):
+            journal.append_records(path, records)
+            Catalog(self.directory).record(self, name, schedule)
+        schedule.mark_saved()
+        count += len(records)
+        self._record_counts[name] = (_file_version(path), count)
+        if count >= COMPACT_THRESHOLD:
+            self._write_snapshot(name, schedule)
+
+    def _record_count(self, name: str) -> int:
+        version, count = self._record_counts.get(name, (None, 0))
+        if version != _file_version(self.journal_path(name)):
+            # written to by someone else since, or never seen
+            count = len(self._read_journal(name))
+        return count
+
+    def _read_journal(self, name: str) -> list[dict]:
+        # the version comes first, an append landing in between only makes
+        # the next save count again
+        version = _file_version(self.journal_path(name))
+        records = super()._read_journal(name)
+        self._record_counts[name] = (version, len(records))
+        return records
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+
+from .schedule import LessonConflict
+from .storage import YamlStore
+
+
+class ValidationResult(BaseModel):
+    name: str
+    # why the schedule couldn't be loaded, if it couldn't
+    error: str | None = None
+    conflicts: list[LessonConflict] = []
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.conflicts
+
+
+def validate_schedule_file(directory: str, name: str) -> ValidationResult:
+    """
+    Parses, validates and checks one schedule of a directory for overlapping
+    lessons, replaying its journal if it has one. Never raises, so it can run
+    in a worker process and report back whatever went wrong.
+    """
+    # validated from scratch, a cached copy would skip the part being checked
+    store = YamlStore(directory)
+    try:
+        schedule = store.load(name)
+    except Exception as err:
+        return ValidationResult(name=name, error=f"{type(err).__name__}: {err}")
+    return ValidationResult(name=name, conflicts=schedule.find_conflicts())
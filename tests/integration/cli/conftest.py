@@ -6,6 +6,14 @@ from tests.integration.cli.utils import schedule_session
 logger = getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def parse_cache_dir(monkeypatch, tmp_path_factory):
+    # keep the tests from filling the user's own cache
+    directory = str(tmp_path_factory.mktemp("cache"))
+    monkeypatch.setenv("EDA_APP_CACHE_DIR", directory)
+    return directory
+
+
 @pytest.fixture
 def default_schedule_in_current_dir():
     name = "Schedule"
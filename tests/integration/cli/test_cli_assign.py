@@ -0,0 +1,80 @@
+import yaml
+
+from click.testing import CliRunner
+from cli.app import main
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+
+
+def create_schedule(directory: str) -> None:
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A")
+                ],
+            ),
+            RoomSchedule(name="Gym"),
+        ]
+    )
+    with open(f"{directory}/Schedule.yaml", "w") as fp:
+        yaml.safe_dump(schedule.model_dump(mode="json"), fp)
+
+
+def test_assign_schedule_places_lessons_and_saves(tmp_path):
+    create_schedule(str(tmp_path))
+    lessons_file = tmp_path / "lessons.csv"
+    lessons_file.write_text(
+        "name,days,start,end\n"
+        "Maths,monday,09:30,10:30\n"
+        "Science,monday,11:00,12:00\n"
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["schedule", "assign", "-d", str(tmp_path), "-f", str(lessons_file)]
+        + ["Schedule"],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Assigned 2 lesson(s) to 2 room(s)." in result.output
+
+    schedule_dict = yaml.safe_load((tmp_path / "Schedule.yaml").read_text())
+    homeroom, gym = schedule_dict["rooms"]
+    assert [lesson["name"] for lesson in homeroom["lessons"]] == ["A", "Science"]
+    assert [lesson["name"] for lesson in gym["lessons"]] == ["Maths"]
+
+
+def test_assign_schedule_lists_unplaced_lessons_and_fails(tmp_path):
+    create_schedule(str(tmp_path))
+    lessons_file = tmp_path / "lessons.jsonl"
+    lessons_file.write_text(
+        '{"name": "Maths", "days": ["monday"], "start": "09:00", "end": "10:00"}\n'
+        '{"name": "Science", "days": ["monday"], "start": "09:30", "end": "11:00"}\n'
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["schedule", "assign", "-d", str(tmp_path), "-f", str(lessons_file)]
+        + ["Schedule"],
+    )
+    assert result.exit_code == 1
+    assert "Assigned 1 lesson(s) to 1 room(s)." in result.output
+    assert "No room is free for 'Science' (monday 09:30-11:00)." in result.output
+
+    schedule_dict = yaml.safe_load((tmp_path / "Schedule.yaml").read_text())
+    assert [lesson["name"] for lesson in schedule_dict["rooms"][1]["lessons"]] == [
+        "Maths"
+    ]
+
+
+def test_assign_schedule_nonexistent_schedule_fails(tmp_path):
+    lessons_file = tmp_path / "lessons.csv"
+    lessons_file.write_text("name,days,start,end\n")
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["schedule", "assign", "-d", str(tmp_path), "-f", str(lessons_file)]
+        + ["Missing"],
+    )
+    assert result.exit_code == 1
+    assert "does not exist" in result.output
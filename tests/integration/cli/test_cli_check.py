@@ -0,0 +1,79 @@
+import json
+
+from click.testing import CliRunner
+from cli.app import main
+from tests.integration.cli.utils import schedule_session
+from lib.schedule import Schedule, RoomSchedule, Lesson, Day
+
+
+# ********** CHECK SCHEDULE TESTS **********
+def test_check_schedule_without_conflicts_succeeds():
+    runner = CliRunner()
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A"),
+                    Lesson(days=[Day.MONDAY], start="10:30", end="11:00", name="B"),
+                ],
+            )
+        ]
+    )
+    with schedule_session("Valid", data=schedule) as name:
+        result = runner.invoke(main, ["schedule", "check", name])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {
+        "schedule": "Valid",
+        "conflict_count": 0,
+        "conflicts": [],
+    }
+
+
+def test_check_schedule_with_hand_edited_overlaps_reports_them_and_fails():
+    runner = CliRunner()
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A"),
+                    Lesson(days=[Day.MONDAY], start="09:30", end="11:00", name="B"),
+                ],
+            ),
+            RoomSchedule(
+                name="Gym",
+                lessons=[
+                    Lesson(
+                        days=[Day.TUESDAY, Day.FRIDAY],
+                        start="09:00",
+                        end="10:00",
+                        name="C",
+                    ),
+                    Lesson(days=[Day.FRIDAY], start="08:00", end="09:00", name="D"),
+                ],
+            ),
+        ]
+    )
+    with schedule_session("Overlapping", data=schedule) as name:
+        result = runner.invoke(main, ["schedule", "check", name])
+    assert result.exit_code == 1, result.output
+
+    report = json.loads(result.output)
+    assert report["conflict_count"] == 2
+    assert [
+        (
+            conflict["room_name"],
+            conflict["day"],
+            conflict["first"]["name"],
+            conflict["second"]["name"],
+        )
+        for conflict in report["conflicts"]
+    ] == [("Homeroom", "monday", "A", "B"), ("Gym", "friday", "D", "C")]
+
+
+def test_check_schedule_noexistant_schedule_fails():
+    runner = CliRunner()
+    result = runner.invoke(main, ["schedule", "check", "Nonexistant Schedule"])
+    assert result.exit_code == 1
+    assert "does not exist" in result.output
@@ -5,7 +5,7 @@ import pytest
 from click.testing import CliRunner
 import yaml
 from cli.app import main
-from lib.schedule import Schedule
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
 from tests.integration.cli.utils import schedule_session
 
 
@@ -651,3 +651,311 @@ def test_edit_schedule_change_to_valid_name_succeeds(schedule, room, lesson):
         ],
     )
     assert result.exit_code == 0
+
+
+# ******* IMPORT LESSONS TESTS *******
+def test_edit_schedule_import_lessons_from_csv_succeeds(schedule, room, tmp_path):
+    lessons_file = tmp_path / "lessons.csv"
+    lessons_file.write_text(
+        "name,days,start,end\n"
+        'Maths,"monday,wednesday",09:00,10:00\n'
+        "Science,tuesday,09:00,10:00\n"
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            room,
+            "import-lessons",
+            str(lessons_file),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    with open(os.path.join(os.getcwd(), f"{schedule}.yaml"), "r") as f:
+        schedule_dict = yaml.safe_load(f)
+    lessons = schedule_dict["rooms"][0]["lessons"]
+    assert [lesson["name"] for lesson in lessons] == ["Maths", "Science"]
+    assert lessons[0]["days"] == ["monday", "wednesday"]
+
+
+def test_edit_schedule_import_lessons_with_overlaps_reports_all_and_imports_none(
+    schedule, room, lesson, tmp_path
+):
+    lessons_file = tmp_path / "lessons.jsonl"
+    lessons_file.write_text(
+        '{"name": "Clash", "days": ["monday"], "start": "10:30", "end": "12:00"}\n'
+        '{"name": "Double Clash", "days": ["monday"], "start": "11:30", "end": "13:00"}\n'
+        '{"name": "Fine", "days": ["friday"], "start": "11:30", "end": "13:00"}\n'
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            room,
+            "import-lessons",
+            str(lessons_file),
+        ],
+    )
+    assert result.exit_code == 1, result.output
+    assert "'My CLI Test Lesson' (10:00-11:00) overlaps 'Clash'" in result.output
+    assert "'Clash' (10:30-12:00) overlaps 'Double Clash'" in result.output
+
+    with open(os.path.join(os.getcwd(), f"{schedule}.yaml"), "r") as f:
+        schedule_dict = yaml.safe_load(f)
+    assert len(schedule_dict["rooms"][0]["lessons"]) == 1
+
+
+def test_edit_schedule_import_lessons_with_invalid_lesson_fails(
+    schedule, room, tmp_path
+):
+    lessons_file = tmp_path / "lessons.csv"
+    lessons_file.write_text("name,days,start,end\nBackwards,monday,12:00,11:00\n")
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            room,
+            "import-lessons",
+            str(lessons_file),
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Invalid lessons file" in result.output
+
+
+def test_edit_schedule_import_lessons_unknown_format_fails(schedule, room, tmp_path):
+    lessons_file = tmp_path / "lessons.txt"
+    lessons_file.write_text("")
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            room,
+            "import-lessons",
+            str(lessons_file),
+        ],
+    )
+    assert result.exit_code == 1
+    assert "--format" in result.output
+
+
+@pytest.fixture
+def duplicate_lessons():
+    data = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="My CLI Test Room",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="Twin"),
+                    Lesson(days=[Day.TUESDAY], start="09:00", end="10:00", name="Twin"),
+                ],
+            )
+        ],
+    )
+    with schedule_session("My CLI Test Schedule", data=data) as schedule_name:
+        yield schedule_name, data.rooms[0].lessons
+
+
+def test_edit_schedule_remove_lesson_with_duplicate_name_fails(duplicate_lessons):
+    schedule, lessons = duplicate_lessons
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            "My CLI Test Room",
+            "remove-lesson",
+            "Twin",
+        ],
+    )
+    assert result.exit_code == 1
+    assert lessons[0].id in result.output
+    assert lessons[1].id in result.output
+
+
+def test_edit_schedule_remove_lesson_with_duplicate_name_by_id_succeeds(
+    duplicate_lessons,
+):
+    schedule, lessons = duplicate_lessons
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            "My CLI Test Room",
+            "remove-lesson",
+            lessons[1].id,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    with open(os.path.join(os.getcwd(), f"{schedule}.yaml"), "r") as f:
+        schedule_dict = yaml.safe_load(f)
+    assert [lesson["id"] for lesson in schedule_dict["rooms"][0]["lessons"]] == [
+        lessons[0].id
+    ]
+
+
+# ******* SAVING TESTS *******
+def schedule_modified_time(schedule_name: str) -> int:
+    return os.stat(os.path.join(os.getcwd(), f"{schedule_name}.yaml")).st_mtime_ns
+
+
+def test_edit_schedule_that_changes_nothing_does_not_save(schedule, room, lesson):
+    before = schedule_modified_time(schedule)
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["schedule", "edit", schedule, "room", room, "remove-lesson", "Not A Lesson"],
+    )
+    assert result.exit_code == 0
+    assert "Saving schedule..." not in result.output
+    assert schedule_modified_time(schedule) == before
+
+
+@pytest.mark.parametrize("same_name", [False, True])
+def test_edit_schedule_lesson_edit_that_changes_nothing_does_not_save(
+    schedule, room, lesson, same_name
+):
+    before = schedule_modified_time(schedule)
+    runner = CliRunner()
+    options = ["-n", lesson] if same_name else []
+    result = runner.invoke(
+        main, ["schedule", "edit", schedule, "room", room, "lesson", lesson, *options]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Saving schedule..." not in result.output
+    assert schedule_modified_time(schedule) == before
+
+
+def test_edit_schedule_that_fails_does_not_save(schedule, room, lesson):
+    before = schedule_modified_time(schedule)
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            schedule,
+            "room",
+            room,
+            "lesson",
+            lesson,
+            "-d",
+            "friday",
+            "-s",
+            "12:00",
+            "-e",
+            "11:00",
+        ],
+    )
+    assert result.exit_code == 1
+    assert schedule_modified_time(schedule) == before
+
+
+# ******* BATCH TESTS *******
+def load_schedule_file(schedule_name: str) -> Schedule:
+    with open(os.path.join(os.getcwd(), f"{schedule_name}.yaml"), "r") as f:
+        return Schedule.model_validate(yaml.safe_load(f))
+
+
+def test_edit_schedule_batch_from_stdin_applies_all_operations(schedule):
+    operations = "\n".join(
+        [
+            '{"op": "create-room", "name": "Lab"}',
+            '{"op": "create-room", "name": "Gym"}',
+            '{"op": "add-lesson", "room": "Lab", "days": ["monday", "friday"],'
+            ' "start": "09:00", "end": "10:00", "name": "Biology"}',
+            '["room", "Lab", "add-lesson", "-d", "monday", "-s", "11:00",'
+            ' "-e", "12:00", "-n", "Physics"]',
+            '{"op": "lesson", "room": "Lab", "lesson": "Physics", "name": "Chemistry"}',
+            '{"op": "remove-lesson", "room": "Lab", "lesson": "Biology"}',
+            "",
+            '{"op": "remove-room", "room": "Gym"}',
+        ]
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["schedule", "edit", schedule, "batch"], input=operations
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Applied 7 operation(s)." in result.output
+    assert result.output.count("Saving schedule...") == 1
+    saved = load_schedule_file(schedule)
+    assert [room.name for room in saved.rooms] == ["Lab"]
+    assert [lesson.name for lesson in saved.rooms[0].lessons] == ["Chemistry"]
+
+
+def test_edit_schedule_batch_from_file_succeeds(schedule, tmp_path):
+    path = tmp_path / "ops.jsonl"
+    path.write_text('{"op": "create-room", "name": "Lab"}\n')
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["schedule", "edit", schedule, "batch", "-f", str(path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [room.name for room in load_schedule_file(schedule).rooms] == ["Lab"]
+
+
+@pytest.mark.parametrize(
+    "failing_operation",
+    [
+        '{"op": "add-lesson", "room": "Lab", "days": ["monday"],'
+        ' "start": "09:30", "end": "10:30", "name": "Overlap"}',
+        '{"op": "add-lesson", "room": "Lab", "days": ["someday"],'
+        ' "start": "12:00", "end": "13:00", "name": "Bad Day"}',
+        '{"op": "lesson", "room": "Missing", "lesson": "Biology"}',
+        '{"op": "rename-room", "room": "Lab"}',
+        '["view"]',
+        '["batch"]',
+        "[]",
+        "not json",
+    ],
+)
+def test_edit_schedule_batch_with_failing_operation_saves_nothing(
+    schedule, failing_operation
+):
+    before = schedule_modified_time(schedule)
+    operations = "\n".join(
+        [
+            '{"op": "create-room", "name": "Lab"}',
+            '{"op": "add-lesson", "room": "Lab", "days": ["monday"],'
+            ' "start": "09:00", "end": "10:00", "name": "Biology"}',
+            failing_operation,
+        ]
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["schedule", "edit", schedule, "batch"], input=operations
+    )
+
+    assert result.exit_code == 1
+    assert "line 3" in result.output
+    assert "Saving schedule..." not in result.output
+    assert schedule_modified_time(schedule) == before
+    assert load_schedule_file(schedule).rooms == []
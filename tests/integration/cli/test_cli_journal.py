@@ -0,0 +1,86 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from cli.app import main
+from lib.storage import YamlStore
+
+
+@pytest.fixture
+def journal_schedule(tmp_path):
+    runner = CliRunner()
+    directory = str(tmp_path)
+    result = runner.invoke(main, ["schedule", "create", "Schedule", "-d", directory])
+    assert result.exit_code == 0, result.output
+    return directory
+
+
+def edit(directory: str, *args: str):
+    return CliRunner().invoke(
+        main,
+        [
+            "schedule",
+            "edit",
+            "-d",
+            directory,
+            "--storage",
+            "journal",
+            "Schedule",
+            *args,
+        ],
+    )
+
+
+# ********** JOURNAL STORAGE TESTS **********
+def test_journal_storage_edit_appends_to_journal(journal_schedule):
+    assert edit(journal_schedule, "create-room", "Homeroom").exit_code == 0
+    result = edit(
+        journal_schedule,
+        "room",
+        "Homeroom",
+        "add-lesson",
+        "-d",
+        "monday",
+        "-s",
+        "09:00",
+        "-e",
+        "10:00",
+        "-n",
+        "Math",
+    )
+    assert result.exit_code == 0, result.output
+
+    assert sorted(os.listdir(journal_schedule)) == [
+        "Schedule.journal",
+        "Schedule.yaml",
+    ]
+    result = CliRunner().invoke(
+        main, ["schedule", "view", "-d", journal_schedule, "Schedule"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Homeroom" in result.output
+    assert "Math" in result.output
+
+
+def test_compact_schedule_folds_journal(journal_schedule):
+    assert edit(journal_schedule, "create-room", "Homeroom").exit_code == 0
+
+    result = CliRunner().invoke(
+        main, ["schedule", "compact", "Schedule", "-d", journal_schedule]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Compacted 1 journal record(s)." in result.output
+    assert os.listdir(journal_schedule) == ["Schedule.yaml"]
+    schedule = YamlStore(journal_schedule).load("Schedule")
+    assert [room.name for room in schedule.rooms] == ["Homeroom"]
+
+
+def test_compact_schedule_does_not_exist_fails(journal_schedule):
+    result = CliRunner().invoke(
+        main, ["schedule", "compact", "Missing", "-d", journal_schedule]
+    )
+
+    assert result.exit_code == 1
+    assert "does not exist" in result.output
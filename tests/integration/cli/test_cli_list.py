@@ -0,0 +1,64 @@
+import json
+
+from click.testing import CliRunner
+from cli.app import main
+
+
+def test_list_schedules_shows_counts_and_follows_edits(tmp_path):
+    runner = CliRunner()
+    directory = str(tmp_path)
+    runner.invoke(main, ["schedule", "create", "Empty", "-d", directory])
+    runner.invoke(main, ["schedule", "create", "Busy", "-d", directory])
+
+    result = runner.invoke(main, ["schedule", "list", "-d", directory])
+    assert result.exit_code == 0, result.output
+    assert "Busy" in result.output and "Empty" in result.output
+
+    runner.invoke(
+        main, ["schedule", "edit", "-d", directory, "Busy", "create-room", "Homeroom"]
+    )
+    result = runner.invoke(main, ["schedule", "list", "-d", directory, "--json"])
+    assert result.exit_code == 0, result.output
+    entries = json.loads(result.output)
+    assert [(entry["name"], entry["rooms"]) for entry in entries] == [
+        ("Busy", 1),
+        ("Empty", 0),
+    ]
+
+
+def test_list_schedules_reports_files_that_fail_to_load(tmp_path):
+    runner = CliRunner()
+    directory = str(tmp_path)
+    runner.invoke(main, ["schedule", "create", "Good", "-d", directory])
+    (tmp_path / "Broken.yaml").write_text("rooms: [unclosed\n")
+    (tmp_path / "Invalid.yaml").write_text("rooms:\n  - lessons: 3\n")
+
+    result = runner.invoke(main, ["schedule", "list", "-d", directory])
+    assert result.exit_code == 0, result.output
+    assert "Good" in result.output
+    assert "Could not load 'Broken': ParserError" in result.output
+    assert "Could not load 'Invalid': ValidationError" in result.output
+
+    result = CliRunner(mix_stderr=False).invoke(
+        main, ["schedule", "list", "-d", directory, "--json"]
+    )
+    assert result.exit_code == 0, result.output
+    errors = {entry["name"]: entry["error"] for entry in json.loads(result.output)}
+    assert errors["Good"] is None
+    assert errors["Broken"] and errors["Invalid"]
+
+
+def test_list_schedules_empty_directory(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(main, ["schedule", "list", "-d", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "No schedules found." in result.output
+
+
+def test_list_schedules_sqlite_storage_fails(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["schedule", "list", "-d", str(tmp_path), "--storage", "sqlite"]
+    )
+    assert result.exit_code == 1
+    assert "only works for schedule files" in result.output
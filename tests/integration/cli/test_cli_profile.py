@@ -0,0 +1,47 @@
+import pstats
+
+from click.testing import CliRunner
+from cli.app import main
+from lib import profiling
+
+
+def test_profile_reports_phase_timings(tmp_path):
+    runner = CliRunner(mix_stderr=False)
+    directory = str(tmp_path)
+    runner.invoke(main, ["schedule", "create", "Schedule", "-d", directory])
+    edit = ["schedule", "edit", "-d", directory, "--no-cache", "Schedule"]
+
+    result = runner.invoke(main, ["--profile", *edit, "create-room", "Homeroom"])
+
+    assert result.exit_code == 0, result.output
+    assert "Saving schedule..." in result.stdout
+    phases = [line.split(":")[0].strip() for line in result.stderr.splitlines()]
+    assert phases == [*profiling.PHASES, "total"]
+    assert not profiling.is_enabled()
+
+
+def test_profile_output_writes_cprofile_stats(tmp_path):
+    runner = CliRunner(mix_stderr=False)
+    stats_path = tmp_path / "view.prof"
+    directory = str(tmp_path)
+    runner.invoke(main, ["schedule", "create", "Schedule", "-d", directory])
+
+    result = runner.invoke(
+        main,
+        ["--profile-output", str(stats_path), "schedule", "view", "-d", directory]
+        + ["Schedule"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert f"Wrote cProfile stats to {stats_path}." in result.stderr
+    assert pstats.Stats(str(stats_path)).total_calls > 0
+
+
+def test_without_profile_nothing_is_timed(tmp_path):
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        main, ["schedule", "create", "Schedule", "-d", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stderr == ""
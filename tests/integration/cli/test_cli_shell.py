@@ -0,0 +1,145 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from cli.app import main
+from lib.storage import YamlStore
+
+
+@pytest.fixture
+def directory(tmp_path):
+    directory = str(tmp_path)
+    result = CliRunner().invoke(
+        main, ["schedule", "create", "Schedule", "-d", directory]
+    )
+    assert result.exit_code == 0, result.output
+    return directory
+
+
+def run_shell(directory: str, *lines: str):
+    return CliRunner().invoke(
+        main,
+        ["schedule", "shell", "-d", directory, "Schedule"],
+        input="".join(f"{line}\n" for line in lines),
+    )
+
+
+def saved_rooms(directory: str) -> list[str]:
+    return [room.name for room in YamlStore(directory).load("Schedule").rooms]
+
+
+# ********** SCHEDULE SHELL TESTS **********
+def test_shell_runs_edits_and_views_from_memory(directory):
+    result = run_shell(
+        directory,
+        'create-room "Science Lab"',
+        'room "Science Lab" add-lesson -d monday -s 09:00 -e 10:00 -n Biology',
+        "view",
+        'view room "Science Lab"',
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Lesson added successfully." in result.output
+    assert result.output.count("Biology") == 2
+    assert result.output.count("Saving schedule...") == 1
+    assert saved_rooms(directory) == ["Science Lab"]
+
+
+def test_shell_keeps_going_after_failed_command(directory):
+    result = run_shell(
+        directory,
+        "create-room Lab",
+        "room Lab add-lesson -d monday -s 09:00 -e 10:00 -n Biology",
+        "room Lab add-lesson -d monday -s 09:30 -e 10:30 -n Overlap",
+        "room Missing remove-lesson Biology",
+        "not-a-command",
+        'create-room "unclosed',
+        "create-room Gym",
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Lesson overlaps with existing lesson" in result.output
+    assert "Room with name 'Missing' does not exist." in result.output
+    assert "No such command 'not-a-command'" in result.output
+    assert saved_rooms(directory) == ["Lab", "Gym"]
+
+
+def test_shell_save_writes_changes_before_exit(directory):
+    result = run_shell(directory, "create-room Lab", "save", "save", "exit --discard")
+
+    assert result.exit_code == 0, result.output
+    assert "Nothing to save." in result.output
+    assert saved_rooms(directory) == ["Lab"]
+
+
+def test_shell_exit_discard_does_not_save(directory):
+    before = os.stat(os.path.join(directory, "Schedule.yaml")).st_mtime_ns
+
+    result = run_shell(directory, "create-room Lab", "exit --discard")
+
+    assert result.exit_code == 0, result.output
+    assert "Saving schedule..." not in result.output
+    assert os.stat(os.path.join(directory, "Schedule.yaml")).st_mtime_ns == before
+
+
+def test_shell_failed_batch_leaves_no_edits_behind(directory, tmp_path):
+    operations = tmp_path / "ops.jsonl"
+    operations.write_text(
+        '{"op": "create-room", "name": "Lab"}\n'
+        '{"op": "remove-room", "room": "Lab"}\n'
+        '{"op": "lesson", "room": "Lab", "lesson": "Biology"}\n'
+    )
+
+    result = run_shell(
+        directory, "create-room Gym", f"batch -f {operations}", "create-room Hall"
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Operation on line 3 failed" in result.output
+    assert saved_rooms(directory) == ["Gym", "Hall"]
+
+
+def test_shell_edits_after_failed_batch_are_saved(directory, tmp_path):
+    operations = tmp_path / "ops.jsonl"
+    operations.write_text(
+        '{"op": "create-room", "name": "Gym"}\n'
+        '{"op": "lesson", "room": "Gym", "lesson": "Missing"}\n'
+    )
+
+    result = run_shell(
+        directory,
+        "create-room Lab",
+        f"batch -f {operations}",
+        "room Lab add-lesson -d monday -s 09:00 -e 10:00 -n Maths",
+        "view",
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Operation on line 2 failed" in result.output
+    assert "Maths" in result.output.split("Lesson added successfully.")[1]
+    rooms = YamlStore(directory).load("Schedule").rooms
+    assert [room.name for room in rooms] == ["Lab"]
+    assert [lesson.name for lesson in rooms[0].lessons] == ["Maths"]
+
+
+def test_shell_schedule_does_not_exist_fails(directory):
+    result = CliRunner().invoke(
+        main, ["schedule", "shell", "-d", directory, "Missing"], input="exit\n"
+    )
+
+    assert result.exit_code == 1
+    assert "does not exist" in result.output
+
+
+@pytest.mark.parametrize("operation", ['["save"]', '["view"]', '["exit"]'])
+def test_shell_batch_runs_only_edit_operations(directory, tmp_path, operation):
+    operations = tmp_path / "ops.jsonl"
+    operations.write_text(f'["create-room", "Gym"]\n{operation}\n')
+
+    result = run_shell(directory, f"batch -f {operations}", "exit --discard")
+
+    assert result.exit_code == 0, result.output
+    assert "Only edit operations can run in a batch" in result.output
+    assert "Saving schedule..." not in result.output
+    assert saved_rooms(directory) == []
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from cli.app import main
+from lib.storage import SqliteStore
+
+
+@pytest.fixture
+def sqlite_schedule(tmp_path):
+    runner = CliRunner()
+    directory = str(tmp_path)
+    result = runner.invoke(
+        main, ["schedule", "create", "Schedule", "-d", directory, "--storage", "sqlite"]
+    )
+    assert result.exit_code == 0, result.output
+    return directory
+
+
+def edit(directory: str, *args: str):
+    return CliRunner().invoke(
+        main,
+        ["schedule", "edit", "-d", directory, "--storage", "sqlite", "Schedule", *args],
+    )
+
+
+# ********** SQLITE STORAGE TESTS **********
+def test_sqlite_storage_create_schedule_stores_it_in_database(sqlite_schedule):
+    assert os.listdir(sqlite_schedule) == ["schedules.sqlite3"]
+    assert SqliteStore(sqlite_schedule).names() == ["Schedule"]
+
+
+def test_sqlite_storage_create_duplicate_schedule_fails(sqlite_schedule):
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "schedule",
+            "create",
+            "Schedule",
+            "-d",
+            sqlite_schedule,
+            "--storage",
+            "sqlite",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "already exists" in result.output
+
+
+def test_sqlite_storage_edit_and_view_room_succeeds(sqlite_schedule):
+    assert edit(sqlite_schedule, "create-room", "Homeroom").exit_code == 0
+    result = edit(
+        sqlite_schedule,
+        "room",
+        "Homeroom",
+        "add-lesson",
+        "-d",
+        "monday",
+        "-s",
+        "09:00",
+        "-e",
+        "10:00",
+        "-n",
+        "My First Lesson",
+    )
+    assert result.exit_code == 0, result.output
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "schedule",
+            "view",
+            "-d",
+            sqlite_schedule,
+            "--storage",
+            "sqlite",
+            "Schedule",
+            "room",
+            "Homeroom",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "My First Lesson" in result.output
+
+    result = edit(
+        sqlite_schedule, "room", "Homeroom", "remove-lesson", "My First Lesson"
+    )
+    assert result.exit_code == 0, result.output
+    assert SqliteStore(sqlite_schedule).load("Schedule").rooms[0].lessons == []
+
+
+def test_sqlite_storage_from_environment_variable_succeeds(sqlite_schedule):
+    runner = CliRunner(env={"EDA_APP_STORAGE": "sqlite"})
+    result = runner.invoke(
+        main, ["schedule", "view", "-d", sqlite_schedule, "Schedule"]
+    )
+    assert result.exit_code == 0, result.output
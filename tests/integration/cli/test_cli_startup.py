@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
+# generous enough for slow machines, the eager imports alone took over 200ms
+STARTUP_BUDGET_US = 150_000
+HEAVY_MODULES = {"pydantic", "yaml", "tabulate", "numpy"}
+
+
+def import_times(*args: str) -> dict[str, int]:
+    """
+    Runs python with `-X importtime` and returns the cumulative import time in
+    microseconds of every top level import.
+    """
+    env = {**os.environ, "PYTHONPATH": os.path.abspath(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def startup_cost(*cli_args: str) -> tuple[int, set[str]]:
+    baseline = import_times("-c", "pass")
+    times = import_times("-m", "cli", *cli_args)
+    added = {name: cost for name, cost in times.items() if name not in baseline}
+    return sum(added.values()), set(added)
+
+
+def test_cli_help_stays_within_startup_budget():
+    cost, _ = startup_cost("--help")
+
+    assert cost < STARTUP_BUDGET_US, f"cold start imports took {cost}us"
+
+
+@pytest.mark.parametrize("args", [["--help"], ["schedule", "create", "--help"]])
+def test_cli_help_does_not_import_other_commands(args):
+    _, modules = startup_cost(*args)
+
+    assert not {"cli.edit", "cli.view", "cli.check"} & modules
+    if args == ["--help"]:
+        assert not HEAVY_MODULES & modules
@@ -0,0 +1,105 @@
+import json
+
+from click.testing import CliRunner
+from cli.app import main
+from tests.integration.cli.utils import schedule_session
+from lib.schedule import Schedule, RoomSchedule, Lesson, Day
+
+
+def busy_schedule() -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A"),
+                    Lesson(
+                        days=[Day.MONDAY, Day.TUESDAY],
+                        start="10:30",
+                        end="11:00",
+                        name="B",
+                    ),
+                ],
+            ),
+            RoomSchedule(name="Lab"),
+        ]
+    )
+
+
+# ********** STATS SCHEDULE TESTS **********
+def test_stats_schedule_prints_tables():
+    runner = CliRunner()
+    with schedule_session("Stats", data=busy_schedule()) as name:
+        result = runner.invoke(main, ["schedule", "stats", name])
+    assert result.exit_code == 0, result.output
+    assert "Busy minutes per day:" in result.output
+    assert "Homeroom" in result.output and "Lab" in result.output
+    assert "Peak hours: Monday 09:00, Tuesday 10:00" in result.output
+    assert "Idle time between lessons:" in result.output
+
+
+def test_stats_schedule_json():
+    runner = CliRunner()
+    with schedule_session("Stats", data=busy_schedule()) as name:
+        result = runner.invoke(
+            main,
+            ["schedule", "stats", name, "--json", "--from", "08:00", "--to", "18:00"],
+        )
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["schedule"] == "Stats"
+    assert report["window"] == {"start": 480, "end": 1080}
+    homeroom, lab = report["rooms"]
+    assert homeroom["busy_minutes"]["monday"] == 90
+    assert homeroom["busy_minutes"]["tuesday"] == 30
+    assert homeroom["idle_gaps"] == 1
+    assert homeroom["longest_idle"] == 30
+    assert lab["busy_minutes"]["monday"] == 0
+    assert report["heatmap"]["monday"][9] == 0.5
+    assert report["peak_hours"]["wednesday"] is None
+
+
+def test_stats_schedule_counts_the_whole_day_by_default():
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Late",
+                lessons=[
+                    Lesson(days=[Day.FRIDAY], start="23:00", end="23:59:59", name="L")
+                ],
+            )
+        ]
+    )
+    runner = CliRunner()
+    with schedule_session("Stats", data=schedule) as name:
+        result = runner.invoke(main, ["schedule", "stats", name, "--json"])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["window"] == {"start": 0, "end": 1440}
+    assert report["rooms"][0]["busy_minutes"]["friday"] == 60
+    assert report["heatmap"]["friday"][23] == 1.0
+
+
+def test_stats_schedule_empty_schedule():
+    runner = CliRunner()
+    with schedule_session("Empty", data=Schedule(rooms=[])) as name:
+        result = runner.invoke(main, ["schedule", "stats", name])
+    assert result.exit_code == 0, result.output
+    assert "The schedule has no rooms." in result.output
+
+
+def test_stats_schedule_rejects_backwards_window():
+    runner = CliRunner()
+    with schedule_session("Stats", data=busy_schedule()) as name:
+        result = runner.invoke(
+            main, ["schedule", "stats", name, "--from", "18:00", "--to", "08:00"]
+        )
+    assert result.exit_code == 2
+    assert "must not be before --from" in result.output
+
+
+def test_stats_schedule_non_existent_fails():
+    runner = CliRunner()
+    result = runner.invoke(main, ["schedule", "stats", "Missing"])
+    assert result.exit_code == 1
+    assert "Schedule with name 'Missing' does not exist." in result.output
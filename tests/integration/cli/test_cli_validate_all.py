@@ -0,0 +1,69 @@
+import pytest
+import yaml
+
+from click.testing import CliRunner
+from cli.app import main
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+
+
+def write_schedule(path, schedule: Schedule):
+    with open(path, "w") as fp:
+        yaml.safe_dump(schedule.model_dump(mode="json"), fp)
+
+
+def valid_schedule() -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A")
+                ],
+            )
+        ]
+    )
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_validate_all_reports_every_file_and_fails(tmp_path, jobs):
+    write_schedule(tmp_path / "Valid.yaml", valid_schedule())
+    conflicting = valid_schedule()
+    # added behind add_lesson's back, like a hand edited file
+    conflicting.rooms[0].lessons.append(
+        Lesson(days=[Day.MONDAY], start="09:30", end="10:30", name="B")
+    )
+    write_schedule(tmp_path / "Conflicting.yaml", conflicting)
+    (tmp_path / "Broken.yaml").write_text("rooms: [unclosed\n")
+    (tmp_path / "Invalid.yaml").write_text(
+        "rooms:\n- name: Homeroom\n  lessons:\n"
+        "  - {days: [monday], start: '10:00', end: '09:00', name: Backwards}\n"
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(
+        main, ["schedule", "validate-all", "-d", str(tmp_path), "--jobs", jobs]
+    )
+
+    assert result.exit_code == 1, result.output
+    lines = result.output.splitlines()
+    assert "ok        Valid" in lines
+    assert "invalid   Broken" in lines
+    assert "invalid   Invalid" in lines
+    assert "conflicts Conflicting: 1 overlapping lesson(s)" in lines
+    assert "    Homeroom monday: 'A' (09:00-10:00) overlaps 'B' (09:30-10:30)" in lines
+    assert lines[-1] == (
+        "Checked 4 schedule(s): 1 valid, 2 invalid, 1 with overlapping lessons."
+    )
+
+
+def test_validate_all_valid_schedules_succeeds(tmp_path):
+    write_schedule(tmp_path / "First.yaml", valid_schedule())
+    write_schedule(tmp_path / "Second.yaml", Schedule(rooms=[]))
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["schedule", "validate-all", "-d", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1] == (
+        "Checked 2 schedule(s): 2 valid, 0 invalid, 0 with overlapping lessons."
+    )
@@ -1,3 +1,5 @@
+import os
+
 from click.testing import CliRunner
 from cli.app import main
 import pytest
@@ -84,3 +86,132 @@ def test_view_room_with_no_lessons_succeeds():
     with schedule_session("Valid", data=schedule) as name:
         result = runner.invoke(main, ["schedule", "view", name, "room", room_name])
     assert result.exit_code == 0
+
+
+def test_view_schedule_caches_parsed_schedule(tmp_path, parse_cache_dir):
+    runner = CliRunner()
+    directory = str(tmp_path)
+    runner.invoke(main, ["schedule", "create", "Schedule", "-d", directory])
+
+    result = runner.invoke(
+        main, ["schedule", "view", "-d", directory, "--no-cache", "Schedule"]
+    )
+    assert result.exit_code == 0, result.output
+    assert os.listdir(parse_cache_dir) == []
+
+    result = runner.invoke(main, ["schedule", "view", "-d", directory, "Schedule"])
+    assert result.exit_code == 0, result.output
+    assert len(os.listdir(parse_cache_dir)) == 1
+
+
+def test_view_free_rooms_and_slots_succeeds():
+    runner = CliRunner()
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(
+                        days=[Day.MONDAY],
+                        start="09:00",
+                        end="10:00",
+                        name="Math",
+                    )
+                ],
+            ),
+            RoomSchedule(name="Gym"),
+        ]
+    )
+    with schedule_session("Valid", data=schedule) as name:
+        rooms = runner.invoke(
+            main,
+            ["schedule", "view", name, "free", "rooms", "-d", "monday"]
+            + ["-s", "09:30", "-e", "11:00"],
+        )
+        slots = runner.invoke(
+            main,
+            ["schedule", "view", name, "free", "slots", "Homeroom", "-m", "60"]
+            + ["-d", "monday", "--from", "08:00", "--to", "12:00"],
+        )
+        no_slots = runner.invoke(
+            main,
+            ["schedule", "view", name, "free", "slots", "Homeroom", "-m", "180"]
+            + ["-d", "monday", "--from", "08:00", "--to", "12:00"],
+        )
+
+    assert rooms.exit_code == 0, rooms.output
+    assert "Gym" in rooms.output
+    assert "Homeroom" not in rooms.output
+    assert slots.exit_code == 0, slots.output
+    assert "08:00" in slots.output and "10:00" in slots.output
+    assert "The room has no free time that long." in no_slots.output
+
+
+def test_view_schedule_pages_rooms():
+    runner = CliRunner()
+    schedule = Schedule(
+        rooms=[RoomSchedule(name=f"Room {index}") for index in range(5)]
+    )
+    with schedule_session("Valid", data=schedule) as name:
+        everything = runner.invoke(main, ["schedule", "view", name])
+        paged = runner.invoke(
+            main, ["schedule", "view", "--page", "2", "--limit", "2", name]
+        )
+        last = runner.invoke(
+            main, ["schedule", "view", "--page", "3", "--limit", "2", name]
+        )
+        past_the_end = runner.invoke(
+            main, ["schedule", "view", "--page", "4", "--limit", "2", name]
+        )
+        piped = runner.invoke(main, ["schedule", "view", "--pager", name])
+
+    assert everything.exit_code == 0, everything.output
+    # rooms come out one table at a time but read the same as one long table
+    tables = everything.output.split("\n********************************\n")
+    assert [table.split("(")[0].strip() for table in tables] == [
+        f"Room {index}" for index in range(5)
+    ]
+    assert everything.output.endswith("╯\n")
+    assert paged.exit_code == 0, paged.output
+    assert (
+        paged.output == "\n********************************\n".join(tables[2:4]) + "\n"
+    )
+    assert last.output == tables[4]
+    assert past_the_end.exit_code == 1
+    assert "Page 4 is empty, the schedule has 5 room(s)." in past_the_end.output
+    assert piped.output == everything.output
+
+
+def test_view_schedule_page_without_limit_fails():
+    runner = CliRunner()
+    with schedule_session("Valid", data=Schedule(rooms=[])) as name:
+        result = runner.invoke(main, ["schedule", "view", "--page", "2", name])
+    assert result.exit_code == 1
+    assert "--page needs --limit" in result.output
+
+
+def test_view_schedule_fast_renderer_matches_tabulate():
+    runner = CliRunner()
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Homeroom",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A"),
+                    Lesson(days=[Day.FRIDAY], start="11:00", end="12:00", name="Café"),
+                ],
+            ),
+            RoomSchedule(name="Gym"),
+        ]
+    )
+    with schedule_session("Valid", data=schedule) as name:
+        default = runner.invoke(main, ["schedule", "view", name])
+        fast = runner.invoke(main, ["schedule", "view", "--renderer", "fast", name])
+        fast_room = runner.invoke(
+            main, ["schedule", "view", "--renderer", "fast", name, "room", "Homeroom"]
+        )
+        room = runner.invoke(main, ["schedule", "view", name, "room", "Homeroom"])
+
+    assert fast.exit_code == 0, fast.output
+    assert fast.output == default.output
+    assert fast_room.output == room.output
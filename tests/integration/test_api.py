@@ -1,14 +1,320 @@
+import asyncio
+import os
+import time
+
 from fastapi.testclient import TestClient
+import httpx
 import pytest
-from api.main import app
+from api.locks import ScheduleLocks
+from api.main import app, get_locks, get_schedules
+from api.schedules import ScheduleCache
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+from lib.storage import JournalStore, YamlStore, journal, yaml_store
+
+
+@pytest.fixture
+def schedules(tmp_path):
+    schedules = ScheduleCache(JournalStore(str(tmp_path)))
+    locks = ScheduleLocks()
+    app.dependency_overrides[get_schedules] = lambda: schedules
+    app.dependency_overrides[get_locks] = lambda: locks
+    yield schedules
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def api_client():
+def api_client(schedules):
     return TestClient(app)
 
 
+@pytest.fixture
+def room_url(api_client):
+    assert api_client.post("/schedules", json={"name": "Term"}).status_code == 201
+    response = api_client.post("/schedules/Term/rooms", json={"name": "Lab"})
+    assert response.status_code == 201
+    return f"/schedules/Term/rooms/{response.json()['id']}"
+
+
+def lesson_json(start: str = "09:00", end: str = "10:00", name: str = "Biology"):
+    return {"days": ["monday"], "start": start, "end": end, "name": name}
+
+
 def test_root__when_making_get__returns_hello_world(api_client):
     response = api_client.get("/")
     assert response.status_code == 200
     assert response.json() == {"Hello": "World"}
+
+
+# ********** SCHEDULES **********
+def test_create_schedule__saves_empty_schedule(api_client, schedules):
+    response = api_client.post("/schedules", json={"name": "Term"})
+
+    assert response.status_code == 201
+    assert response.json() == {"rooms": []}
+    assert api_client.get("/schedules").json() == ["Term"]
+    assert schedules.store.load("Term") == Schedule(rooms=[])
+
+
+@pytest.mark.parametrize("name", ["", "  ", "..", "a/b", "a\\b"])
+def test_create_schedule__invalid_name__fails(api_client, name):
+    response = api_client.post("/schedules", json={"name": name})
+
+    assert response.status_code == 400
+
+
+def test_create_schedule__duplicate__fails(api_client, room_url):
+    response = api_client.post("/schedules", json={"name": "Term"})
+
+    assert response.status_code == 409
+
+
+def test_get_schedule__does_not_exist__fails(api_client):
+    assert api_client.get("/schedules/Missing").status_code == 404
+
+
+def test_delete_schedule__removes_it(api_client, room_url, schedules):
+    assert api_client.delete("/schedules/Term").status_code == 204
+
+    assert api_client.get("/schedules/Term").status_code == 404
+    assert schedules.store.names() == []
+
+
+# ********** ROOMS **********
+def test_rooms__create_list_get_and_delete(api_client, room_url, schedules):
+    response = api_client.get("/schedules/Term/rooms")
+    assert [room["name"] for room in response.json()] == ["Lab"]
+    assert api_client.get(room_url).json()["name"] == "Lab"
+
+    assert api_client.delete(room_url).status_code == 204
+
+    assert api_client.get(room_url).status_code == 404
+    assert schedules.store.load("Term").rooms == []
+
+
+def test_create_room__blank_name__fails(api_client, room_url):
+    response = api_client.post("/schedules/Term/rooms", json={"name": " "})
+
+    assert response.status_code == 400
+
+
+# ********** LESSONS **********
+def test_lessons__create_update_and_delete(api_client, room_url, schedules):
+    response = api_client.post(f"{room_url}/lessons", json=lesson_json())
+    assert response.status_code == 201
+    lesson_url = f"{room_url}/lessons/{response.json()['id']}"
+
+    response = api_client.patch(lesson_url, json={"name": "Chemistry", "end": "11:00"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Chemistry"
+    assert api_client.get(lesson_url).json()["end"] == "11:00:00"
+    saved = schedules.store.load("Term").rooms[0].lessons
+    assert [(lesson.name, lesson.end.hour) for lesson in saved] == [("Chemistry", 11)]
+
+    assert api_client.delete(lesson_url).status_code == 204
+    assert api_client.get(f"{room_url}/lessons").json() == []
+    assert api_client.get(lesson_url).status_code == 404
+
+
+def test_create_lesson__overlapping__fails(api_client, room_url):
+    api_client.post(f"{room_url}/lessons", json=lesson_json())
+
+    response = api_client.post(
+        f"{room_url}/lessons", json=lesson_json("09:30", "10:30", "Overlap")
+    )
+
+    assert response.status_code == 409
+    assert len(api_client.get(f"{room_url}/lessons").json()) == 1
+
+
+@pytest.mark.parametrize(
+    "body", [{"start": "08:00", "end": "07:00"}, {"days": ["someday"]}]
+)
+def test_update_lesson__invalid__fails(api_client, room_url, body):
+    response = api_client.post(f"{room_url}/lessons", json=lesson_json())
+    lesson_url = f"{room_url}/lessons/{response.json()['id']}"
+
+    response = api_client.patch(lesson_url, json=body)
+
+    assert response.status_code == 422
+    assert api_client.get(lesson_url).json()["start"] == "09:00:00"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"start": "10:30", "end": "11:30"},
+        {"days": ["monday", "tuesday"]},
+        {"end": "11:00"},
+    ],
+)
+def test_update_lesson__overlapping__fails(api_client, room_url, schedules, body):
+    api_client.post(f"{room_url}/lessons", json=lesson_json("11:00", "12:00"))
+    response = api_client.post(
+        f"{room_url}/lessons",
+        json={**lesson_json(name="Moved"), "days": ["tuesday"]},
+    )
+    lesson_url = f"{room_url}/lessons/{response.json()['id']}"
+    if "days" in body:
+        api_client.patch(lesson_url, json={"start": "11:30", "end": "12:30"})
+    else:
+        api_client.patch(lesson_url, json={"days": ["monday"]})
+
+    response = api_client.patch(lesson_url, json=body)
+
+    assert response.status_code == 409
+    assert schedules.store.load("Term").find_conflicts() == []
+
+
+def test_update_lesson__overlapping_only_itself__succeeds(api_client, room_url):
+    response = api_client.post(f"{room_url}/lessons", json=lesson_json())
+    lesson_url = f"{room_url}/lessons/{response.json()['id']}"
+
+    response = api_client.patch(lesson_url, json={"start": "09:30", "end": "10:30"})
+
+    assert response.status_code == 200
+    assert response.json()["start"] == "09:30:00"
+
+
+# ********** FREE ROOMS AND SLOTS **********
+def test_find_free_rooms_and_slots(api_client, room_url):
+    api_client.post(f"{room_url}/lessons", json=lesson_json())
+    gym = api_client.post("/schedules/Term/rooms", json={"name": "Gym"}).json()
+
+    response = api_client.get(
+        "/schedules/Term/free-rooms",
+        params={"days": ["monday", "tuesday"], "start": "09:30", "end": "11:00"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"id": gym["id"], "name": "Gym"}]
+
+    response = api_client.get(
+        f"{room_url}/free-slots",
+        params={"minutes": 60, "days": ["monday"], "start": "08:00", "end": "12:00"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"day": "monday", "start": "08:00:00", "end": "09:00:00"},
+        {"day": "monday", "start": "10:00:00", "end": "12:00:00"},
+    ]
+
+
+def test_find_free_rooms__start_after_end__fails(api_client, room_url):
+    response = api_client.get(
+        "/schedules/Term/free-rooms",
+        params={"days": ["monday"], "start": "11:00", "end": "10:00"},
+    )
+
+    assert response.status_code == 422
+
+
+# ********** CONCURRENCY **********
+def test_parallel_edits__lose_no_updates(monkeypatch, api_client, room_url, schedules):
+    count = 100
+    # every request loads its own copy and rewrites the whole file, so edits
+    # that aren't one at a time overwrite each other
+    schedules.store = YamlStore(schedules.store.directory)
+    monkeypatch.setattr(schedules, "get", schedules.store.load)
+    write_schedule_dict = yaml_store.write_schedule_dict
+
+    def slow_write_schedule_dict(*args):
+        # a slow write widens the window in which unlocked requests race
+        write_schedule_dict(*args)
+        time.sleep(0.002)
+
+    monkeypatch.setattr(yaml_store, "write_schedule_dict", slow_write_schedule_dict)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t"
+        ) as client:
+            requests = []
+            for index in range(count):
+                start = f"{index // 60 + 8:02}:{index % 60:02}:00"
+                end = f"{index // 60 + 8:02}:{index % 60:02}:30"
+                requests.append(
+                    client.post(
+                        f"{room_url}/lessons",
+                        json=lesson_json(start, end, f"Lesson {index}"),
+                    )
+                )
+                requests.append(client.get(f"{room_url}/lessons"))
+            return await asyncio.gather(*requests)
+
+    responses = asyncio.run(run())
+
+    assert all(response.status_code < 300 for response in responses)
+    saved = YamlStore(schedules.store.directory).load("Term").rooms[0].lessons
+    assert sorted(lesson.name for lesson in saved) == sorted(
+        f"Lesson {index}" for index in range(count)
+    )
+
+
+def test_reads__never_see_a_write_that_failed(monkeypatch, api_client, room_url):
+    def failing_append_records(*args):
+        time.sleep(0.05)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(journal, "append_records", failing_append_records)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t"
+        ) as client:
+            write = asyncio.ensure_future(
+                client.post(f"{room_url}/lessons", json=lesson_json())
+            )
+            reads = []
+            while not write.done():
+                reads.append(await client.get(f"{room_url}/lessons"))
+                await asyncio.sleep(0.005)
+            return await write, reads
+
+    write, reads = asyncio.run(run())
+
+    assert write.status_code == 500
+    assert reads
+    assert all(read.json() == [] for read in reads)
+
+
+# ********** SCHEDULE CACHE **********
+def test_schedule_cache__unchanged_file__is_not_loaded_again(
+    monkeypatch, room_url, schedules
+):
+    schedules.get("Term")
+
+    def fail(name):
+        raise AssertionError("schedule was loaded again")
+
+    monkeypatch.setattr(schedules.store, "load", fail)
+    assert schedules.get("Term").rooms[0].name == "Lab"
+
+
+def test_schedule_cache__changed_file__is_loaded_again(api_client, room_url, schedules):
+    changed = Schedule(rooms=[RoomSchedule(name="Gym")])
+    path = schedules.store.path("Term")
+    YamlStore(schedules.store.directory).create("Term", changed)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    response = api_client.get("/schedules/Term/rooms")
+
+    assert [room["name"] for room in response.json()] == ["Gym"]
+
+
+def test_schedule_cache__evicts_least_recently_used(tmp_path):
+    store = YamlStore(str(tmp_path))
+    lesson = Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A")
+    for name in ["A", "B", "C"]:
+        store.create(name, Schedule(rooms=[RoomSchedule(name=name, lessons=[lesson])]))
+
+    by_count = ScheduleCache(store, max_schedules=2)
+    for name in ["A", "B", "A", "C"]:
+        by_count.get(name)
+    assert ("A" in by_count, "B" in by_count, "C" in by_count) == (True, False, True)
+
+    by_size = ScheduleCache(store, max_bytes=1)
+    by_size.get("A")
+    by_size.get("B")
+    assert ("A" in by_size, "B" in by_size) == (False, True)
@@ -0,0 +1,77 @@
+import asyncio
+
+from api.locks import ReadWriteLock, ScheduleLocks
+
+
+def test_read_write_lock__lets_readers_in_together():
+    async def run():
+        lock = ReadWriteLock()
+        inside = 0
+        most_inside = 0
+
+        async def read():
+            nonlocal inside, most_inside
+            async with lock.read():
+                inside += 1
+                most_inside = max(most_inside, inside)
+                await asyncio.sleep(0.01)
+                inside -= 1
+
+        await asyncio.gather(*(read() for _ in range(5)))
+        return most_inside
+
+    assert asyncio.run(run()) == 5
+
+
+def test_read_write_lock__runs_writers_alone_and_before_later_readers():
+    async def run():
+        lock = ReadWriteLock()
+        events = []
+
+        async def read(label):
+            async with lock.read():
+                events.append(f"{label} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{label} end")
+
+        async def write(label):
+            async with lock.write():
+                events.append(f"{label} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{label} end")
+
+        first = asyncio.create_task(read("read 1"))
+        await asyncio.sleep(0)
+        writer = asyncio.create_task(write("write"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(read("read 2"))
+        await asyncio.gather(first, writer, second)
+        return events
+
+    assert asyncio.run(run()) == [
+        "read 1 start",
+        "read 1 end",
+        "write start",
+        "write end",
+        "read 2 start",
+        "read 2 end",
+    ]
+
+
+def test_schedule_locks__share_a_lock_per_name_while_held():
+    async def run():
+        locks = ScheduleLocks()
+        order = []
+
+        async def write(name, label):
+            async with locks.write(name):
+                order.append(f"{label} start")
+                await asyncio.sleep(0.01)
+                order.append(f"{label} end")
+
+        await asyncio.gather(write("A", "a1"), write("A", "a2"), write("B", "b"))
+        return order
+
+    order = asyncio.run(run())
+    assert order.index("a1 end") < order.index("a2 start")
+    assert order.index("b start") < order.index("a1 end")
@@ -0,0 +1,115 @@
+import random
+import string
+
+import pytest
+import tabulate
+
+from cli.table import LESSON_HEADERS, iter_lesson_table
+from cli.view import (
+    RENDERERS,
+    fast_room_schedule,
+    tabulate_room_schedule,
+    tabulate_schedule,
+)
+from lib.schedule import Day, Lesson, RoomSchedule
+
+
+def tabulated(rows: list[list[str]]) -> str:
+    return tabulate.tabulate(rows, headers=LESSON_HEADERS, tablefmt="rounded_grid")
+
+
+def random_rows(generator: random.Random, count: int) -> list[list[str]]:
+    alphabet = string.ascii_letters + string.digits + " -_.,'()"
+    rows = []
+    for _ in range(count):
+        name = "".join(generator.choices(alphabet, k=generator.randrange(1, 40)))
+        days = generator.sample([day.value for day in Day], generator.randrange(1, 4))
+        rows.append(
+            [
+                f"{generator.getrandbits(64):x}",
+                name.strip() or "x",
+                ", ".join(days),
+                f"{generator.randrange(24):02}:{generator.randrange(60):02}",
+                f"{generator.randrange(24):02}:{generator.randrange(60):02}",
+            ]
+        )
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_iter_lesson_table_matches_tabulate(seed):
+    generator = random.Random(seed)
+    rows = random_rows(generator, generator.randrange(0, 30))
+
+    lines = iter_lesson_table(rows)
+
+    assert lines is not None
+    assert "\n".join(lines) == tabulated(rows)
+
+
+@pytest.mark.parametrize(
+    "cell",
+    [
+        "12",  # tabulate right aligns columns of numbers
+        " padded ",  # and strips the spaces around text
+        "Café",
+        "数学",
+        "two\nlines",
+        "tab\there",
+    ],
+)
+def test_iter_lesson_table_leaves_special_text_to_tabulate(cell):
+    rows = [["1a", cell, "monday", "09:00", "10:00"]]
+    assert iter_lesson_table(rows) is None
+
+
+def test_fast_room_schedule_matches_tabulate_room_schedule():
+    room = RoomSchedule(
+        name="Homeroom",
+        lessons=[
+            Lesson(days=[Day.MONDAY, Day.FRIDAY], start="09:00", end="10:00", name="A"),
+            Lesson(days=[Day.TUESDAY], start="11:00", end="12:30", name="Long name"),
+        ],
+    )
+    numbered = RoomSchedule(
+        name="Numbered",
+        lessons=[
+            Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="101"),
+            Lesson(days=[Day.MONDAY], start="11:00", end="12:00", name="2.50"),
+        ],
+    )
+    mixed = RoomSchedule(
+        name="Mixed",
+        lessons=[
+            Lesson(
+                days=[Day.MONDAY], start=f"{hour:02}:00", end=f"{hour:02}:30", name=name
+            )
+            for hour, name in zip((9, 10, 11, 12), ("1", "2", "True", "False"))
+        ],
+    )
+    for room in (room, numbered, mixed, RoomSchedule(name="Empty")):
+        assert fast_room_schedule(room) == tabulate_room_schedule(room)
+
+
+def test_tabulate_schedule_streams_big_rooms_in_chunks(monkeypatch):
+    monkeypatch.setattr("cli.view.CHUNK_LINES", 10)
+    room = RoomSchedule(
+        name="Big",
+        lessons=[
+            Lesson(
+                days=[Day.MONDAY],
+                start=f"{index // 60:02}:{index % 60:02}",
+                end=f"{index // 60:02}:{index % 60:02}",
+                name=f"Lesson {index}",
+            )
+            for index in range(20)
+        ],
+    )
+
+    fast = list(tabulate_schedule([room], RENDERERS["fast"]))
+    slow = list(tabulate_schedule([room], RENDERERS["tabulate"]))
+
+    # 20 lessons and their separators are over 40 lines
+    assert len(fast) > 4
+    assert len(slow) == 1
+    assert "".join(fast) == "".join(slow)
@@ -0,0 +1,99 @@
+from datetime import time
+
+import pytest
+
+from lib.assignment import assign_lessons
+from lib.schedule import Day, RoomSchedule, Schedule
+from tests.unit.lib.utils import create_lesson
+
+
+def test_assign_lessons_uses_as_few_rooms_as_overlaps_need():
+    schedule = Schedule(rooms=[RoomSchedule(name=f"Room {i}") for i in range(3)])
+    lessons = [
+        create_lesson(name="A", start=time(9, 0), end=time(10, 0)),
+        create_lesson(name="B", start=time(9, 30), end=time(10, 30)),
+        create_lesson(name="C", start=time(10, 15), end=time(11, 0)),
+        create_lesson(name="D", start=time(11, 0), end=time(12, 0)),
+    ]
+
+    assigned, unplaced = assign_lessons(schedule, lessons)
+
+    assert unplaced == []
+    first, second, third = schedule.rooms
+    # C reuses the first room once A is over, D touches C's end so it can't follow it
+    assert [lesson.name for lesson in first.lessons] == ["A", "C"]
+    assert [lesson.name for lesson in second.lessons] == ["B", "D"]
+    assert third.lessons == []
+    assert set(assigned) == {first.id, second.id}
+    assert schedule.find_conflicts() == []
+
+
+def test_assign_lessons_reports_lessons_that_fit_nowhere():
+    schedule = Schedule(rooms=[RoomSchedule(name="Only Room")])
+    lessons = [
+        create_lesson(name="A", start=time(9, 0), end=time(10, 0)),
+        create_lesson(name="B", start=time(9, 30), end=time(10, 30)),
+        create_lesson(
+            name="C", start=time(9, 30), end=time(10, 30), days=[Day.TUESDAY]
+        ),
+    ]
+
+    assigned, unplaced = assign_lessons(schedule, lessons)
+
+    assert [lesson.name for lesson in unplaced] == ["B"]
+    assert [lesson.name for lesson in schedule.rooms[0].lessons] == ["A", "C"]
+
+
+def test_assign_lessons_avoids_existing_lessons():
+    busy = RoomSchedule(
+        name="Busy",
+        lessons=[create_lesson(name="Existing", start=time(9, 0), end=time(12, 0))],
+    )
+    free = RoomSchedule(name="Free")
+    schedule = Schedule(rooms=[busy, free])
+
+    _, unplaced = assign_lessons(
+        schedule, [create_lesson(name="New", start=time(10, 0), end=time(11, 0))]
+    )
+
+    assert unplaced == []
+    assert [lesson.name for lesson in free.lessons] == ["New"]
+    assert [lesson.name for lesson in busy.lessons] == ["Existing"]
+
+
+def test_assign_lessons_needs_room_free_on_every_day():
+    first = RoomSchedule(
+        name="First",
+        lessons=[
+            create_lesson(
+                name="Existing", start=time(9, 0), end=time(11, 0), days=[Day.TUESDAY]
+            )
+        ],
+    )
+    schedule = Schedule(rooms=[first, RoomSchedule(name="Second")])
+    lessons = [
+        create_lesson(name="Monday", start=time(9, 0), end=time(10, 0)),
+        create_lesson(
+            name="Tuesday", start=time(9, 0), end=time(10, 0), days=[Day.TUESDAY]
+        ),
+        create_lesson(
+            name="Both",
+            start=time(9, 30),
+            end=time(10, 30),
+            days=[Day.MONDAY, Day.TUESDAY],
+        ),
+    ]
+
+    _, unplaced = assign_lessons(schedule, lessons)
+
+    # each day has a room free, but not the same one
+    assert [lesson.name for lesson in unplaced] == ["Both"]
+
+
+def test_assign_lessons_duplicate_ids_fail():
+    lesson = create_lesson(name="A", start=time(9, 0), end=time(10, 0))
+    schedule = Schedule(rooms=[RoomSchedule(name="Room", lessons=[lesson])])
+
+    with pytest.raises(ValueError, match="already exists"):
+        assign_lessons(schedule, [lesson])
+    assert not schedule.is_dirty
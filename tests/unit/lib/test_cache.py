@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from lib.schedule import RoomSchedule, Schedule
+from lib.storage import ParseCache, YamlStore
+from tests.unit.lib.utils import create_schedule
+
+
+@pytest.fixture
+def store(tmp_path) -> YamlStore:
+    os.mkdir(tmp_path / "schedules")
+    cache = ParseCache(str(tmp_path / "cache"))
+    return YamlStore(str(tmp_path / "schedules"), cache=cache)
+
+
+def test_load__unchanged_file__skips_validation(monkeypatch, store):
+    schedule = create_schedule()
+    store.create("Schedule", schedule)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schedule was validated again")
+
+    monkeypatch.setattr(Schedule, "model_validate", fail)
+    loaded = store.load("Schedule")
+
+    assert loaded == schedule
+    assert loaded.rooms[0].get_lesson(schedule.rooms[0].lessons[0].id) is not None
+    assert not loaded.is_dirty
+    loaded.rooms[0].remove_lesson(loaded.rooms[0].lessons[0].id)
+    assert loaded.changes == [
+        ("remove_lesson", schedule.rooms[0].id, schedule.rooms[0].lessons[0].id)
+    ]
+
+
+def test_load__changed_file__is_parsed_again(store):
+    store.create("Schedule", create_schedule())
+    store.load("Schedule")
+    other = Schedule(rooms=[RoomSchedule(name="Room 2")])
+    YamlStore(store.directory).create("Schedule", other)
+
+    assert store.load("Schedule") == other
+
+
+def test_cache__same_mtime_and_size_but_other_content__misses(tmp_path):
+    path = str(tmp_path / "Schedule.yaml")
+    with open(path, "wb") as f:
+        f.write(b"rooms: []\n")
+    cache = ParseCache(str(tmp_path / "cache"))
+    cache.put(path, b"rooms: []\n", Schedule(rooms=[]))
+
+    assert cache.get(path, b"rooms: []\n") == Schedule(rooms=[])
+    assert cache.get(path, b"rooms: {}\n") is None
+
+
+def test_cache__past_size_limit__evicts_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"))
+    paths = []
+    for index in range(3):
+        path = str(tmp_path / f"{index}.yaml")
+        with open(path, "wb") as f:
+            f.write(b"rooms: []\n")
+        cache.put(path, b"rooms: []\n", create_schedule())
+        os.utime(cache.entry_path(path), ns=(index, index))
+        paths.append(path)
+    entry_size = os.path.getsize(cache.entry_path(paths[0]))
+    # reading the oldest entry makes the second one the least recently used
+    assert cache.get(paths[0], b"rooms: []\n") is not None
+
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert os.path.exists(cache.entry_path(paths[0]))
+    assert not os.path.exists(cache.entry_path(paths[1]))
+    assert os.path.exists(cache.entry_path(paths[2]))
@@ -0,0 +1,137 @@
+import os
+
+import pytest
+
+from lib import storage
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+
+
+def create_schedule(lesson_count: int = 1) -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Room 1",
+                lessons=[
+                    Lesson(
+                        days=[Day.MONDAY],
+                        start=f"{9 + index:02}:00",
+                        end=f"{9 + index:02}:30",
+                        name=f"Lesson {index}",
+                    )
+                    for index in range(lesson_count)
+                ],
+            )
+        ]
+    )
+
+
+@pytest.fixture(params=[storage.YamlStore, storage.JournalStore])
+def store(request, tmp_path):
+    return request.param(str(tmp_path))
+
+
+def test_refresh_indexes_every_schedule_file(store):
+    store.create("First", create_schedule(2))
+    store.create("Second", Schedule(rooms=[]))
+    catalog = storage.Catalog(store.directory)
+
+    entries, reloaded = catalog.refresh(store)
+
+    assert reloaded == 2
+    assert [(entry.name, entry.rooms, entry.lessons) for entry in entries] == [
+        ("First", 1, 2),
+        ("Second", 0, 0),
+    ]
+    assert entries[0].path == "First.yaml"
+    assert catalog.refresh(store) == (entries, 0)
+
+
+def test_saves_keep_an_existing_index_up_to_date(store):
+    store.create("Schedule", create_schedule(1))
+    catalog = storage.Catalog(store.directory)
+    catalog.refresh(store)
+
+    schedule = store.load("Schedule")
+    schedule.rooms[0].add_lesson(
+        Lesson(days=[Day.FRIDAY], start="09:00", end="10:00", name="New")
+    )
+    store.save("Schedule", schedule)
+    store.create("Other", Schedule(rooms=[]))
+    entries, reloaded = catalog.refresh(store)
+
+    assert reloaded == 0
+    assert [(entry.name, entry.lessons) for entry in entries] == [
+        ("Other", 0),
+        ("Schedule", 2),
+    ]
+
+    store.delete("Other")
+    assert set(catalog.read()) == {"Schedule"}
+
+
+def test_refresh_only_reloads_files_that_changed(store):
+    store.create("Changed", create_schedule(1))
+    store.create("Touched", create_schedule(1))
+    catalog = storage.Catalog(store.directory)
+    catalog.refresh(store)
+
+    # written behind the store's back, so only the file itself tells
+    storage.save_schedule(create_schedule(3), store.path("Changed"))
+    stat = os.stat(store.path("Touched"))
+    os.utime(store.path("Touched"), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    entries, reloaded = catalog.refresh(store)
+
+    assert reloaded == 1
+    assert [(entry.name, entry.lessons) for entry in entries] == [
+        ("Changed", 3),
+        ("Touched", 1),
+    ]
+    assert entries[1].mtime_ns == stat.st_mtime_ns + 10**9
+
+
+def test_refresh_drops_removed_files_and_rebuilds_damaged_index(store):
+    store.create("Kept", Schedule(rooms=[]))
+    store.create("Removed", Schedule(rooms=[]))
+    catalog = storage.Catalog(store.directory)
+    catalog.refresh(store)
+
+    os.remove(store.path("Removed"))
+    entries, reloaded = catalog.refresh(store)
+    assert [entry.name for entry in entries] == ["Kept"]
+    assert reloaded == 0
+
+    with open(catalog.path, "w") as f:
+        f.write("{not json")
+    entries, reloaded = catalog.refresh(store)
+    assert [entry.name for entry in entries] == ["Kept"]
+    assert reloaded == 1
+
+
+def test_saves_do_not_create_an_index(store):
+    store.create("Schedule", create_schedule(1))
+
+    assert not storage.Catalog(store.directory).exists()
+    assert store.names() == ["Schedule"]
+
+
+def test_refresh_records_schedules_that_fail_to_load(store):
+    store.create("Good", create_schedule(1))
+    with open(store.path("Bad"), "w") as f:
+        f.write("rooms: [unclosed\n")
+    catalog = storage.Catalog(store.directory)
+
+    entries, reloaded = catalog.refresh(store)
+
+    assert reloaded == 2
+    bad, good = entries
+    assert (good.name, good.rooms, good.error) == ("Good", 1, None)
+    assert (bad.name, bad.rooms, bad.lessons) == ("Bad", None, None)
+    assert bad.error.startswith("ParserError")
+    # kept until the file changes
+    assert catalog.refresh(store) == (entries, 0)
+
+    with open(store.path("Bad"), "w") as f:
+        f.write("rooms: []\n")
+    entries, reloaded = catalog.refresh(store)
+    assert reloaded == 1
+    assert (entries[0].rooms, entries[0].error) == (0, None)
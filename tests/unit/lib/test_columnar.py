@@ -0,0 +1,138 @@
+import random
+from datetime import time, timedelta, timezone
+
+import pytest
+
+from lib.columnar import ColumnarSchedule, day_mask, mask_days
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+from lib.stats import schedule_stats
+
+
+def random_schedule(seed: int, rooms: int = 5, lessons: int = 40) -> Schedule:
+    rng = random.Random(seed)
+    days = list(Day)
+    schedule_rooms = []
+    for index in range(rooms):
+        room_lessons = []
+        for number in range(rng.randint(0, lessons)):
+            start = rng.randint(0, 22 * 3600)
+            end = start + rng.randint(0, 2 * 3600)
+            room_lessons.append(
+                Lesson(
+                    days=rng.sample(days, rng.randint(1, 3)),
+                    start=time(start // 3600, start // 60 % 60, start % 60),
+                    end=time(end // 3600, end // 60 % 60, end % 60),
+                    # repeated names share one entry of the names table
+                    name=f"Lesson {rng.randint(0, 10)}",
+                )
+            )
+        schedule_rooms.append(RoomSchedule(name=f"Room {index}", lessons=room_lessons))
+    return Schedule(rooms=schedule_rooms)
+
+
+def test_day_mask_round_trip():
+    assert day_mask([Day.MONDAY, Day.SUNDAY]) == 0b1000001
+    assert mask_days(0b1000001) == [Day.MONDAY, Day.SUNDAY]
+    assert mask_days(day_mask(list(Day))) == list(Day)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_columnar_schedule_round_trip_is_lossless(seed):
+    schedule = random_schedule(seed)
+
+    columns = ColumnarSchedule.from_schedule(schedule)
+
+    assert len(columns) == sum(len(room.lessons) for room in schedule.rooms)
+    assert len(columns.names) <= 11
+    assert columns.to_schedule() == schedule
+
+
+def test_columnar_schedule_keeps_odd_lessons():
+    lessons = [
+        # days out of week order and named twice don't fit a mask
+        Lesson(days=[Day.FRIDAY, Day.MONDAY], start="09:00", end="10:00", name="A"),
+        Lesson(days=[Day.MONDAY, Day.MONDAY], start="09:00", end="10:00", name="B"),
+        Lesson(days=[], start="09:00", end="10:00", name="No days"),
+        Lesson(
+            days=[Day.SUNDAY],
+            start=time(0, 0, 0, 1),
+            end=time.max,
+            name="",
+            id="not-a-uuid",
+        ),
+        Lesson(
+            days=[Day.TUESDAY],
+            start="09:00",
+            end="10:00",
+            name="Upper case id",
+            id="5321A0B6-8888-4253-A6EA-FBD7879F1F5A",
+        ),
+        Lesson(days=[Day.TUESDAY], start="11:00", end="12:00", name="No id", id=""),
+    ]
+    schedule = Schedule(
+        rooms=[RoomSchedule(name="Odd", lessons=lessons), RoomSchedule(name="Empty")]
+    )
+
+    columns = ColumnarSchedule.from_schedule(schedule)
+
+    assert set(columns.other_days) == {0, 1}
+    assert set(columns.other_ids) == {3, 4, 5}
+    assert columns.to_schedule() == schedule
+    assert columns.lesson(3) == lessons[3]
+    assert columns.lesson(5) == lessons[5]
+
+
+def test_columnar_schedule_empty():
+    columns = ColumnarSchedule.from_schedule(Schedule(rooms=[]))
+
+    assert len(columns) == 0
+    assert columns.to_schedule() == Schedule(rooms=[])
+    assert columns.find_conflicts() == []
+
+
+def test_columnar_schedule_rejects_time_zones():
+    lesson = Lesson(
+        days=[Day.MONDAY],
+        start=time(9, tzinfo=timezone(timedelta(hours=2))),
+        end=time(10, tzinfo=timezone(timedelta(hours=2))),
+        name="Abroad",
+    )
+    schedule = Schedule(rooms=[RoomSchedule(name="Room", lessons=[lesson])])
+
+    with pytest.raises(ValueError):
+        ColumnarSchedule.from_schedule(schedule)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_columnar_schedule_find_conflicts_matches_schedule(seed):
+    schedule = random_schedule(seed)
+
+    conflicts = ColumnarSchedule.from_schedule(schedule).find_conflicts()
+
+    assert conflicts == schedule.find_conflicts()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_columnar_schedule_find_free_rooms_matches_schedule(seed):
+    schedule = random_schedule(seed, lessons=10)
+    columns = ColumnarSchedule.from_schedule(schedule)
+    rng = random.Random(seed)
+
+    for _ in range(20):
+        days = rng.sample(list(Day), rng.randint(1, 3))
+        start = time(rng.randint(0, 20), rng.choice([0, 30]))
+        end = time(start.hour + rng.randint(0, 3), start.minute)
+        free = columns.find_free_rooms(days, start, end)
+        assert [schedule.rooms[index] for index in free] == (
+            schedule.find_free_rooms(days, start, end)
+        )
+
+
+def test_columnar_schedule_stats_match_schedule():
+    schedule = random_schedule(0)
+
+    expected = schedule_stats(schedule, time(8), time(18))
+    stats = schedule_stats(ColumnarSchedule.from_schedule(schedule), time(8), time(18))
+
+    assert stats.to_dict() == expected.to_dict()
+    assert (stats.hourly == expected.hourly).all()
@@ -0,0 +1,41 @@
+import random
+
+from lib.intervals import IntervalIndex
+
+
+def test_interval_index__longest_shrinks_on_remove():
+    index = IntervalIndex()
+    index.add(9, 10, "short")
+    index.add(0, 24, "all day")
+    assert index._longest == 24
+
+    index.remove(0, "all day")
+
+    assert index._longest == 1
+    assert list(index.overlapping(20, 21)) == []
+
+
+def test_interval_index__matches_brute_force_under_churn():
+    rng = random.Random(0)
+    index = IntervalIndex()
+    intervals = []
+    for step in range(2_000):
+        if intervals and rng.random() < 0.45:
+            start, end, item = intervals.pop(rng.randrange(len(intervals)))
+            assert index.remove(start, item)
+        else:
+            start = rng.randint(0, 100)
+            interval = (start, start + rng.randint(0, 30), object())
+            intervals.append(interval)
+            index.add(*interval)
+
+        assert index._longest == max(
+            (end - start for start, end, _ in intervals), default=0
+        )
+        query_start = rng.randint(0, 120)
+        query_end = query_start + rng.randint(0, 10)
+        assert {id(item) for item in index.overlapping(query_start, query_end)} == {
+            id(item)
+            for start, end, item in intervals
+            if start <= query_end and end >= query_start
+        }
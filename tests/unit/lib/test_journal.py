@@ -0,0 +1,180 @@
+from datetime import time
+import os
+
+from lib.storage import JournalStore, YamlStore, yaml_store
+from lib.storage import journal
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+from tests.unit.lib.utils import create_schedule
+
+
+def edit_schedule(schedule: Schedule):
+    room = schedule.rooms[0]
+    room.add_lesson(Lesson(days=[Day.TUESDAY], start="09:00", end="10:00", name="B"))
+    room.update_lesson(room.lessons[0].id, name="Renamed")
+    schedule.add_room(
+        RoomSchedule(
+            name="Room 2",
+            lessons=[Lesson(days=[Day.FRIDAY], start="12:00", end="13:00", name="C")],
+        )
+    )
+    removed = RoomSchedule(name="Removed")
+    schedule.add_room(removed)
+    schedule.remove_room(removed.id)
+
+
+def test_journal_store_save__appends_to_journal_only(tmp_path):
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    with open(store.path("Schedule"), "r") as f:
+        snapshot = f.read()
+
+    schedule = store.load("Schedule")
+    edit_schedule(schedule)
+    store.save("Schedule", schedule)
+
+    with open(store.path("Schedule"), "r") as f:
+        assert f.read() == snapshot
+    assert len(journal.read_records(store.journal_path("Schedule"))) == 4
+    assert not schedule.is_dirty
+    assert store.load("Schedule") == schedule
+    assert not store.load("Schedule").is_dirty
+
+
+def test_journal_replay__twice_gives_same_schedule(tmp_path):
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    edit_schedule(schedule)
+    records = journal.change_records(schedule)
+
+    replayed = store.load("Schedule")
+    for record in records + records:
+        journal.apply_record(replayed, record)
+
+    assert replayed == schedule
+
+
+def test_journal_replay__adds_lessons_saved_with_overlaps(tmp_path):
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    room = schedule.rooms[0]
+    # the lesson is added clear of A, but its record holds where it ends up
+    lesson = Lesson(days=[Day.MONDAY], start="11:00", end="12:00", name="B")
+    room.add_lesson(lesson)
+    room.update_lesson(lesson.id, start=time(9, 30))
+    store.save("Schedule", schedule)
+
+    loaded = store.load("Schedule")
+
+    assert loaded == schedule
+    assert len(loaded.find_conflicts()) == 1
+
+
+def test_journal_replay__ignores_partly_written_record(tmp_path):
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    schedule.rooms[0].remove_lesson(schedule.rooms[0].lessons[0].id)
+    store.save("Schedule", schedule)
+    with open(store.journal_path("Schedule"), "a") as f:
+        f.write('{"op":"remove_room","ro')
+
+    assert store.load("Schedule") == schedule
+
+
+def test_journal_store_save__after_partly_written_record(tmp_path):
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    schedule.rooms[0].remove_lesson(schedule.rooms[0].lessons[0].id)
+    store.save("Schedule", schedule)
+    with open(store.journal_path("Schedule"), "a") as f:
+        f.write('{"op":"remove_room","ro')
+
+    schedule = store.load("Schedule")
+    schedule.add_room(RoomSchedule(name="Room 2"))
+    store.save("Schedule", schedule)
+
+    assert len(journal.read_records(store.journal_path("Schedule"))) == 2
+    assert store.load("Schedule") == schedule
+    assert store.compact("Schedule") == 2
+    assert YamlStore(str(tmp_path)).load("Schedule") == schedule
+
+
+def test_compact__folds_journal_into_snapshot(tmp_path):
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    edit_schedule(schedule)
+    store.save("Schedule", schedule)
+
+    assert store.compact("Schedule") == 4
+
+    assert not os.path.exists(store.journal_path("Schedule"))
+    assert YamlStore(str(tmp_path)).load("Schedule") == schedule
+    assert store.compact("Schedule") == 0
+
+
+def test_journal_store_save__compacts_past_threshold(monkeypatch, tmp_path):
+    monkeypatch.setattr(yaml_store, "COMPACT_THRESHOLD", 3)
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+
+    for hour in range(10, 12):
+        schedule.rooms[0].add_lesson(
+            Lesson(days=[Day.MONDAY], start=f"{hour}:30", end=f"{hour}:45", name="X")
+        )
+        store.save("Schedule", schedule)
+    assert os.path.exists(store.journal_path("Schedule"))
+
+    schedule.rooms[0].add_lesson(
+        Lesson(days=[Day.MONDAY], start="12:30", end="12:45", name="X")
+    )
+    store.save("Schedule", schedule)
+
+    assert not os.path.exists(store.journal_path("Schedule"))
+    assert YamlStore(str(tmp_path)).load("Schedule") == schedule
+
+
+def test_journal_store_save__counts_records_without_reading_journal(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(yaml_store, "COMPACT_THRESHOLD", 3)
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+
+    def read_records(path):
+        raise AssertionError("the journal was read back")
+
+    monkeypatch.setattr(journal, "read_records", read_records)
+    for hour in range(10, 13):
+        schedule.rooms[0].add_lesson(
+            Lesson(days=[Day.MONDAY], start=f"{hour}:30", end=f"{hour}:45", name="X")
+        )
+        store.save("Schedule", schedule)
+
+    assert not os.path.exists(store.journal_path("Schedule"))
+
+
+def test_journal_store_save__counts_records_saved_by_another_store(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(yaml_store, "COMPACT_THRESHOLD", 3)
+    store = JournalStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    other = JournalStore(str(tmp_path))
+    other_schedule = other.load("Schedule")
+    other_schedule.add_room(RoomSchedule(name="Room 2"))
+    other_schedule.add_room(RoomSchedule(name="Room 3"))
+    other.save("Schedule", other_schedule)
+
+    schedule.rooms[0].add_lesson(
+        Lesson(days=[Day.MONDAY], start="12:30", end="12:45", name="X")
+    )
+    store.save("Schedule", schedule)
+
+    assert not os.path.exists(store.journal_path("Schedule"))
@@ -0,0 +1,46 @@
+from time import sleep
+
+import pytest
+
+from lib import profiling
+
+
+@pytest.fixture(autouse=True)
+def stop_profiling():
+    yield
+    if profiling.is_enabled():
+        profiling.stop()
+
+
+def test_phase_does_nothing_when_profiling_is_off():
+    assert profiling.phase("load") is profiling.phase("save")
+    with profiling.phase("load"):
+        pass
+    with pytest.raises(RuntimeError):
+        profiling.stop()
+
+
+def test_nested_phases_only_count_towards_their_own_phase():
+    profiling.start()
+    with profiling.phase("load"):
+        sleep(0.01)
+        with profiling.phase("validate"):
+            sleep(0.05)
+    with profiling.phase("load"):
+        sleep(0.01)
+    timings = profiling.stop()
+
+    # load would be over 0.07s if it counted validate too
+    assert 0.02 <= timings["load"] < 0.05
+    assert timings["validate"] >= 0.05
+    total = timings["load"] + timings["validate"] + timings["command"]
+    assert total == pytest.approx(timings["total"])
+    assert not profiling.is_enabled()
+
+
+def test_format_timings_lists_every_phase_in_order():
+    text = profiling.format_timings({"load": 0.5, "total": 1.0})
+
+    names = [line.split(":")[0].strip() for line in text.splitlines()]
+    assert names == [*profiling.PHASES, "total"]
+    assert "500.00ms" in text
@@ -1,24 +1,16 @@
-from lib.schedule import Lesson, Day, RoomSchedule, Schedule
-from datetime import time
+from lib.schedule import (
+    Day,
+    FreeSlot,
+    LessonConflictError,
+    RoomSchedule,
+    Schedule,
+    find_overlapping_lessons,
+)
+from datetime import time, timedelta
 import pytest
 from pydantic import ValidationError
 
-
-def create_lesson(
-    days: list[Day] = None,
-    start: time = None,
-    end: time = None,
-    name: str = "Example Lesson",
-) -> Lesson:
-    return Lesson(
-        days=days
-        or [
-            Day.MONDAY,
-        ],
-        start=start or time(hour=9, minute=0),
-        end=end or time(hour=10, minute=0),
-        name=name,
-    )
+from tests.unit.lib.utils import create_lesson
 
 
 def test_lesson__when_start_is_after_end__raises_validation_error():
@@ -139,3 +131,401 @@ def test_schedule__removing_room_from_schedule__removes_room():
     schedule = create_schedule()
     schedule.remove_room(schedule.rooms[0].id)
     assert len(schedule.rooms) == 1
+
+
+def test_room_schedule__adding_lesson_touching_existing_lesson__raises_value_error():
+    room = create_room_schedule()
+    with pytest.raises(ValueError):
+        room.add_lesson(
+            create_lesson(days=[Day.MONDAY], start=time(10, 0), end=time(11, 0))
+        )
+
+
+def test_room_schedule__adding_lesson_without_overlap_check__indexes_it():
+    room = create_room_schedule()
+    lesson = create_lesson(days=[Day.MONDAY], start=time(9, 30), end=time(10, 30))
+    room.add_lesson(lesson, check_overlaps=False)
+    assert room.lessons[-1] is lesson
+    assert lesson in room.overlapping_lessons(room.lessons[0])
+    with pytest.raises(ValueError):
+        room.add_lesson(lesson, check_overlaps=False)
+
+
+def test_room_schedule__adding_lesson_after_removing_overlap__adds_lesson():
+    room = create_room_schedule()
+    room.remove_lesson(room.lessons[0].id)
+    lesson = create_lesson(days=[Day.MONDAY], start=time(9, 0), end=time(10, 0))
+    room.add_lesson(lesson)
+    assert lesson in room.lessons
+
+
+def test_room_schedule__long_lesson_spanning_new_lesson__raises_value_error():
+    room = RoomSchedule(
+        name="Room 1",
+        lessons=[
+            create_lesson(days=[Day.MONDAY], start=time(6, 0), end=time(18, 0)),
+            create_lesson(days=[Day.TUESDAY], start=time(8, 0), end=time(9, 0)),
+        ],
+    )
+    with pytest.raises(ValueError):
+        room.add_lesson(
+            create_lesson(
+                days=[Day.TUESDAY, Day.MONDAY], start=time(15, 0), end=time(16, 0)
+            )
+        )
+
+
+def test_room_schedule__model_validate__rebuilds_overlap_index():
+    room = RoomSchedule.model_validate(create_room_schedule().model_dump(mode="json"))
+    with pytest.raises(ValueError):
+        room.add_lesson(
+            create_lesson(days=[Day.TUESDAY], start=time(9, 30), end=time(11, 0))
+        )
+
+
+def test_room_schedule__updating_lesson__moves_lesson_in_overlap_index():
+    room = create_room_schedule()
+    lesson = room.lessons[0]
+    room.update_lesson(lesson.id, days=[Day.FRIDAY], start=time(12, 0), end=time(13, 0))
+
+    room.add_lesson(create_lesson(days=[Day.MONDAY], start=time(8, 0), end=time(10, 0)))
+    with pytest.raises(ValueError):
+        room.add_lesson(
+            create_lesson(days=[Day.FRIDAY], start=time(12, 30), end=time(14, 0))
+        )
+
+
+def test_room_schedule__updating_lesson_with_start_after_end__raises_value_error():
+    room = create_room_schedule()
+    lesson = room.lessons[0]
+    with pytest.raises(ValueError):
+        room.update_lesson(lesson.id, start=time(11, 0))
+    assert lesson.start == time(8, 0)
+
+
+def test_find_overlapping_lessons__reports_every_overlapping_pair_per_day():
+    first = create_lesson(days=[Day.MONDAY, Day.TUESDAY], start=time(9), end=time(11))
+    second = create_lesson(days=[Day.MONDAY], start=time(10), end=time(12))
+    third = create_lesson(days=[Day.TUESDAY], start=time(10, 30), end=time(10, 45))
+    fourth = create_lesson(days=[Day.MONDAY], start=time(12, 30), end=time(13))
+
+    conflicts = find_overlapping_lessons([fourth, third, second, first])
+
+    assert sorted((day.value, a.start, b.start) for day, a, b in conflicts) == [
+        ("monday", time(9), time(10)),
+        ("tuesday", time(9), time(10, 30)),
+    ]
+
+
+def test_room_schedule__adding_lessons__adds_all_lessons():
+    room = create_room_schedule()
+    lessons = [
+        create_lesson(days=[Day.MONDAY], start=time(11), end=time(12)),
+        create_lesson(days=[Day.MONDAY], start=time(13), end=time(14)),
+    ]
+    room.add_lessons(lessons)
+    assert room.lessons[-2:] == lessons
+    with pytest.raises(ValueError):
+        room.add_lesson(
+            create_lesson(days=[Day.MONDAY], start=time(13, 30), end=time(15))
+        )
+
+
+def test_room_schedule__adding_overlapping_lessons__reports_all_conflicts():
+    room = create_room_schedule()
+    lessons = [
+        create_lesson(days=[Day.MONDAY], start=time(9, 30), end=time(12)),
+        create_lesson(days=[Day.MONDAY], start=time(11), end=time(13)),
+        create_lesson(days=[Day.FRIDAY], start=time(11), end=time(13)),
+    ]
+    with pytest.raises(LessonConflictError) as err:
+        room.add_lessons(lessons)
+    assert len(err.value.conflicts) == 2
+    assert len(room.lessons) == 3
+
+
+def test_schedule__find_conflicts__finds_lessons_overlapping_after_an_edit():
+    schedule = create_schedule()
+    room = schedule.rooms[1]
+    room.update_lesson(room.lessons[1].id, days=[Day.MONDAY, Day.TUESDAY])
+
+    conflicts = schedule.find_conflicts()
+
+    assert [(conflict.room_id, conflict.day) for conflict in conflicts] == [
+        (room.id, Day.MONDAY)
+    ]
+    assert {conflicts[0].first.id, conflicts[0].second.id} == {
+        room.lessons[0].id,
+        room.lessons[1].id,
+    }
+
+
+def test_room_schedule__lesson_lookups__follow_adds_removes_and_renames():
+    room = create_room_schedule()
+    first, second, third = room.lessons
+    assert room.get_lesson(first.id) is first
+    assert room.lessons_named("Example Lesson") == [first, second, third]
+
+    room.update_lesson(second.id, name="Renamed")
+    room.remove_lesson(third.id)
+
+    assert room.get_lesson(third.id) is None
+    assert room.lessons_named("Example Lesson") == [first]
+    assert room.lessons_named("Renamed") == [second]
+    assert room.lessons == [first, second]
+
+
+def test_room_schedule__remove_lesson__keeps_order_of_the_rest():
+    lessons = [
+        create_lesson(days=[Day.MONDAY], start=time(hour), end=time(hour, 30))
+        for hour in range(8, 14)
+    ]
+    room = RoomSchedule(name="Room", lessons=lessons[:4])
+
+    room.remove_lesson(lessons[1].id)
+    room.add_lesson(lessons[4])
+    room.remove_lesson(lessons[0].id)
+    room.add_lesson(lessons[5])
+    room.remove_lesson(lessons[4].id)
+    room.remove_lesson(lessons[1].id)
+
+    assert room.lessons == [lessons[2], lessons[3], lessons[5]]
+    for lesson in list(room.lessons):
+        room.remove_lesson(lesson.id)
+    assert room.lessons == []
+
+
+def test_room_schedule__adding_lesson_with_existing_id__raises_value_error():
+    room = create_room_schedule()
+    lesson = room.lessons[0].model_copy(update={"days": [Day.SUNDAY]})
+    with pytest.raises(ValueError):
+        room.add_lesson(lesson)
+
+
+def test_schedule__room_lookups__are_rebuilt_by_model_validate_and_not_serialized():
+    schedule_dict = create_schedule().model_dump(mode="json")
+    schedule = Schedule.model_validate(schedule_dict)
+    first, second = schedule.rooms
+
+    assert schedule.get_room(second.id) is second
+    assert schedule.rooms_named("Room 1") == [first, second]
+    assert schedule.rooms[0].get_lesson(schedule_dict["rooms"][0]["lessons"][0]["id"])
+    assert schedule.model_dump(mode="json") == schedule_dict
+
+
+def test_schedule__removing_room__removes_it_from_lookups():
+    schedule = create_schedule()
+    room = schedule.rooms[0]
+    schedule.remove_room(room.id)
+    assert schedule.get_room(room.id) is None
+    assert schedule.rooms_named("Room 1") == schedule.rooms
+
+
+def test_room_schedule__lessons_by_day__sorts_lessons_by_start_time():
+    room = create_room_schedule()
+    late = create_lesson(days=[Day.MONDAY, Day.FRIDAY], start=time(14), end=time(15))
+    early = create_lesson(days=[Day.MONDAY], start=time(6), end=time(7))
+    room.add_lessons([late, early])
+
+    lessons_by_day = room.lessons_by_day
+
+    assert lessons_by_day[Day.MONDAY] == [early, room.lessons[0], late]
+    assert lessons_by_day[Day.FRIDAY] == [late]
+    assert lessons_by_day[Day.SUNDAY] == []
+
+
+def test_room_schedule__lessons_by_day__is_cached_until_lessons_change():
+    room = create_room_schedule()
+    monday = room.lessons_by_day[Day.MONDAY]
+    tuesday = room.lessons_by_day[Day.TUESDAY]
+    assert room.lessons_by_day[Day.MONDAY] is monday
+
+    room.add_lesson(create_lesson(days=[Day.MONDAY], start=time(11), end=time(12)))
+
+    assert room.lessons_by_day[Day.MONDAY] is not monday
+    assert room.lessons_by_day[Day.TUESDAY] is tuesday
+
+
+def test_room_schedule__lessons_by_day__never_goes_stale():
+    room = create_room_schedule()
+
+    def expected():
+        return {
+            day: sorted(
+                [lesson for lesson in room.lessons if day in lesson.days],
+                key=lambda lesson: lesson.start,
+            )
+            for day in Day
+        }
+
+    assert room.lessons_by_day == expected()
+    lesson = create_lesson(days=[Day.MONDAY, Day.SUNDAY], start=time(12), end=time(13))
+    room.add_lesson(lesson)
+    assert room.lessons_by_day == expected()
+    room.update_lesson(lesson.id, days=[Day.SATURDAY], start=time(7), end=time(8))
+    assert room.lessons_by_day == expected()
+    room.update_lesson(room.lessons[1].id, start=time(6))
+    assert room.lessons_by_day == expected()
+    room.remove_lesson(room.lessons[0].id)
+    assert room.lessons_by_day == expected()
+    room.add_lessons(
+        [
+            create_lesson(days=[Day.MONDAY], start=time(h), end=time(h, 30))
+            for h in (15, 11)
+        ]
+    )
+    assert room.lessons_by_day == expected()
+
+
+def test_schedule__equality__compares_fields_and_ignores_indexes():
+    schedule = create_schedule()
+    copy = Schedule.model_validate(schedule.model_dump())
+    copy.rooms[0].lessons_by_day
+
+    assert copy == schedule
+    copy.rooms[0].remove_lesson(copy.rooms[0].lessons[0].id)
+    assert copy != schedule
+
+
+def test_schedule__is_dirty__tracks_changes_until_marked_saved():
+    schedule = Schedule.model_validate(create_schedule().model_dump())
+    room = schedule.rooms[0]
+    assert not schedule.is_dirty
+
+    room.remove_lesson("not a lesson id")
+    assert not schedule.is_dirty
+
+    lesson = room.lessons[0]
+    room.update_lesson(lesson.id, days=list(lesson.days), name=lesson.name)
+    assert not schedule.is_dirty
+
+    room.update_lesson(room.lessons[0].id, name="Renamed")
+    assert schedule.is_dirty
+    assert schedule.changes == [("update_lesson", room.id, room.lessons[0].id)]
+
+    schedule.mark_saved()
+    assert not schedule.is_dirty
+
+
+def test_schedule__removed_room__no_longer_marks_schedule_dirty():
+    schedule = create_schedule()
+    room = schedule.rooms[0]
+    schedule.remove_room(room.id)
+    schedule.mark_saved()
+
+    room.add_lesson(create_lesson(days=[Day.SUNDAY]))
+    assert not schedule.is_dirty
+
+
+def create_free_time_schedule() -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Busy",
+                lessons=[
+                    create_lesson([Day.MONDAY], time(9), time(10)),
+                    create_lesson([Day.MONDAY, Day.WEDNESDAY], time(10), time(11)),
+                    create_lesson([Day.MONDAY], time(13), time(14)),
+                ],
+            ),
+            RoomSchedule(name="Empty"),
+        ]
+    )
+
+
+def test_room_schedule__busy_intervals__merges_touching_lessons():
+    room = create_free_time_schedule().rooms[0]
+
+    assert room.busy_intervals(Day.MONDAY) == [
+        (9 * 3600, 11 * 3600),
+        (13 * 3600, 14 * 3600),
+    ]
+    assert room.busy_intervals(Day.TUESDAY) == []
+
+
+def test_room_schedule__busy_intervals__follow_lesson_changes():
+    room = create_free_time_schedule().rooms[0]
+    assert room.is_free([Day.TUESDAY], time(9), time(10))
+
+    lesson = create_lesson([Day.TUESDAY], time(9, 30), time(9, 45))
+    room.add_lesson(lesson)
+    assert not room.is_free([Day.TUESDAY], time(9), time(10))
+
+    room.update_lesson(lesson.id, start=time(12), end=time(12, 30))
+    assert room.is_free([Day.TUESDAY], time(9), time(10))
+    assert not room.is_free([Day.TUESDAY], time(12, 30), time(13))
+
+
+@pytest.mark.parametrize(
+    "days, start, end, expected",
+    [
+        ([Day.MONDAY], time(11, 30), time(12, 30), ["Busy", "Empty"]),
+        ([Day.MONDAY], time(11), time(12), ["Empty"]),
+        ([Day.MONDAY], time(8), time(15), ["Empty"]),
+        ([Day.TUESDAY, Day.WEDNESDAY], time(10, 30), time(10, 45), ["Empty"]),
+        ([Day.TUESDAY, Day.WEDNESDAY], time(11, 1), time(12), ["Busy", "Empty"]),
+    ],
+)
+def test_schedule__find_free_rooms__returns_rooms_without_overlaps(
+    days, start, end, expected
+):
+    schedule = create_free_time_schedule()
+
+    rooms = schedule.find_free_rooms(days, start, end)
+
+    assert [room.name for room in rooms] == expected
+
+
+def test_schedule__find_free_rooms__start_after_end__fails():
+    with pytest.raises(ValueError):
+        create_free_time_schedule().find_free_rooms([Day.MONDAY], time(12), time(11))
+
+
+def test_schedule__find_free_slots__returns_long_enough_gaps_in_window():
+    schedule = create_free_time_schedule()
+    room = schedule.rooms[0]
+
+    slots = schedule.find_free_slots(
+        room.id, timedelta(hours=2), [Day.WEDNESDAY, Day.MONDAY], time(8), time(18)
+    )
+
+    assert slots == [
+        FreeSlot(day=Day.MONDAY, start=time(11), end=time(13)),
+        FreeSlot(day=Day.MONDAY, start=time(14), end=time(18)),
+        FreeSlot(day=Day.WEDNESDAY, start=time(8), end=time(10)),
+        FreeSlot(day=Day.WEDNESDAY, start=time(11), end=time(18)),
+    ]
+
+
+def test_schedule__find_free_slots__defaults_to_every_whole_day():
+    schedule = create_free_time_schedule()
+
+    slots = schedule.find_free_slots(schedule.rooms[1].id, timedelta(minutes=30))
+
+    assert [slot.day for slot in slots] == list(Day)
+    assert slots[0].start == time.min
+    assert slots[0].end == time.max
+
+
+def test_schedule__find_free_slots__missing_room__fails():
+    with pytest.raises(ValueError):
+        create_free_time_schedule().find_free_slots("missing", timedelta(hours=1))
+
+
+def test_schedule__find_free_rooms__follows_room_and_lesson_changes():
+    schedule = create_free_time_schedule()
+    busy, empty = schedule.rooms
+    assert schedule.find_free_rooms([Day.FRIDAY], time(9), time(10)) == [busy, empty]
+
+    lesson = create_lesson([Day.FRIDAY], time(9), time(10))
+    empty.add_lesson(lesson)
+    assert schedule.find_free_rooms([Day.FRIDAY], time(9), time(10)) == [busy]
+
+    empty.update_lesson(lesson.id, days=[Day.SATURDAY])
+    new_room = RoomSchedule(name="New")
+    schedule.add_room(new_room)
+    schedule.remove_room(busy.id)
+    assert schedule.find_free_rooms([Day.FRIDAY], time(9), time(10)) == [
+        empty,
+        new_room,
+    ]
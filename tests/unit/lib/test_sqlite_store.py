@@ -0,0 +1,132 @@
+from datetime import time
+import os
+import sqlite3
+
+import pytest
+
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+from lib.storage import SqliteStore
+
+
+def create_schedule() -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Room 1",
+                lessons=[
+                    Lesson(
+                        days=[Day.WEDNESDAY, Day.MONDAY],
+                        start="09:00",
+                        end="10:00",
+                        name="A",
+                    ),
+                    Lesson(days=[Day.TUESDAY], start="09:00", end="10:00", name="B"),
+                ],
+            ),
+            RoomSchedule(name="Room 2"),
+        ]
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SqliteStore(str(tmp_path))
+
+
+def test_sqlite_store__create_and_load__round_trips_schedule(store):
+    schedule = create_schedule()
+    store.create("Schedule", schedule)
+
+    assert store.exists("Schedule")
+    assert store.names() == ["Schedule"]
+    assert store.load("Schedule") == schedule
+
+
+def test_sqlite_store__missing_schedule__does_not_exist_or_create_database(store):
+    assert not store.exists("Schedule")
+    assert store.names() == []
+    assert not os.path.exists(store.path)
+
+
+def test_sqlite_store__creating_existing_schedule__raises_value_error(store):
+    store.create("Schedule", create_schedule())
+    with pytest.raises(ValueError):
+        store.create("Schedule", create_schedule())
+
+
+def test_sqlite_store__save__writes_changes_made_since_load(store):
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    first, second = schedule.rooms
+
+    first.remove_lesson(first.lessons[0].id)
+    first.update_lesson(first.lessons[0].id, days=[Day.FRIDAY], end=time(11))
+    first.add_lesson(
+        Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="Moved In")
+    )
+    schedule.remove_room(second.id)
+    schedule.add_room(
+        RoomSchedule(
+            name="Room 3",
+            lessons=[Lesson(days=[Day.SUNDAY], start="12:00", end="13:00", name="C")],
+        )
+    )
+    added_then_removed = RoomSchedule(name="Room 4")
+    schedule.add_room(added_then_removed)
+    schedule.remove_room(added_then_removed.id)
+    store.save("Schedule", schedule)
+
+    assert schedule.changes == []
+    assert store.load("Schedule") == schedule
+
+
+def test_sqlite_store__save__only_touches_changed_rows(store):
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    room = schedule.rooms[0]
+    room.remove_lesson(room.lessons[1].id)
+
+    statements = []
+    connect = store._connect
+
+    def traced_connect():
+        connection = connect()
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    store._connect = traced_connect
+    store.save("Schedule", schedule)
+
+    writes = {
+        statement
+        for statement in statements
+        if statement.lstrip().startswith(("INSERT", "UPDATE", "DELETE"))
+    }
+    assert len(writes) == 1
+    assert writes.pop().startswith("DELETE FROM lessons")
+
+
+def test_sqlite_store__load_room__reads_room_by_name_or_id(store):
+    schedule = create_schedule()
+    store.create("Schedule", schedule)
+
+    assert store.load_room("Schedule", "Room 1") == schedule.rooms[0]
+    assert store.load_room("Schedule", schedule.rooms[1].id) == schedule.rooms[1]
+    assert store.load_room("Schedule", "Room 9") is None
+
+
+def test_sqlite_store__lesson_days__are_indexed_by_room_and_day(store):
+    schedule = create_schedule()
+    store.create("Schedule", schedule)
+
+    with sqlite3.connect(store.path) as connection:
+        rows = connection.execute(
+            "SELECT day, lesson_id FROM lesson_days WHERE room_id = ? ORDER BY day",
+            (schedule.rooms[0].id,),
+        ).fetchall()
+    lesson_a, lesson_b = schedule.rooms[0].lessons
+    assert rows == [
+        ("monday", lesson_a.id),
+        ("tuesday", lesson_b.id),
+        ("wednesday", lesson_a.id),
+    ]
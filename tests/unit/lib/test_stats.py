@@ -0,0 +1,164 @@
+import random
+from datetime import time
+
+import pytest
+
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+from lib.stats import DAYS, lesson_arrays, schedule_stats
+from tests.unit.lib.utils import create_lesson
+
+
+def naive_minutes(schedule: Schedule, start: int, end: int) -> list[list[set[int]]]:
+    """
+    The busy minutes of every room and day as sets, worked out one minute at
+    a time.
+    """
+    busy = []
+    for room in schedule.rooms:
+        days = [set() for _ in DAYS]
+        for lesson in room.lessons:
+            first = lesson.start.hour * 60 + lesson.start.minute
+            last = lesson.end.hour * 60 + lesson.end.minute
+            for day in lesson.days:
+                days[DAYS.index(day)].update(range(max(first, start), min(last, end)))
+        busy.append(days)
+    return busy
+
+
+def test_schedule_stats_merges_overlapping_lessons():
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Room",
+                lessons=[
+                    create_lesson(name="A", start=time(9, 0), end=time(10, 0)),
+                    create_lesson(
+                        name="B",
+                        start=time(9, 30),
+                        end=time(10, 30),
+                        days=[Day.MONDAY, Day.FRIDAY],
+                    ),
+                    create_lesson(name="C", start=time(11, 0), end=time(11, 15)),
+                    create_lesson(name="D", start=time(12, 0), end=time(13, 0)),
+                ],
+            ),
+            RoomSchedule(name="Empty"),
+        ]
+    )
+
+    stats = schedule_stats(schedule)
+
+    assert stats.busy_minutes[0].tolist() == [165, 0, 0, 0, 60, 0, 0]
+    assert stats.busy_minutes[1].tolist() == [0] * 7
+    # 10:30-11:00 and 11:15-12:00 on monday
+    assert stats.idle_gaps[0].tolist() == [2, 0, 0, 0, 0, 0, 0]
+    assert stats.idle_minutes[0, 0] == 75
+    assert stats.longest_idle[0, 0] == 45
+    assert stats.hourly[0, 0, 9] == 60
+    assert stats.hourly[0, 0, 10] == 30
+    # the first room is busy for all of 09:00 on monday, the second not at all
+    assert stats.heatmap[0, 9] == 0.5
+    peaks = stats.peak_hours()
+    assert peaks[Day.MONDAY] == 9
+    assert peaks[Day.FRIDAY] == 9
+    assert peaks[Day.SUNDAY] is None
+
+
+def test_schedule_stats_counts_only_the_window():
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Room",
+                lessons=[
+                    create_lesson(name="Early", start=time(7, 0), end=time(9, 0)),
+                    create_lesson(name="Late", start=time(17, 30), end=time(19, 0)),
+                ],
+            )
+        ]
+    )
+
+    stats = schedule_stats(schedule, time(8), time(18))
+
+    assert stats.window == (480, 1080)
+    assert stats.busy_minutes[0, 0] == 90
+    assert stats.utilization[0] == pytest.approx(90 / (600 * 7))
+    assert stats.idle_minutes[0, 0] == 510
+
+
+def test_schedule_stats_rounds_partly_used_minutes_up():
+    schedule = Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Room",
+                lessons=[
+                    Lesson(
+                        days=[Day.MONDAY],
+                        start=time(9, 0, 30),
+                        end=time(9, 1, 10),
+                        name="Short",
+                    ),
+                    Lesson(
+                        days=[Day.MONDAY], start=time(23), end=time.max, name="Late"
+                    ),
+                ],
+            )
+        ]
+    )
+
+    arrays = lesson_arrays(schedule)
+
+    assert arrays.start.tolist() == [540, 1380]
+    assert arrays.end.tolist() == [542, 1440]
+    assert schedule_stats(schedule).busy_minutes[0, 0] == 62
+
+
+def test_schedule_stats_empty_schedule():
+    stats = schedule_stats(Schedule(rooms=[]))
+
+    assert stats.busy_minutes.shape == (0, 7)
+    assert stats.to_dict()["rooms"] == []
+    assert set(stats.peak_hours().values()) == {None}
+
+
+def test_schedule_stats_rejects_window_ending_before_it_starts():
+    with pytest.raises(ValueError):
+        schedule_stats(Schedule(rooms=[]), time(18), time(8))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_schedule_stats_matches_minute_by_minute_count(seed):
+    rng = random.Random(seed)
+    rooms = []
+    for index in range(4):
+        lessons = []
+        for number in range(rng.randint(0, 12)):
+            start = rng.randint(6 * 60, 20 * 60)
+            end = start + rng.randint(1, 180)
+            lessons.append(
+                Lesson(
+                    days=rng.sample(DAYS, rng.randint(1, 3)),
+                    start=time(start // 60, start % 60),
+                    end=time(min(end // 60, 23), end % 60 if end < 1440 else 59),
+                    name=f"Lesson {number}",
+                )
+            )
+        rooms.append(RoomSchedule(name=f"Room {index}", lessons=lessons))
+    schedule = Schedule(rooms=rooms)
+    start, end = rng.choice([(0, 1440), (8 * 60, 18 * 60)])
+
+    stats = schedule_stats(
+        schedule, time(start // 60), time.max if end == 1440 else time(end // 60)
+    )
+
+    busy = naive_minutes(schedule, start, end)
+    for room_index, days in enumerate(busy):
+        for day_index, minutes in enumerate(days):
+            assert stats.busy_minutes[room_index, day_index] == len(minutes)
+            for hour in range(24):
+                in_hour = sum(1 for minute in minutes if minute // 60 == hour)
+                assert stats.hourly[room_index, day_index, hour] == in_hour
+            ordered = sorted(minutes)
+            gaps = [b - a - 1 for a, b in zip(ordered, ordered[1:]) if b - a > 1]
+            assert stats.idle_gaps[room_index, day_index] == len(gaps)
+            assert stats.idle_minutes[room_index, day_index] == sum(gaps)
+            assert stats.longest_idle[room_index, day_index] == max(gaps, default=0)
@@ -0,0 +1,95 @@
+import importlib
+import os
+
+import pytest
+import yaml
+
+from lib import storage
+from lib.storage import yaml_store
+from lib.schedule import Schedule
+from tests.unit.lib.utils import create_schedule
+
+
+def test_save_and_load_schedule__round_trips_schedule(tmp_path):
+    schedule = create_schedule()
+    path = storage.schedule_path(str(tmp_path), "Schedule")
+
+    storage.save_schedule(schedule, path)
+
+    assert path.endswith("Schedule.yaml")
+    assert storage.load_schedule(path) == schedule
+
+
+def test_saved_schedule__can_be_read_by_pure_python_yaml(tmp_path):
+    schedule = create_schedule()
+    path = storage.schedule_path(str(tmp_path), "Schedule")
+
+    storage.save_schedule(schedule, path)
+
+    with open(path, "r") as f:
+        assert yaml.safe_load(f) == schedule.model_dump(mode="json")
+
+
+def test_storage__without_libyaml__falls_back_to_pure_python(monkeypatch, tmp_path):
+    monkeypatch.delattr(yaml, "CSafeLoader")
+    monkeypatch.delattr(yaml, "CSafeDumper")
+    try:
+        fallback = importlib.reload(yaml_store)
+        assert fallback.SafeLoader is yaml.SafeLoader
+        assert fallback.SafeDumper is yaml.SafeDumper
+
+        schedule = create_schedule()
+        path = fallback.schedule_path(str(tmp_path), "Schedule")
+        fallback.save_schedule(schedule, path)
+        assert fallback.load_schedule(path) == schedule
+    finally:
+        monkeypatch.undo()
+        importlib.reload(yaml_store)
+
+
+def test_yaml_store__lists_created_schedules(tmp_path):
+    store = storage.YamlStore(str(tmp_path))
+    store.create("B", create_schedule())
+    store.create("A", Schedule(rooms=[]))
+    (tmp_path / "notes.txt").write_text("")
+
+    assert store.names() == ["A", "B"]
+    assert store.exists("A")
+    assert not store.exists("C")
+
+
+def test_save_schedule__replaces_file_without_leaving_temporary_files(tmp_path):
+    path = storage.schedule_path(str(tmp_path), "Schedule")
+    schedule = create_schedule()
+    storage.save_schedule(Schedule(rooms=[]), path)
+    storage.save_schedule(schedule, path)
+
+    assert os.listdir(tmp_path) == ["Schedule.yaml"]
+    assert storage.load_schedule(path) == schedule
+
+
+def test_save_schedule__when_writing_fails__keeps_old_file(monkeypatch, tmp_path):
+    path = storage.schedule_path(str(tmp_path), "Schedule")
+    schedule = create_schedule()
+    storage.save_schedule(schedule, path)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(yaml_store, "write_schedule_dict", fail)
+    with pytest.raises(RuntimeError):
+        storage.save_schedule(Schedule(rooms=[]), path)
+
+    assert os.listdir(tmp_path) == ["Schedule.yaml"]
+    assert storage.load_schedule(path) == schedule
+
+
+def test_yaml_store__save__skips_schedules_without_changes(tmp_path):
+    store = storage.YamlStore(str(tmp_path))
+    store.create("Schedule", create_schedule())
+    schedule = store.load("Schedule")
+    os.remove(store.path("Schedule"))
+
+    store.save("Schedule", schedule)
+
+    assert not store.exists("Schedule")
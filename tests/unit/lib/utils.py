@@ -0,0 +1,33 @@
+from datetime import time
+
+from lib.schedule import Day, Lesson, RoomSchedule, Schedule
+
+
+def create_schedule() -> Schedule:
+    return Schedule(
+        rooms=[
+            RoomSchedule(
+                name="Room 1",
+                lessons=[
+                    Lesson(days=[Day.MONDAY], start="09:00", end="10:00", name="A"),
+                ],
+            )
+        ]
+    )
+
+
+def create_lesson(
+    days: list[Day] = None,
+    start: time = None,
+    end: time = None,
+    name: str = "Example Lesson",
+) -> Lesson:
+    return Lesson(
+        days=days
+        or [
+            Day.MONDAY,
+        ],
+        start=start or time(hour=9, minute=0),
+        end=end or time(hour=10, minute=0),
+        name=name,
+    )